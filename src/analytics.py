@@ -0,0 +1,550 @@
+"""
+Board Analytics
+
+Solves for the exact long run landing probabilities of the board with a
+Markov chain instead of simulating millions of turns. The chain follows the
+movement rules of Monopoly.take_turn:
+    two dice, doubles roll again and the 3rd doubles in a row goes to jail
+    in jail (jail counter 1 - 3) doubles leave jail and move (without rolling
+        again), anything else stays in jail, and after the 3rd failed roll
+        (jail counter 4) the player pays and takes a normal turn
+    landing on a chance/community chest tile draws a card, and landing on an
+        event tile applies its effect, either of which can move the player
+        (eg. advance to go, go to jail)
+
+The card decks are treated as drawn uniformly at random, the usual Markov
+chain approximation of a shuffled deck (it has the same long run frequencies)
+
+The landing probabilities are combined with the rents the engine charges into
+expected rent and payback tables for every buyable tile, which are cached on
+disk per rule set
+"""
+from typing import Callable, Dict, List, Optional, Tuple
+import argparse
+import functools
+import hashlib
+import os
+import time
+
+import numpy as np
+
+import monopoly
+
+
+"""
+The chain's states: a player about to roll on a square having rolled 0, 1 or
+2 doubles so far this turn (index pos * DOUBLES_STATES + doubles), followed by
+the 3 in jail states (about to roll with a jail counter of 1, 2 or 3)
+"""
+DOUBLES_STATES = 3
+JAIL_STATES = 3
+FREE_STATES = monopoly.BOARD_SIZE * DOUBLES_STATES
+NUM_STATES = FREE_STATES + JAIL_STATES
+
+"""
+The probability of each (die 1, die 2) roll
+"""
+DICE: List[Tuple[int, int, float]] = [
+    (d1, d2, 1 / 36) for d1 in range(1, 7) for d2 in range(1, 7)]
+
+"""
+OutcomeType: Where a player ends up after landing on a square:
+    (probability, final position, sent to jail)
+RulesType: The movement rules of a board, hashable so that solutions can be
+    cached: (the landing outcomes of each square, jail position, whether
+    players pay to leave jail as soon as they are sent there)
+"""
+OutcomeType = Tuple[float, int, bool]
+RulesType = Tuple[Tuple[Tuple[OutcomeType, ...], ...], int, bool]
+
+"""
+The development levels of the rent tables, per tile type:
+    Property: 0 owned alone, 1 owned as a monopoly, 2 - 6 with 1 - 5 houses
+        (5 houses being a hotel)
+    Railroad: 0 - 3 with 1 - 4 railroads owned
+    Utility: 0 with one utility owned, 1 with both
+Levels a tile type does not have are NaN in the tables
+"""
+NUM_LEVELS = 7
+NUM_BUYABLE = len(monopoly.PROPDICT)
+
+"""
+RentRulesType: The rent of every buyable tile at every level (utilities per
+    pip of the dice roll) and its position, hashable so that tables can be
+    cached: ((position, (rent per level, ...)), ...) in propnum order
+"""
+RentRulesType = Tuple[Tuple[int, Tuple[float, ...]], ...]
+
+"""
+The default directory rent tables are cached in
+"""
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "monopoly")
+
+
+def free_state(pos: int, doubles: int) -> int:
+    """
+    Returns the index of the state of a player about to roll on pos having
+    rolled doubles doubles this turn
+    """
+    return pos * DOUBLES_STATES + doubles
+
+def jail_state(jail: int) -> int:
+    """
+    Returns the index of the state of a player about to roll in jail with the
+    given jail counter (1 - 3)
+    """
+    return FREE_STATES + jail - 1
+
+
+# Board Rules
+
+
+def landing_outcome(game: monopoly.Monopoly, pos: int,
+    effect: Callable[[monopoly.Monopoly], None]) -> Tuple[int, bool]:
+    """
+    Finds where a tile/card effect moves a player standing on pos by applying
+    it to a scratch game
+
+    Inputs:
+        game: Monopoly: The scratch game (its state is overwritten)
+        pos: int: The position the player is on
+        effect: The tile or card effect
+    Outputs:
+        Tuple[int, bool]: The final position and whether the player was sent
+            to jail
+    """
+    player = game.player_turn
+    player.jail = 0
+    game.ploc[game.turn] = pos
+    effect(game)
+    return game.ploc[game.turn], player.jail != 0
+
+def board_rules(board: Optional[List[monopoly.GameTileType]] = None,
+    chance_deck: Optional[Dict[int, monopoly.ChanceCard]] = None,
+    community_chest_deck: Optional[Dict[int, monopoly.CommunityChestCard]] = None,
+    leave_jail_early: bool = False) -> RulesType:
+    """
+    Works out the movement rules implied by a board and its decks, by
+    applying every event tile and card to a scratch game
+
+    Inputs:
+        board: Optional[List[GameTileType]]: The board (defaults to STARTBOARD)
+        chance_deck, community_chest_deck: The decks (default to CHANCE_DECK
+            and COMMUNITY_CHEST_DECK)
+        leave_jail_early: bool: Whether players pay to leave jail right away
+            instead of trying to roll doubles
+    Outputs:
+        RulesType: The rules (the key solve caches on)
+    """
+    board = monopoly.STARTBOARD if board is None else board
+    chance_deck = monopoly.CHANCE_DECK if chance_deck is None else chance_deck
+    community_chest_deck = (monopoly.COMMUNITY_CHEST_DECK
+        if community_chest_deck is None else community_chest_deck)
+
+    game = monopoly.Monopoly(2, seed = 0)
+    squares = []
+    for pos, tile in enumerate(board):
+        if isinstance(tile, (monopoly.ChanceTile, monopoly.CommunityChestTile)):
+            deck = chance_deck if isinstance(tile, monopoly.ChanceTile) else community_chest_deck
+            counts: Dict[Tuple[int, bool], int] = {}
+            for card in deck.values():
+                outcome = landing_outcome(game, pos, card.effect)
+                counts[outcome] = counts.get(outcome, 0) + 1
+            squares.append(tuple(sorted(
+                (count / len(deck), dest, jailed)
+                for (dest, jailed), count in counts.items())))
+        elif isinstance(tile, monopoly.EventTile):
+            dest, jailed = landing_outcome(game, pos, tile.effect)
+            squares.append(((1.0, dest, jailed),))
+        else:
+            squares.append(((1.0, pos, False),))
+
+    return tuple(squares), monopoly.JAIL_POS, leave_jail_early
+
+
+# Solving
+
+
+class LandingDistribution():
+    """
+    The stationary distribution of the movement chain, and the landing
+    probabilities derived from it
+    """
+
+    def __init__(self, rules: RulesType, stationary: np.ndarray,
+        landings: np.ndarray, dice_landings: np.ndarray, turn_starts: float):
+        """
+        Parameters:
+            rules: RulesType: The rules that were solved
+            stationary: np.ndarray: The long run probability of each state
+                at the moment of a roll (NUM_STATES)
+            landings: np.ndarray: The probability that a roll's move ends
+                on each square (before any card or tile moves the player)
+            dice_landings: np.ndarray: The expected dice total of a roll
+                counted only when it lands on each square (the landing
+                probability times the average roll that lands there, used
+                for rents that depend on the roll)
+            turn_starts: float: The probability that a roll is the first of
+                a turn
+        """
+        self.rules = rules
+        self.stationary = stationary
+        self.landings = landings
+        self.dice_landings = dice_landings
+        self.turn_starts = turn_starts
+
+    @property
+    def rolls_per_turn(self) -> float:
+        """
+        The average number of rolls in a turn
+        """
+        return 1 / self.turn_starts
+
+    @property
+    def landings_per_turn(self) -> np.ndarray:
+        """
+        The expected number of times each square is landed on per turn
+        """
+        return self.landings * self.rolls_per_turn
+
+    @property
+    def dice_landings_per_turn(self) -> np.ndarray:
+        """
+        The per turn version of dice_landings
+        """
+        return self.dice_landings * self.rolls_per_turn
+
+    @property
+    def occupancy(self) -> np.ndarray:
+        """
+        The probability of a player being on each square when they roll (the
+        jail square counts both visiting and being in jail)
+        """
+        occupancy = self.stationary[:FREE_STATES].reshape(
+            monopoly.BOARD_SIZE, DOUBLES_STATES).sum(axis = 1)
+        occupancy[self.rules[1]] += self.in_jail
+        return occupancy
+
+    @property
+    def in_jail(self) -> float:
+        """
+        The probability of a player rolling from inside jail
+        """
+        return float(self.stationary[FREE_STATES:].sum())
+
+
+@functools.lru_cache(maxsize = None)
+def solve(rules: RulesType) -> LandingDistribution:
+    """
+    Builds the transition matrix of the movement chain for the given rules
+    and solves for its stationary distribution, results are cached per rule
+    set
+
+    Inputs:
+        rules: RulesType: The rules from board_rules
+    Outputs:
+        LandingDistribution: The solved distribution (shared between callers,
+            treat it as read only)
+    """
+    squares, jail_pos, leave_jail_early = rules
+    size = len(squares)
+
+    transitions = np.zeros((NUM_STATES, NUM_STATES))
+    landings = np.zeros((NUM_STATES, size))
+    dice_landings = np.zeros((NUM_STATES, size))
+
+    def land(state: int, pos: int, roll: int, prob: float, again: Optional[int]) -> None:
+        """
+        Adds the transitions of a roll from state ending on pos with the given
+        probability, again is the doubles count to roll again with (None ends
+        the turn)
+        """
+        landings[state, pos] += prob
+        dice_landings[state, pos] += prob * roll
+        for chance, dest, jailed in squares[pos]:
+            if jailed:
+                transitions[state, jail_state(1)] += prob * chance
+            else:
+                transitions[state, free_state(dest, 0 if again is None else again)] += prob * chance
+
+    for pos in range(size):
+        for doubles in range(DOUBLES_STATES):
+            state = free_state(pos, doubles)
+            for d1, d2, prob in DICE:
+                if d1 == d2 and doubles == DOUBLES_STATES - 1:
+                    transitions[state, jail_state(1)] += prob
+                else:
+                    land(state, (pos + d1 + d2) % size, d1 + d2, prob,
+                        doubles + 1 if d1 == d2 else None)
+
+    for jail in range(1, JAIL_STATES + 1):
+        state = jail_state(jail)
+        if leave_jail_early:
+            transitions[state] = transitions[free_state(jail_pos, 0)]
+            landings[state] = landings[free_state(jail_pos, 0)]
+            dice_landings[state] = dice_landings[free_state(jail_pos, 0)]
+            continue
+        for d1, d2, prob in DICE:
+            if d1 == d2:
+                land(state, (jail_pos + d1 + d2) % size, d1 + d2, prob, None)
+            elif jail < JAIL_STATES:
+                transitions[state, jail_state(jail + 1)] += prob
+            else:
+                # The jail counter hits 4, next turn they pay and roll normally
+                transitions[state, free_state(jail_pos, 0)] += prob
+
+    # Solve stationary @ (transitions - I) = 0 with the probabilities summing to 1
+    system = transitions.T - np.eye(NUM_STATES)
+    system[-1] = 1
+    target = np.zeros(NUM_STATES)
+    target[-1] = 1
+    stationary = np.linalg.solve(system, target)
+    # Unreachable states can come out as tiny negative rounding errors
+    stationary = np.clip(stationary, 0, None)
+    stationary /= stationary.sum()
+
+    turn_starts = (stationary[FREE_STATES:].sum()
+        + stationary[:FREE_STATES:DOUBLES_STATES].sum())
+    return LandingDistribution(rules, stationary, stationary @ landings,
+        stationary @ dice_landings, float(turn_starts))
+
+def landing_distribution(leave_jail_early: bool = False) -> LandingDistribution:
+    """
+    Returns the solved landing distribution of STARTBOARD and its decks
+    """
+    return solve(board_rules(leave_jail_early = leave_jail_early))
+
+
+# Rent Tables
+
+
+def tile_levels(tile: monopoly.BuyableTileType) -> int:
+    """
+    Returns the number of development levels the inputted tile type has
+    """
+    if isinstance(tile, monopoly.Property):
+        return len(tile.rents) + 1
+    elif isinstance(tile, monopoly.Railroad):
+        return len(tile.rents) - 1
+    else:
+        return 2
+
+def tile_level(tile: monopoly.BuyableTileType) -> int:
+    """
+    Returns the current development level of an owned tile (see NUM_LEVELS)
+    """
+    if isinstance(tile, monopoly.Property):
+        return tile.houses + 1 if tile.monop else 0
+    elif isinstance(tile, monopoly.Railroad):
+        return tile.num_owned - 1
+    else:
+        return 1 if tile.both else 0
+
+def level_rent(propnum: int, level: int) -> float:
+    """
+    Finds the rent the engine charges for a tile at a development level by
+    setting it up in a scratch game (utilities give the rent per pip)
+
+    Inputs:
+        propnum: int: The property number of the tile
+        level: int: The development level (see NUM_LEVELS)
+    Outputs:
+        float: The rent
+    """
+    game = monopoly.Monopoly(2, seed = 0)
+    owner = game.pdict[1]
+    tile = game.prop_dict[propnum]
+
+    if isinstance(tile, monopoly.Property):
+        others = (monopoly.COLOR_GROUPS[tile.colornum] if level > 0
+            else (propnum,))
+        for othernum in others:
+            game.transfer_property(game.prop_dict[othernum], owner)
+        tile.houses = max(level - 1, 0)
+        return tile.rent()
+
+    # Railroads and utilities own the first (level + 1) tiles of their group
+    group = [other for other in game.prop_dict.values()
+        if other.group == tile.group and other is not tile]
+    game.transfer_property(tile, owner)
+    for other in group[:level]:
+        game.transfer_property(other, owner)
+    if isinstance(tile, monopoly.Utility):
+        return tile.rent(1)
+    return tile.rent()
+
+def rent_rules() -> RentRulesType:
+    """
+    Works out the rent of every buyable tile at every development level from
+    the engine (the rent half of the key rent_tables caches on)
+    """
+    rules = []
+    for propnum, tile in sorted(monopoly.PROPDICT.items()):
+        assert isinstance(tile, (monopoly.Property, monopoly.Railroad, monopoly.Utility))
+        rules.append((tile.pos, tuple(
+            float(level_rent(propnum, level))
+            for level in range(tile_levels(tile)))))
+    return tuple(rules)
+
+
+class RentTables():
+    """
+    The expected rent and payback time of every buyable tile at every
+    development level, arrays are indexed by [propnum - 1, level]
+    """
+
+    def __init__(self, rent: np.ndarray, expected_rent: np.ndarray,
+        cost: np.ndarray):
+        """
+        Parameters:
+            rent: np.ndarray: The rent charged per landing (per pip of the
+                dice roll for utilities)
+            expected_rent: np.ndarray: The expected rent collected from one
+                opponent per turn they take
+            cost: np.ndarray: The total paid for the tile at the level (its
+                price plus any houses on it)
+
+        Non-Parameter Attributes:
+            self.payback: np.ndarray: The number of opponent turns it takes
+                for the expected rent to repay the cost (inf if the tile
+                charges no rent)
+        """
+        self.rent = rent
+        self.expected_rent = expected_rent
+        self.cost = cost
+        with np.errstate(divide = "ignore", invalid = "ignore"):
+            self.payback = np.where(expected_rent > 0,
+                cost / expected_rent, np.inf)
+        self.payback[np.isnan(cost)] = np.nan
+
+    def tile_rent(self, tile: monopoly.BuyableTileType, opponents: int = 1) -> float:
+        """
+        Returns the expected rent per round of turns an owned tile earns at
+        its current development level from the given number of opponents
+        (0 if it is mortgaged)
+        """
+        if tile.mortgaged:
+            return 0.0
+        return float(self.expected_rent[tile.propnum - 1, tile_level(tile)]) * opponents
+
+
+def build_rent_tables(dist: LandingDistribution,
+    rents: RentRulesType) -> RentTables:
+    """
+    Combines a landing distribution with the rents of every tile into rent
+    tables
+    """
+    rent = np.full((NUM_BUYABLE, NUM_LEVELS), np.nan)
+    cost = np.full((NUM_BUYABLE, NUM_LEVELS), np.nan)
+    expected_rent = np.full((NUM_BUYABLE, NUM_LEVELS), np.nan)
+    landings = dist.landings_per_turn
+    dice_landings = dist.dice_landings_per_turn
+
+    for index, (pos, levels) in enumerate(rents):
+        tile = monopoly.PROPDICT[index + 1]
+        assert isinstance(tile, (monopoly.Property, monopoly.Railroad, monopoly.Utility))
+        rent[index, :len(levels)] = levels
+        # Utility rent is paid per pip of the roll that landed on it
+        hits = (dice_landings[pos] if isinstance(tile, monopoly.Utility)
+            else landings[pos])
+        expected_rent[index, :len(levels)] = hits * np.array(levels)
+        cost[index, :len(levels)] = tile.price
+        if isinstance(tile, monopoly.Property):
+            cost[index, 2:len(levels)] += tile.house_price * np.arange(1, len(levels) - 1)
+
+    return RentTables(rent, expected_rent, cost)
+
+def _load_rent_tables(rules: RulesType, rents: RentRulesType,
+    cache_dir: Optional[str]) -> RentTables:
+    """
+    Loads the rent tables of a rule set from the disk cache, building and
+    saving them if they are missing
+    """
+    if cache_dir is None:
+        return build_rent_tables(solve(rules), rents)
+
+    key = hashlib.sha256(repr((rules, rents)).encode()).hexdigest()[:16]
+    path = os.path.join(cache_dir, f"rent_tables_{key}.npz")
+    try:
+        with np.load(path) as data:
+            return RentTables(data["rent"], data["expected_rent"], data["cost"])
+    except (OSError, KeyError, ValueError):
+        pass
+
+    tables = build_rent_tables(solve(rules), rents)
+    try:
+        os.makedirs(cache_dir, exist_ok = True)
+        # Write then rename so a concurrent reader never sees half a file
+        temp = f"{path}.{os.getpid()}.tmp"
+        with open(temp, "wb") as file:
+            np.savez(file, rent = tables.rent,
+                expected_rent = tables.expected_rent, cost = tables.cost)
+        os.replace(temp, path)
+    except OSError:
+        pass
+    return tables
+
+@functools.lru_cache(maxsize = None)
+def rent_tables(leave_jail_early: bool = False,
+    cache_dir: Optional[str] = CACHE_DIR) -> RentTables:
+    """
+    Returns the rent tables of STARTBOARD, cached in memory and in cache_dir
+    keyed by the movement and rent rules (so changing either rebuilds them)
+
+    Inputs:
+        leave_jail_early: bool: Whether opponents pay to leave jail right away
+        cache_dir: Optional[str]: The directory to cache the tables in, None
+            disables the disk cache
+    Outputs:
+        RentTables: The tables (shared between callers, treat them as read
+            only)
+    """
+    return _load_rent_tables(board_rules(leave_jail_early = leave_jail_early),
+        rent_rules(), cache_dir)
+
+
+def main() -> None:
+    """
+    Solves the board and prints the landing probability of every square, or
+    the rent tables
+    """
+    parser = argparse.ArgumentParser(description = "Monopoly landing probabilities")
+    parser.add_argument("-e", "--leave-jail-early", action = "store_true")
+    parser.add_argument("-r", "--rents", action = "store_true",
+        help = "print the expected rent and payback tables")
+    args = parser.parse_args()
+
+    if args.rents:
+        print_rent_tables(rent_tables(args.leave_jail_early))
+        return
+
+    start = time.perf_counter()
+    dist = landing_distribution(args.leave_jail_early)
+    seconds = time.perf_counter() - start
+
+    print(f"Solved in {1000 * seconds:.1f}ms, {dist.rolls_per_turn:.3f} rolls per "
+        f"turn, {100 * dist.in_jail:.2f}% of rolls from jail")
+    print(f"{'Square':<24}{'Per roll':>10}{'Per turn':>10}")
+    per_turn = dist.landings_per_turn
+    for pos in np.argsort(-dist.landings):
+        print(f"{monopoly.STARTBOARD[pos].name:<24}{100 * dist.landings[pos]:9.3f}%"
+            f"{per_turn[pos]:10.4f}")
+
+def print_rent_tables(tables: RentTables) -> None:
+    """
+    Prints the expected rent per opponent turn and payback time (in opponent
+    turns) of every tile at every level
+    """
+    print("Expected rent per opponent turn / payback in opponent turns")
+    print(f"{'Tile':<24}" + "".join(f"{level:>14}" for level in range(NUM_LEVELS)))
+    for index, tile in sorted(monopoly.PROPDICT.items()):
+        cells = []
+        for level in range(NUM_LEVELS):
+            rent = tables.expected_rent[index - 1, level]
+            payback = tables.payback[index - 1, level]
+            cells.append("" if np.isnan(rent) else f"{rent:6.2f}/{payback:<7.0f}")
+        print(f"{tile.name:<24}" + "".join(f"{cell:>14}" for cell in cells))
+
+
+if __name__ == "__main__":
+    main()
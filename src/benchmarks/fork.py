@@ -0,0 +1,50 @@
+"""
+Game Forking Benchmark
+
+Measures how many copies of a mid-game position can be made per second,
+comparing copy.deepcopy with Monopoly.fork and a snapshot round trip
+
+Run from the src directory with: python -m benchmarks.fork
+"""
+from typing import Callable
+import argparse
+import copy
+import time
+
+import monopoly
+import simulate
+
+
+def rate(make: Callable[[], object], num: int) -> float:
+    """
+    Returns the number of calls of make per second over num calls
+    """
+    start = time.perf_counter()
+    for _ in range(num):
+        make()
+    return num / (time.perf_counter() - start)
+
+def main() -> None:
+    """
+    Runs the benchmark and prints copies made per second
+    """
+    parser = argparse.ArgumentParser(description = "Game forking benchmark")
+    parser.add_argument("-n", "--forks", type = int, default = 20000)
+    parser.add_argument("-p", "--players", type = int, default = 4)
+    parser.add_argument("-t", "--turns", type = int, default = 100)
+    parser.add_argument("-s", "--seed", type = int, default = 0)
+    args = parser.parse_args()
+
+    game = monopoly.Monopoly(args.players, seed = args.seed)
+    simulate.Runner(max_turns = args.turns).play(game)
+    num = args.forks
+
+    print(f"copy.deepcopy(game):          {rate(lambda: copy.deepcopy(game), num // 10):10.0f} forks/s")
+    print(f"game.fork():                  {rate(game.fork, num):10.0f} forks/s")
+    print(f"game.fork(seed):              {rate(lambda: game.fork(0), num):10.0f} forks/s")
+    print(f"from_bytes(game.to_bytes()):  "
+        f"{rate(lambda: monopoly.Monopoly.from_bytes(game.to_bytes()), num):10.0f} forks/s")
+
+
+if __name__ == "__main__":
+    main()
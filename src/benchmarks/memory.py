@@ -0,0 +1,63 @@
+"""
+Game Memory Benchmark
+
+Measures the number of bytes each live Monopoly object holds, both for new
+games and for games that have been played for a while (so the players own
+tiles and houses)
+
+Run from the src directory with: python -m benchmarks.memory
+"""
+from typing import Callable, List
+import argparse
+import gc
+import tracemalloc
+
+import monopoly
+import simulate
+
+
+def bytes_per_game(make: Callable[[int], monopoly.Monopoly], num: int) -> float:
+    """
+    Returns the average number of bytes held by each of num games created by
+    make (called with the game's index, used as its seed)
+    """
+    make(0) # Warm up any lazily created module level state
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    games: List[monopoly.Monopoly] = [make(i) for i in range(num)]
+    gc.collect()
+
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del games
+    return (after - before) / num
+
+def main() -> None:
+    """
+    Runs the benchmark and prints bytes per live game
+    """
+    parser = argparse.ArgumentParser(description = "Game memory benchmark")
+    parser.add_argument("-n", "--games", type = int, default = 2000)
+    parser.add_argument("-p", "--players", type = int, default = 4)
+    parser.add_argument("-t", "--turns", type = int, default = 100)
+    args = parser.parse_args()
+
+    runner = simulate.Runner(max_turns = args.turns)
+
+    def new_game(seed: int) -> monopoly.Monopoly:
+        return monopoly.Monopoly(args.players, seed = seed)
+
+    def played_game(seed: int) -> monopoly.Monopoly:
+        game = new_game(seed)
+        runner.play(game)
+        return game
+
+    print(f"New game:                  {bytes_per_game(new_game, args.games):10.0f} bytes")
+    print(f"After {args.turns:4d} turns:          "
+        f"{bytes_per_game(played_game, args.games):10.0f} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Game Construction Benchmark
+
+Measures how many games can be created per second, comparing the old
+deepcopy of STARTBOARD with fresh Monopoly objects and recycled ones
+
+Run from the src directory with: python -m benchmarks.startup
+"""
+from typing import Callable
+import argparse
+import copy
+import time
+
+import monopoly
+
+
+def rate(make: Callable[[], object], num: int) -> float:
+    """
+    Returns the number of calls of make per second over num calls
+    """
+    start = time.perf_counter()
+    for _ in range(num):
+        make()
+    return num / (time.perf_counter() - start)
+
+def deepcopy_board() -> None:
+    """
+    The board setup Monopoly.__init__ used to do: a deepcopy of STARTBOARD
+    followed by an isinstance scan to build the property dictionary
+    """
+    board = copy.deepcopy(monopoly.STARTBOARD)
+    prop_dict = {}
+    for tile in board:
+        if isinstance(tile, (monopoly.Property, monopoly.Railroad, monopoly.Utility)):
+            prop_dict[tile.propnum] = tile
+
+def main() -> None:
+    """
+    Runs the benchmark and prints games created per second
+    """
+    parser = argparse.ArgumentParser(description = "Game construction benchmark")
+    parser.add_argument("-n", "--games", type = int, default = 20000)
+    parser.add_argument("-p", "--players", type = int, default = 4)
+    args = parser.parse_args()
+
+    num, players = args.games, args.players
+    print(f"deepcopy(STARTBOARD) board setup: {rate(deepcopy_board, num):10.0f} /s")
+    print(f"Monopoly():                       "
+        f"{rate(lambda: monopoly.Monopoly(players, seed = 0), num):10.0f} games/s")
+
+    game = monopoly.Monopoly(players, seed = 0)
+    print(f"Monopoly.reset():                 "
+        f"{rate(lambda: game.reset(seed = 0), num):10.0f} games/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,465 @@
+"""
+Engine Hot Path Benchmark Suite
+
+Times the Monopoly methods the simulations spend their time in, each on the
+same seeded mid-game positions every run, and appends the results to a JSON
+lines history file so every run is compared against the last one with the
+same settings. With --check the exit status is 1 when a benchmark got slower
+than the threshold, for catching regressions before a change is deployed
+
+Mutating benchmarks run on forks of the positions made before the timer
+starts, so only the method itself is timed (plus the loop calling it, which is
+the same for every run)
+
+Run from the src directory with: python -m benchmarks.suite
+"""
+from typing import Callable, Dict, List, Optional, Tuple
+import argparse
+import datetime
+import fnmatch
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+import monopoly
+import simulate
+
+
+"""
+The default history file, next to this module
+"""
+HISTORY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "history.jsonl")
+
+"""
+The turns the mid-game positions are played to, with the default callbacks
+"""
+POSITION_TURNS = (50, 150, 300)
+
+"""
+BenchmarkType: Runs a benchmark once over the positions, making batch calls:
+    (positions, batch) -> (number of operations, seconds)
+"""
+BenchmarkType = Callable[[List[monopoly.Monopoly], int], Tuple[int, float]]
+
+"""
+The order actions are picked in when moving a position on to the end of its
+turn (see end_phase)
+"""
+END_PHASE_PREFERENCE = (monopoly.ACTION_BUY, monopoly.ACTION_ROLL,
+    monopoly.ACTION_WITHDRAW, monopoly.ACTION_START_AUCTION,
+    monopoly.ACTION_SELL, monopoly.ACTION_MORTGAGE)
+
+
+# Positions
+
+
+def mid_game_positions(num_seeds: int, players: int, seed: int) -> List[monopoly.Monopoly]:
+    """
+    Returns num_seeds games per POSITION_TURNS entry, each played with the
+    default callbacks to that many turns from its own seed
+
+    Inputs:
+        num_seeds: int: The number of game seeds
+        players: int: The number of players in each game
+        seed: int: The seed the game seeds are drawn from
+    """
+    seeds = random.Random(seed)
+    game_seeds = [seeds.getrandbits(64) for _ in range(num_seeds)]
+    positions = []
+    for turns in POSITION_TURNS:
+        runner = simulate.Runner(max_turns = turns)
+        for game_seed in game_seeds:
+            game = monopoly.Monopoly(players, seed = game_seed)
+            runner.play(game)
+            if not game.done:
+                positions.append(game)
+    return positions
+
+def end_phase(game: monopoly.Monopoly) -> bool:
+    """
+    Plays the current player's turn up to the point where they can end it,
+    picking the legal actions in END_PHASE_PREFERENCE order
+
+    Outputs:
+        bool: False if that is not possible (the player went bankrupt or the
+            game ended)
+    """
+    while not game.can_end_turn():
+        if game.done:
+            return False
+        legal = game.legal_actions()
+        kinds = {monopoly.action_kind(code)[0]: code for code in legal}
+        for kind in END_PHASE_PREFERENCE:
+            if kind in kinds:
+                game.apply_action(kinds[kind])
+                break
+        else:
+            return False
+    return True
+
+def prepared(positions: List[monopoly.Monopoly], batch: int,
+    prepare: Callable[[monopoly.Monopoly], Optional[tuple]]) -> List[tuple]:
+    """
+    Returns batch argument tuples made by prepare from forks of the
+    positions (cycling through them), skipping the positions prepare rejects
+    by returning None
+    """
+    usable = [position for position in positions
+        if prepare(position.fork()) is not None]
+    assert usable, "None of the positions suit the benchmark"
+    return [prepare(usable[index % len(usable)].fork()) # type: ignore
+        for index in range(batch)]
+
+def cycled(args: List[tuple], batch: int) -> List[tuple]:
+    """
+    Returns batch argument tuples cycling through args
+    """
+    assert args, "None of the positions suit the benchmark"
+    return [args[index % len(args)] for index in range(batch)]
+
+def time_calls(func: Callable, args: List[tuple]) -> Tuple[int, float]:
+    """
+    Calls func with every argument tuple
+
+    Outputs:
+        Tuple[int, float]: The number of calls and the seconds they took
+    """
+    start = time.perf_counter()
+    for arg in args:
+        func(*arg)
+    return len(args), time.perf_counter() - start
+
+
+# Benchmarks
+
+
+def bench_init(positions: List[monopoly.Monopoly], batch: int) -> Tuple[int, float]:
+    """
+    Creates new games
+    """
+    players = positions[0].num_players
+    return time_calls(monopoly.Monopoly, [(players, 1500, index) for index in range(batch)])
+
+def bench_take_turn(positions: List[monopoly.Monopoly], batch: int) -> Tuple[int, float]:
+    """
+    Rolls for players at the start of their turn
+    """
+    def prepare(game: monopoly.Monopoly) -> Optional[tuple]:
+        return (game,) if monopoly.ACTION_ROLL * monopoly.ACTION_ARGS in game.legal_actions() else None
+    return time_calls(monopoly.Monopoly.take_turn, prepared(positions, batch, prepare))
+
+def bench_end_turn(positions: List[monopoly.Monopoly], batch: int) -> Tuple[int, float]:
+    """
+    Ends turns, after playing them up to the end (see end_phase)
+    """
+    def prepare(game: monopoly.Monopoly) -> Optional[tuple]:
+        return (game,) if end_phase(game) else None
+    return time_calls(monopoly.Monopoly.end_turn, prepared(positions, batch, prepare))
+
+def bench_current_tile(positions: List[monopoly.Monopoly], batch: int) -> Tuple[int, float]:
+    """
+    Looks up the tile the current player is on
+    """
+    return time_calls(monopoly.Monopoly.current_tile,
+        cycled([(game,) for game in positions], batch))
+
+def give_monopoly(game: monopoly.Monopoly) -> Optional[tuple]:
+    """
+    Completes the first color group the current player owns part of, handing
+    them the rest of the group (if none of it is developed or mortgaged) and
+    topping their money up to $2000, since monopolies rarely form without
+    trading
+
+    Outputs:
+        Optional[tuple]: (game, the group's first tile that can be built on)
+    """
+    player = game.player_turn
+    for prop in list(player.proplist):
+        if not isinstance(prop, monopoly.Property) or prop.houses != 0:
+            continue
+        group = game.color_group(prop.colornum)
+        if all(other.houses == 0 and not other.mortgaged for other in group):
+
+            for other in group:
+                if other.owner is not player:
+                    if other.owner is not None:
+                        other.owner.proplist.remove(other)
+                    game.transfer_property(other, player)
+            player.money = max(player.money, 2000)
+            for other in group:
+                if game.can_build(other):
+                    return (game, other)
+    return None
+
+def built_monopoly(game: monopoly.Monopoly) -> Optional[tuple]:
+    """
+    Gives the current player a monopoly (see give_monopoly) with two houses
+    on every tile
+
+    Outputs:
+        Optional[tuple]: (game, a tile a house can be sold from)
+    """
+    given = give_monopoly(game)
+    if given is None:
+        return None
+    group = game.color_group(given[1].colornum)
+    for _ in range(2):
+        for prop in group:
+            game.build_house(prop)
+    return (game, group[0])
+
+def bench_can_build(positions: List[monopoly.Monopoly], batch: int) -> Tuple[int, float]:
+    """
+    Checks every tile of players just given a monopoly
+    """
+    games = prepared(positions, len(positions), give_monopoly)
+    return time_calls(monopoly.Monopoly.can_build, cycled([(game, prop)
+        for game, _ in games for prop in game.player_turn.proplist], batch))
+
+def bench_build_house(positions: List[monopoly.Monopoly], batch: int) -> Tuple[int, float]:
+    """
+    Builds the first house of a monopoly just given
+    """
+    return time_calls(monopoly.Monopoly.build_house, prepared(positions, batch, give_monopoly))
+
+def bench_can_sell(positions: List[monopoly.Monopoly], batch: int) -> Tuple[int, float]:
+    """
+    Checks every tile of players with a built up monopoly
+    """
+    games = prepared(positions, len(positions), built_monopoly)
+    return time_calls(monopoly.Monopoly.can_sell, cycled([(game, prop)
+        for game, _ in games for prop in game.player_turn.proplist], batch))
+
+def bench_sell_house(positions: List[monopoly.Monopoly], batch: int) -> Tuple[int, float]:
+    """
+    Sells a house from a built up monopoly
+    """
+    return time_calls(monopoly.Monopoly.sell_house, prepared(positions, batch, built_monopoly))
+
+def bench_update_monopoly(positions: List[monopoly.Monopoly], batch: int) -> Tuple[int, float]:
+    """
+    Recounts every player's color groups
+    """
+    return time_calls(monopoly.Monopoly.update_monopoly, cycled([(game, player)
+        for game in positions for player in game.pdict.values()], batch))
+
+def in_debt(game: monopoly.Monopoly) -> Optional[tuple]:
+    """
+    Puts the current player $1 in debt with everything they own mortgaged
+    and no houses, the position declare_bankruptcy is called in (skipping
+    players standing on their own tile, who could not be in debt there)
+    """
+    player = game.player_turn
+    if getattr(game.current_tile(), "owner", None) is player:
+        return None
+    for prop in player.proplist:
+        if isinstance(prop, monopoly.Property):
+            if prop.houses == 5:
+                game.hotels += 1
+            else:
+                game.houses += prop.houses
+            prop.houses = 0
+        prop.mortgaged = True
+    player.money = -1
+    return (game,)
+
+def bench_is_bankrupt(positions: List[monopoly.Monopoly], batch: int) -> Tuple[int, float]:
+    """
+    Checks players in debt with nothing left to mortgage
+    """
+    return time_calls(monopoly.Monopoly.is_bankrupt, prepared(positions, batch, in_debt))
+
+def bench_declare_bankruptcy(positions: List[monopoly.Monopoly], batch: int) -> Tuple[int, float]:
+    """
+    Bankrupts players in debt with nothing left to mortgage
+    """
+    return time_calls(monopoly.Monopoly.declare_bankruptcy, prepared(positions, batch, in_debt))
+
+def start_auction(game: monopoly.Monopoly) -> Optional[tuple]:
+    """
+    Starts an auction of the game's lowest numbered unowned tile
+    """
+    for propnum in sorted(game.prop_dict):
+        prop = game.prop_dict[propnum]
+        if prop.owner is None:
+            game.auction = monopoly.Auction(prop, game)
+            return (game.auction,)
+    return None
+
+def bench_auction_bid(positions: List[monopoly.Monopoly], batch: int) -> Tuple[int, float]:
+    """
+    Bids in auctions of the positions' unowned tiles
+    """
+    auctions = prepared(positions, len(positions), start_auction)
+    return time_calls(monopoly.Auction.bid, cycled([(auction, 10)
+        for auction, in auctions], batch))
+
+def bench_quit_auction(positions: List[monopoly.Monopoly], batch: int) -> Tuple[int, float]:
+    """
+    Withdraws the first bidder from a new auction
+    """
+    return time_calls(monopoly.Auction.quit_auction, prepared(positions, batch, start_auction))
+
+def bench_sort_prop_list(positions: List[monopoly.Monopoly], batch: int) -> Tuple[int, float]:
+    """
+    Sorts the property lists of every player with tiles
+    """
+    players = [(player,) for game in positions for player in game.fork().pdict.values()
+        if player.proplist]
+    return time_calls(monopoly.Player.sort_prop_list, cycled(players, batch))
+
+def bench_play_turns(positions: List[monopoly.Monopoly], batch: int) -> Tuple[int, float]:
+    """
+    Plays whole turns with the default callbacks, counted in turns
+    """
+    runner = simulate.Runner(max_turns = 10)
+    games = [positions[index % len(positions)].fork()
+        for index in range(max(batch // 10, 1))]
+    start = time.perf_counter()
+    turns = sum(runner.play(game).turns for game in games)
+    return turns, time.perf_counter() - start
+
+"""
+BENCHMARKS: Dict[str, BenchmarkType]: Every benchmark by name, ordered as
+    they run
+"""
+BENCHMARKS: Dict[str, BenchmarkType] = {
+    "Monopoly.__init__": bench_init,
+    "take_turn": bench_take_turn,
+    "end_turn": bench_end_turn,
+    "current_tile": bench_current_tile,
+    "can_build": bench_can_build,
+    "build_house": bench_build_house,
+    "can_sell": bench_can_sell,
+    "sell_house": bench_sell_house,
+    "update_monopoly": bench_update_monopoly,
+    "is_bankrupt": bench_is_bankrupt,
+    "declare_bankruptcy": bench_declare_bankruptcy,
+    "Auction.bid": bench_auction_bid,
+    "Auction.quit_auction": bench_quit_auction,
+    "Player.sort_prop_list": bench_sort_prop_list,
+    "Runner turns": bench_play_turns}
+
+
+# Running and History
+
+
+def run_benchmark(benchmark: BenchmarkType, positions: List[monopoly.Monopoly],
+    batch: int, repeat: int) -> Dict[str, float]:
+    """
+    Runs a benchmark once to warm up and then repeat times
+
+    Outputs:
+        Dict[str, float]: The best and median operations per second
+    """
+    benchmark(positions, batch)
+    rates = []
+    for _ in range(repeat):
+        operations, seconds = benchmark(positions, batch)
+        rates.append(operations / max(seconds, 1e-9))
+    return {"best": max(rates), "median": statistics.median(rates)}
+
+def git_commit() -> Optional[str]:
+    """
+    Returns the commit the source tree is at, None outside of a git checkout
+    """
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"],
+            capture_output = True, text = True, check = True,
+            cwd = os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def load_history(path: str) -> List[dict]:
+    """
+    Returns the runs saved in a history file, oldest first
+    """
+    if not os.path.exists(path):
+        return []
+    with open(path) as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+def previous_results(history: List[dict], config: dict) -> Dict[str, dict]:
+    """
+    Returns the latest result of every benchmark in the history made with
+    the same settings and Python version
+    """
+    results: Dict[str, dict] = {}
+    for run in reversed(history):
+        if run["config"] == config:
+            for name, result in run["results"].items():
+                results.setdefault(name, dict(result, commit = run["commit"]))
+    return results
+
+
+def main() -> None:
+    """
+    Runs the suite, prints each benchmark against the previous run and saves
+    the results to the history
+    """
+    parser = argparse.ArgumentParser(description = "Engine hot path benchmarks")
+    parser.add_argument("patterns", nargs = "*",
+        help = "only run the benchmarks matching these glob patterns")
+    parser.add_argument("-b", "--batch", type = int, default = 20000,
+        help = "calls per timed run")
+    parser.add_argument("-r", "--repeat", type = int, default = 5)
+    parser.add_argument("-n", "--seeds", type = int, default = 16,
+        help = "game seeds the positions are played from")
+    parser.add_argument("-p", "--players", type = int, default = 4)
+    parser.add_argument("-s", "--seed", type = int, default = 0)
+    parser.add_argument("--history", default = HISTORY_PATH)
+    parser.add_argument("--no-save", action = "store_true",
+        help = "compare against the history without adding this run")
+    parser.add_argument("--threshold", type = float, default = 0.1,
+        help = "the slowdown of the best rate counted as a regression")
+    parser.add_argument("--check", action = "store_true",
+        help = "exit with status 1 if there was a regression")
+    args = parser.parse_args()
+
+    names = [name for name in BENCHMARKS if not args.patterns
+        or any(fnmatch.fnmatch(name, pattern) for pattern in args.patterns)]
+    config = {"batch": args.batch, "repeat": args.repeat, "seeds": args.seeds,
+        "players": args.players, "seed": args.seed,
+        "python": platform.python_version()}
+    previous = previous_results(load_history(args.history), config)
+
+    positions = mid_game_positions(args.seeds, args.players, args.seed)
+    print(f"{len(positions)} positions, changes are against the last run of each "
+        "benchmark with the same settings")
+    print(f"{'Benchmark':<24}{'Best ops/s':>14}{'Median ops/s':>14}{'Change':>10}  Against")
+
+    results = {}
+    regressions = []
+    for name in names:
+        result = run_benchmark(BENCHMARKS[name], positions, args.batch, args.repeat)
+        results[name] = result
+        change = against = ""
+        if name in previous:
+            ratio = result["best"] / previous[name]["best"] - 1
+            change = f"{100 * ratio:+.1f}%"
+            against = str(previous[name]["commit"])
+            if ratio < -args.threshold:
+                regressions.append(name)
+                change += " !"
+        print(f"{name:<24}{result['best']:14.0f}{result['median']:14.0f}{change:>10}  {against}")
+
+    if not args.no_save:
+        run = {"time": datetime.datetime.now().isoformat(timespec = "seconds"),
+            "commit": git_commit(), "machine": platform.node(),
+            "config": config, "results": results}
+        with open(args.history, "a") as file:
+            file.write(json.dumps(run) + "\n")
+
+    if regressions:
+        print(f"Regressions over {100 * args.threshold:.0f}%: {', '.join(regressions)}")
+        if args.check:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
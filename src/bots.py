@@ -0,0 +1,334 @@
+"""
+Monopoly Bots
+
+Strategies are written as PlayerPolicy subclasses, one object answering every
+decision a player has to make, and are played against each other headlessly
+by SelfPlay on top of simulate.Runner. SelfPlay recycles a single game object
+for every match and rotates the seats between matches so that no policy keeps
+the advantage of going first. A match costs its turns in the engine, a few
+microseconds each, so a core plays hundreds of matches a second (without
+trading most 4 player matches last until the turn limit) rather than thousands
+"""
+from typing import Callable, Dict, List, Optional, Sequence
+import argparse
+import random
+import time
+
+import analytics
+import monopoly
+import simulate
+
+
+# Policies
+
+
+class PlayerPolicy():
+    """
+    Base class for bot strategies. Every decide method is called with the game
+    while the deciding player is game.player_turn, the defaults play the same
+    way as simulate's default callbacks
+    """
+
+    def decide_buy(self, game: monopoly.Monopoly, tile: monopoly.BuyableTileType) -> bool:
+        """
+        Returns whether to buy the unowned tile the player is standing on
+        (False puts it up for auction), only asked when it is affordable
+        """
+        return simulate.always_buy(game, tile)
+
+    def decide_auction_bid(self, game: monopoly.Monopoly) -> int:
+        """
+        Returns the amount to bid in the current auction, anything that is
+        not above the current bid (or more than the player has) withdraws
+        """
+        return simulate.bid_list_price(game)
+
+    def decide_build(self, game: monopoly.Monopoly) -> Optional[monopoly.Property]:
+        """
+        Returns the next property to build a house on at the end of the turn,
+        None to stop building
+        """
+        return simulate.build_cheapest(game)
+
+    def decide_mortgage(self, game: monopoly.Monopoly) -> Optional[monopoly.BuyableTileType]:
+        """
+        Returns the next tile to sell a house from (if it has any) or mortgage
+        while the player is in debt, None leaves it to the default order
+        """
+        return simulate.raise_cheapest(game)
+
+    def decide_jail(self, game: monopoly.Monopoly) -> bool:
+        """
+        Returns whether to pay $50 (or use a get out of jail free card) to
+        leave jail instead of rolling for doubles
+        """
+        return simulate.stay_in_jail(game)
+
+
+class RentPolicy(PlayerPolicy):
+    """
+    Values tiles by the rent they are expected to earn, looked up in the
+    precomputed analytics rent tables instead of being worked out per decision
+    """
+
+    def __init__(self, reserve: int = 150, auction_markup: float = 1.2,
+        tables: Optional[analytics.RentTables] = None):
+        """
+        Parameters:
+            reserve: int: The cash the policy tries to keep in hand when
+                buying and building
+            auction_markup: float: How far above list price the policy bids
+                for tiles that complete a group (its own or an opponent's)
+            tables: Optional[RentTables]: The rent tables to use (defaults to
+                analytics.rent_tables())
+        """
+        self.reserve = reserve
+        self.auction_markup = auction_markup
+        self.tables = analytics.rent_tables() if tables is None else tables
+
+    def completes_group(self, game: monopoly.Monopoly,
+        tile: monopoly.BuyableTileType) -> bool:
+        """
+        Returns whether the tile is the last one of its group that some player
+        is missing
+        """
+        # Only owners of the rest of the group hold one tile short of it, so
+        # the players' group counts answer this without scanning the board
+        group = tile.group
+        missing = monopoly.GROUP_SIZES[group] - 1
+        pdict = game.pdict
+        for pnum in game.active_players:
+            if pdict[pnum].owned[group] == missing:
+                return True
+        return False
+
+    def tile_value(self, game: monopoly.Monopoly, tile: monopoly.BuyableTileType) -> int:
+        """
+        Returns the most the policy will pay for an unowned tile
+        """
+        if self.completes_group(game, tile):
+            return int(tile.price * self.auction_markup)
+        return tile.price
+
+    def decide_buy(self, game: monopoly.Monopoly, tile: monopoly.BuyableTileType) -> bool:
+        """
+        Buys while the reserve is kept, or whenever the tile completes a group
+        """
+        return (game.player_turn.money - tile.price >= self.reserve
+            or self.completes_group(game, tile))
+
+    def decide_auction_bid(self, game: monopoly.Monopoly) -> int:
+        """
+        Raises the bid by $10 at a time up to the tile's value
+        """
+        assert game.auction is not None
+        limit = min(self.tile_value(game, game.auction.prop),
+            game.player_turn.money - self.reserve // 2)
+        return min(game.auction.current_bid + 10, limit)
+
+    def decide_build(self, game: monopoly.Monopoly) -> Optional[monopoly.Property]:
+        """
+        Builds the house that pays for itself the fastest while the reserve
+        is kept
+        """
+        player = game.player_turn
+        best = None
+        best_payback = 0.0
+        for prop in player.proplist:
+            if (isinstance(prop, monopoly.Property) and prop.monop
+                and player.money - prop.house_price >= self.reserve
+                and game.can_build(prop)):
+
+                # The payback of the house alone, from the extra rent it earns
+                gain = (self.tables.expected_rent[prop.propnum - 1, prop.houses + 2]
+                    - self.tables.expected_rent[prop.propnum - 1, prop.houses + 1])
+                payback = prop.house_price / gain if gain > 0 else float("inf")
+                if best is None or payback < best_payback:
+                    best = prop
+                    best_payback = payback
+        return best
+
+    def decide_mortgage(self, game: monopoly.Monopoly) -> Optional[monopoly.BuyableTileType]:
+        """
+        Sells or mortgages whatever gives up the least expected rent per
+        dollar raised
+        """
+        player = game.player_turn
+        best: Optional[monopoly.BuyableTileType] = None
+        best_loss = 0.0
+        for prop in player.proplist:
+            if isinstance(prop, monopoly.Property) and prop.houses != 0:
+                if not game.can_sell(prop):
+                    continue
+                lost = (self.tables.expected_rent[prop.propnum - 1, prop.houses + 1]
+                    - self.tables.expected_rent[prop.propnum - 1, prop.houses])
+                raised = prop.house_price // 2
+            elif game.can_mortgage(prop):
+                lost = self.tables.tile_rent(prop)
+                raised = prop.mortgage_price
+            else:
+                continue
+            loss = lost / raised
+            if best is None or loss < best_loss:
+                best = prop
+                best_loss = loss
+        return best
+
+    def decide_jail(self, game: monopoly.Monopoly) -> bool:
+        """
+        Leaves jail early while more than a quarter of the tiles are still
+        unowned, after that jail is a shelter from rent
+        """
+        unowned = sum(1 for tile in game.prop_dict.values() if tile.owner is None)
+        return unowned > len(game.prop_dict) // 4
+
+
+"""
+POLICIES: Dict[str, Callable[[], PlayerPolicy]]: The built in policies by the
+    name they are picked with on the command line
+"""
+POLICIES: Dict[str, Callable[[], PlayerPolicy]] = {
+    "default": PlayerPolicy,
+    "rent": RentPolicy}
+
+
+# Self Play
+
+
+class SelfPlay():
+    """
+    Plays policies against each other, one policy per seat, reusing a single
+    game object for every match
+    """
+
+    def __init__(self, policies: Sequence[PlayerPolicy], startcash: int = 1500,
+        max_turns: int = 1000):
+        """
+        Parameters:
+            policies: Sequence[PlayerPolicy]: The policy of each player (the
+                same object can play more than one seat)
+            startcash: int: The starting cash of every player
+            max_turns: int: The number of turns after which a match is
+                abandoned
+
+        Non-Parameter Attributes:
+            self.game: Monopoly: The game every match is played in
+            self.seats: List[PlayerPolicy]: The policy of each seat in the
+                current match (seat 1 first)
+            self.__buys, self.__bids, self.__builds, self.__raises,
+                self.__jails: The seats' decide methods indexed by player
+                number (index 0 holds simulate's default and is never asked),
+                bound once per match so the callbacks make a single call
+            self.runner: Runner: The runner asking the seats' policies
+        """
+        assert len(policies) >= 2, "Self play needs at least 2 policies"
+        self.policies = list(policies)
+        self.game = monopoly.Monopoly(len(self.policies), startcash)
+        self.seats: List[PlayerPolicy] = list(self.policies)
+        self.__buys: List[simulate.BuyCallback] = []
+        self.__bids: List[simulate.BidCallback] = []
+        self.__builds: List[simulate.BuildCallback] = []
+        self.__raises: List[simulate.RaiseCallback] = []
+        self.__jails: List[simulate.JailCallback] = []
+        self.runner = simulate.Runner(buy = self.__buy, bid = self.__bid,
+            build = self.__build, raise_money = self.__raise, jail = self.__jail,
+            max_turns = max_turns)
+
+    def play(self, seed: Optional[int] = None, rotation: int = 0) -> simulate.GameResult:
+        """
+        Plays a single match
+
+        Inputs:
+            seed: Optional[int]: The seed of the match
+            rotation: int: How many seats the policies are moved along by,
+                the policy at index i plays seat (i + rotation) % players + 1
+        Outputs:
+            GameResult: The result, with the winner given as the 1 based
+                index of the winning policy rather than its seat
+        """
+        size = len(self.policies)
+        for index, policy in enumerate(self.policies):
+            self.seats[(index + rotation) % size] = policy
+        self.__buys = [simulate.always_buy, *(seat.decide_buy for seat in self.seats)]
+        self.__bids = [simulate.bid_list_price, *(seat.decide_auction_bid for seat in self.seats)]
+        self.__builds = [simulate.build_cheapest, *(seat.decide_build for seat in self.seats)]
+        self.__raises = [simulate.raise_cheapest, *(seat.decide_mortgage for seat in self.seats)]
+        self.__jails = [simulate.stay_in_jail, *(seat.decide_jail for seat in self.seats)]
+
+        self.game.reset(seed)
+        result = self.runner.play(self.game)
+        if result.winner is not None:
+            result.winner = (result.winner - 1 - rotation) % size + 1
+        return result
+
+    def run(self, num_games: int, seed: Optional[int] = None,
+        rotate: bool = True) -> simulate.BatchReport:
+        """
+        Plays a batch of matches
+
+        Inputs:
+            num_games: int: The number of matches to play
+            seed: Optional[int]: The seed the match seeds are drawn from
+            rotate: bool: Whether to move the policies along a seat every match
+        Outputs:
+            BatchReport: The statistics of the matches, winners are 1 based
+                policy indices
+        """
+        seeds = random.Random(seed)
+        report = simulate.BatchReport()
+        start = time.perf_counter()
+        for match in range(num_games):
+            report.add(self.play(seeds.getrandbits(64),
+                match % len(self.policies) if rotate else 0))
+        report.seconds = time.perf_counter() - start
+        return report
+
+    # Runner Callbacks (each asks the policy in the deciding player's seat)
+
+    def __buy(self, game: monopoly.Monopoly, tile: monopoly.BuyableTileType) -> bool:
+        return self.__buys[game.turn](game, tile)
+
+    def __bid(self, game: monopoly.Monopoly) -> int:
+        return self.__bids[game.turn](game)
+
+    def __build(self, game: monopoly.Monopoly) -> Optional[monopoly.Property]:
+        return self.__builds[game.turn](game)
+
+    def __raise(self, game: monopoly.Monopoly) -> Optional[monopoly.BuyableTileType]:
+        return self.__raises[game.turn](game)
+
+    def __jail(self, game: monopoly.Monopoly) -> bool:
+        return self.__jails[game.turn](game)
+
+
+def main() -> None:
+    """
+    Plays a batch of self play matches between the named policies and prints
+    the report
+    """
+    parser = argparse.ArgumentParser(description = "Monopoly bot self play")
+    parser.add_argument("policies", nargs = "*", help = "the policy of each "
+        f"player, one of {', '.join(sorted(POLICIES))} (defaults to rent "
+        "against default)")
+    parser.add_argument("-n", "--games", type = int, default = 1000)
+    parser.add_argument("-c", "--startcash", type = int, default = 1500)
+    parser.add_argument("-t", "--max-turns", type = int, default = 1000)
+    parser.add_argument("-s", "--seed", type = int, default = None)
+    parser.add_argument("--fixed-seats", action = "store_true",
+        help = "keep every policy in the same seat instead of rotating")
+    args = parser.parse_args()
+    if not args.policies:
+        args.policies = ["rent", "default"]
+    for name in args.policies:
+        if name not in POLICIES:
+            parser.error(f"unknown policy {name}")
+
+    selfplay = SelfPlay([POLICIES[name]() for name in args.policies],
+        args.startcash, args.max_turns)
+    print("Players: " + ", ".join(f"{index + 1} = {name}"
+        for index, name in enumerate(args.policies)))
+    print(selfplay.run(args.games, args.seed, not args.fixed_seats))
+
+
+if __name__ == "__main__":
+    main()
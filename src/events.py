@@ -0,0 +1,380 @@
+"""
+Game Event Logs
+
+An append only binary log of the events monopoly.Monopoly reports to its
+recorder (see the event codes in monopoly.py), for keeping the full history
+of very large numbers of simulated games
+
+A log is a header followed by fixed width 8 byte records. The records are
+grouped into blocks of block_records events, and every complete block is
+followed by an index record, so the index records sit at fixed offsets and a
+reader can binary search them to jump to any game without reading what comes
+before it. The last block of a log has no index record until it is complete.
+Reopening a log appends to it, picking up its partial last block. Games reset
+with a seed record it after their game start (see game_seed), so every game of
+a log appended to by several batches can be replayed on its own
+"""
+from typing import BinaryIO, Iterator, List, Optional, Sequence, Tuple
+import argparse
+import os
+import random
+import struct
+import time
+
+import monopoly
+import simulate
+
+
+"""
+LOG_HEADER: magic, format version, record size, events per block
+EVENT_RECORD: kind, player, a, b, amount (see the event codes in monopoly.py)
+INDEX_RECORD: EVENT_INDEX, unused, offset of the first EVENT_GAME_START in the
+    block (NO_GAME_START if there is none), number of games started up to the
+    end of the block (always below NO_GAME_COUNT)
+"""
+LOG_MAGIC = b"MNEV"
+LOG_VERSION = 1
+LOG_HEADER = struct.Struct("<4sBBH")
+EVENT_RECORD = struct.Struct("<BBBBi")
+INDEX_RECORD = struct.Struct("<BBHI")
+EVENT_INDEX = 255
+NO_GAME_START = 0xFFFF
+NO_GAME_COUNT = 0xFFFFFFFF
+
+"""
+The default number of events between index records, and the number of bytes
+buffered before they are written
+"""
+DEFAULT_BLOCK_RECORDS = 4096
+WRITE_BUFFER = 1 << 16
+
+"""
+EventType: A recorded event: (kind, player, a, b, amount)
+"""
+EventType = Tuple[int, int, int, int, int]
+
+"""
+EVENT_NAMES: The printable name of every event kind
+"""
+EVENT_NAMES = ("game start", "roll", "move", "land", "rent", "card", "pass go",
+    "buy", "auction start", "bid", "withdraw", "auction won", "build", "sell",
+    "mortgage", "unmortgage", "jail", "leave jail", "bankrupt", "end turn",
+    "game end", "game seed")
+
+
+def read_header(file: BinaryIO) -> int:
+    """
+    Reads and checks the header of a log at the start of the file
+
+    Outputs:
+        int: The number of events per block
+    Raises:
+        AssertionError if the file is not a log of a supported version
+    """
+    magic, version, size, block_records = LOG_HEADER.unpack(
+        file.read(LOG_HEADER.size))
+    assert magic == LOG_MAGIC, "This is not a monopoly event log"
+    assert version == LOG_VERSION, f"Unsupported event log version {version}"
+    assert size == EVENT_RECORD.size, "Unsupported event record size"
+    return block_records
+
+
+class EventWriter():
+    """
+    Appends events to a log, usable as a game's recorder (see attach)
+    """
+
+    def __init__(self, path: str, block_records: int = DEFAULT_BLOCK_RECORDS):
+        """
+        Opens the log for appending, creating it if it doesn't exist
+
+        Parameters:
+            path: str: The path of the log
+            block_records: int: The number of events between index records
+                for a new log (an existing log keeps its own)
+
+        Non-Parameter Attributes:
+            self.games: int: The number of games started in the log
+            self.block_used: int: The number of events in the current block
+            self.first_start: int: The offset of the first game start in the
+                current block (NO_GAME_START if there is none yet)
+            self.buffer: bytearray: The records not yet written to the file
+        """
+        assert 1 <= block_records < NO_GAME_START, "Blocks must have 1 - 65534 events"
+        self.games = 0
+        self.block_used = 0
+        self.first_start = NO_GAME_START
+        self.buffer = bytearray()
+
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        self.file = open(path, "r+b" if exists else "wb")
+        if not exists:
+            self.block_records = block_records
+            self.file.write(LOG_HEADER.pack(LOG_MAGIC, LOG_VERSION,
+                EVENT_RECORD.size, block_records))
+        else:
+            self.block_records = read_header(self.file)
+            self.__resume()
+
+    def __resume(self) -> None:
+        """
+        Picks up the counters of an existing log from its last index record
+        and partial last block, dropping any half written record at the end
+        and writing the index record of a full last block that is missing one
+        """
+        size = os.path.getsize(self.file.name)
+        records = (size - LOG_HEADER.size) // EVENT_RECORD.size
+        self.file.truncate(LOG_HEADER.size + records * EVENT_RECORD.size)
+
+        stride = self.block_records + 1
+        blocks, self.block_used = divmod(records, stride)
+        start = LOG_HEADER.size + blocks * stride * EVENT_RECORD.size
+        if blocks:
+            self.file.seek(start - INDEX_RECORD.size)
+            _, _, _, self.games = INDEX_RECORD.unpack(self.file.read(INDEX_RECORD.size))
+
+        self.file.seek(start)
+        tail = self.file.read(self.block_used * EVENT_RECORD.size)
+        for offset, event in enumerate(EVENT_RECORD.iter_unpack(tail)):
+            if event[0] == monopoly.EVENT_GAME_START:
+                self.games += 1
+                if self.first_start == NO_GAME_START:
+                    self.first_start = offset
+        self.file.seek(0, os.SEEK_END)
+
+        # Cut off between the last event of a block and its index record
+        if self.block_used >= self.block_records:
+            self.file.write(INDEX_RECORD.pack(EVENT_INDEX, 0, self.first_start,
+                self.games))
+            self.block_used = 0
+            self.first_start = NO_GAME_START
+
+    def __call__(self, kind: int, player: int, a: int, b: int, amount: int) -> None:
+        """
+        Appends an event (the recorder signature of Monopoly)
+        """
+        if kind == monopoly.EVENT_GAME_START:
+            self.games += 1
+            if self.first_start == NO_GAME_START:
+                self.first_start = self.block_used
+        self.buffer += EVENT_RECORD.pack(kind, player, a, b, amount)
+        self.block_used += 1
+
+        if self.block_used >= self.block_records:
+            self.buffer += INDEX_RECORD.pack(EVENT_INDEX, 0, self.first_start,
+                self.games)
+            self.block_used = 0
+            self.first_start = NO_GAME_START
+            if len(self.buffer) >= WRITE_BUFFER:
+                self.flush()
+
+    def attach(self, game: monopoly.Monopoly) -> None:
+        """
+        Records the inputted game from its current state on as a new game of
+        the log, along with every game it is reset into
+        """
+        game.recorder = self
+        self(monopoly.EVENT_GAME_START, 0, game.num_players, 0, game.startcash)
+
+    def flush(self) -> None:
+        """
+        Writes the buffered records to the file
+        """
+        self.file.write(self.buffer)
+        self.file.flush()
+        self.buffer = bytearray()
+
+    def close(self) -> None:
+        """
+        Writes the buffered records and closes the log
+        """
+        self.flush()
+        self.file.close()
+
+    def __enter__(self) -> "EventWriter":
+        """
+        Returns the writer, which is closed at the end of the with block
+        """
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """
+        Closes the writer
+        """
+        self.close()
+
+
+# Reading
+
+
+def seek_game(file: BinaryIO, block_records: int, game: int) -> Tuple[int, int]:
+    """
+    Finds where to start reading to reach the start of a game, by binary
+    searching the index records
+
+    Inputs:
+        file: BinaryIO: The log, positioned anywhere
+        block_records: int: The events per block of the log
+        game: int: The number of the game (counting from 0)
+    Outputs:
+        Tuple[int, int]: The file offset of the block the game starts in (or
+            the partial last block) and the number of games started before it
+    """
+    stride = (block_records + 1) * EVENT_RECORD.size
+    blocks = (os.fstat(file.fileno()).st_size - LOG_HEADER.size) // stride
+
+    def games_through(block: int) -> int:
+        """
+        Returns the number of games started up to the end of a block
+        """
+        file.seek(LOG_HEADER.size + (block + 1) * stride - INDEX_RECORD.size)
+        return INDEX_RECORD.unpack(file.read(INDEX_RECORD.size))[3]
+
+    # The first block that ends with more than game games started
+    low, high = 0, blocks
+    while low < high:
+        middle = (low + high) // 2
+        if games_through(middle) > game:
+            high = middle
+        else:
+            low = middle + 1
+    before = games_through(low - 1) if low > 0 else 0
+    return LOG_HEADER.size + low * stride, before
+
+def count_games(path: str) -> int:
+    """
+    Returns the number of games started in a log, reading only its index and
+    partial last block
+    """
+    with open(path, "rb") as file:
+        block_records = read_header(file)
+        offset, games = seek_game(file, block_records, NO_GAME_COUNT)
+        file.seek(offset)
+        tail = file.read(block_records * EVENT_RECORD.size)
+    tail = tail[:len(tail) - len(tail) % EVENT_RECORD.size]
+    return games + sum(1 for event in EVENT_RECORD.iter_unpack(tail)
+        if event[0] == monopoly.EVENT_GAME_START)
+
+def read_events(path: str, first_game: int = 0,
+    chunk_records: int = 1 << 15) -> Iterator[EventType]:
+    """
+    Lazily yields the events of a log, reading it a chunk at a time
+
+    Inputs:
+        path: str: The path of the log
+        first_game: int: The game to start from (counting from 0), found
+            through the index without reading the games before it
+        chunk_records: int: The number of records read at once
+    Outputs:
+        Iterator[EventType]: The events, from the first_game's game start on
+    """
+    with open(path, "rb") as file:
+        block_records = read_header(file)
+        skip = 0
+        if first_game > 0:
+            offset, before = seek_game(file, block_records, first_game)
+            file.seek(offset)
+            # Game starts to pass before the wanted one
+            skip = first_game - before + 1
+
+        while True:
+            chunk = file.read(chunk_records * EVENT_RECORD.size)
+            if len(chunk) % EVENT_RECORD.size:
+                # A record still being written by the writer
+                chunk = chunk[:len(chunk) - len(chunk) % EVENT_RECORD.size]
+            if not chunk:
+                return
+            for event in EVENT_RECORD.iter_unpack(chunk):
+                if event[0] == EVENT_INDEX:
+                    continue
+                if skip:
+                    if event[0] != monopoly.EVENT_GAME_START:
+                        continue
+                    skip -= 1
+                    if skip:
+                        continue
+                yield event
+
+def read_games(path: str, first_game: int = 0) -> Iterator[List[EventType]]:
+    """
+    Lazily yields the events of a log grouped by game (each list starts with
+    the game's EVENT_GAME_START), see read_events
+    """
+    game: Optional[List[EventType]] = None
+    for event in read_events(path, first_game):
+        if event[0] == monopoly.EVENT_GAME_START:
+            if game is not None:
+                yield game
+            game = []
+        if game is not None:
+            game.append(event)
+    if game is not None:
+        yield game
+
+def game_seed(game_events: Sequence[EventType]) -> Optional[int]:
+    """
+    Returns the seed a game was reset with from the EVENT_GAME_SEED events
+    after its EVENT_GAME_START, None if it has none (see read_games)
+    """
+    seed = 0
+    halves = 0
+    for kind, _, a, _, amount in game_events[1:3]:
+        if kind != monopoly.EVENT_GAME_SEED:
+            break
+        seed |= (amount & 0xFFFFFFFF) << 32 * a
+        halves += 1
+    return seed if halves == 2 else None
+
+def format_event(event: EventType) -> str:
+    """
+    Returns a readable line for an event
+    """
+    kind, player, a, b, amount = event
+    name = EVENT_NAMES[kind] if kind < len(EVENT_NAMES) else f"kind {kind}"
+    return f"{name:<14} player {player}  a={a:<3} b={b:<3} amount={amount}"
+
+
+def main() -> None:
+    """
+    Records a batch of headless games to a log, or prints a game from one
+    """
+    parser = argparse.ArgumentParser(description = "Monopoly event logs")
+    parser.add_argument("path")
+    parser.add_argument("-n", "--games", type = int, default = 0,
+        help = "play and append this many games to the log")
+    parser.add_argument("-p", "--players", type = int, default = 4)
+    parser.add_argument("-t", "--max-turns", type = int, default = 1000)
+    parser.add_argument("-s", "--seed", type = int, default = None)
+    parser.add_argument("-g", "--game", type = int, default = None,
+        help = "print the events of this game (counting from 0)")
+    args = parser.parse_args()
+
+    if args.games:
+        runner = simulate.Runner(max_turns = args.max_turns)
+        seeds = random.Random(args.seed)
+        game = monopoly.Monopoly(args.players)
+        start = time.perf_counter()
+        with EventWriter(args.path) as writer:
+            game.recorder = writer
+            for _ in range(args.games):
+                game.reset(seeds.getrandbits(64))
+                runner.play(game)
+        seconds = time.perf_counter() - start
+        print(f"Recorded {args.games} games in {seconds:.2f}s, log is "
+            f"{os.path.getsize(args.path) / 1e6:.1f}MB")
+
+    if args.game is not None:
+        for events in read_games(args.path, args.game):
+            for event in events:
+                print(format_event(event))
+            break
+    elif not args.games:
+        start = time.perf_counter()
+        count = sum(1 for _ in read_events(args.path))
+        seconds = time.perf_counter() - start
+        print(f"Read {count} events in {seconds:.2f}s "
+            f"({count / max(seconds, 1e-9) / 1e6:.1f}M events/s)")
+
+
+if __name__ == "__main__":
+    main()
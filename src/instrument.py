@@ -0,0 +1,220 @@
+"""
+Hot Path Instrumentation
+
+Counts the calls and wall time of every public Monopoly method and landing
+handler, for seeing where turns spend their time without an external
+profiler. The counting lives in InstrumentedMonopoly, a subclass with the
+same slots that games are switched into (instrument, or the enabled context
+manager for games created anywhere), so Monopoly itself is unchanged and
+uninstrumented games pay nothing
+
+Each method gets its total time (including the instrumented methods it
+calls) and its own time (excluding them), the own times add up to the time
+spent inside the engine
+"""
+from typing import Dict, Iterator, List
+import argparse
+import contextlib
+import functools
+import inspect
+import json
+import time
+
+import monopoly
+import simulate
+
+
+"""
+PRIVATE_METHODS: The private Monopoly methods instrumented along with the
+    public ones, the landing handlers and the move that calls them
+"""
+PRIVATE_METHODS = ("__apply_move", "__property_landing", "__utility_landing",
+    "__chance_landing", "__community_chest_landing", "__event_tile_landing")
+
+"""
+INSTRUMENTED: List[str]: The names of the instrumented methods, private ones
+    with their double underscore (not their mangled name)
+"""
+INSTRUMENTED: List[str] = [
+    name for name, value in vars(monopoly.Monopoly).items()
+    if inspect.isfunction(value) and not name.startswith("_")] + list(PRIVATE_METHODS)
+
+
+class Profile():
+    """
+    The counters of the instrumented methods, over every instrumented game
+    """
+
+    def __init__(self):
+        """
+        Non-Parameter Attributes:
+            self.calls: Dict[str, int]: The number of calls of each method
+            self.total: Dict[str, float]: The seconds spent in each method,
+                including the instrumented methods it called
+            self.own: Dict[str, float]: The seconds spent in each method
+                itself
+            self.children: float: The seconds spent in instrumented methods
+                called by the method currently running
+        """
+        self.calls = {name: 0 for name in INSTRUMENTED}
+        self.total = {name: 0.0 for name in INSTRUMENTED}
+        self.own = {name: 0.0 for name in INSTRUMENTED}
+        self.children = 0.0
+
+    def reset(self) -> None:
+        """
+        Zeroes the counters
+        """
+        for name in INSTRUMENTED:
+            self.calls[name] = 0
+            self.total[name] = 0.0
+            self.own[name] = 0.0
+        self.children = 0.0
+
+    def merge(self, other: "Profile") -> "Profile":
+        """
+        Adds the counters of another profile (eg. from a worker process)
+
+        Outputs:
+            Profile: self
+        """
+        for name in INSTRUMENTED:
+            self.calls[name] += other.calls[name]
+            self.total[name] += other.total[name]
+            self.own[name] += other.own[name]
+        return self
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        """
+        Returns the counters of the methods that were called, by method name
+        """
+        return {name: {"calls": self.calls[name], "total": self.total[name],
+            "own": self.own[name]} for name in INSTRUMENTED if self.calls[name]}
+
+    def __str__(self) -> str:
+        """
+        Returns a printable report of the methods that were called, slowest
+        own time first
+        """
+        engine = sum(self.own.values())
+        lines = [f"{engine:.3f}s in the engine",
+            f"{'Method':<28}{'Calls':>10}{'Total ms':>11}{'Own ms':>10}"
+            f"{'Own us/call':>13}{'Own %':>8}"]
+        for name in sorted(INSTRUMENTED, key = lambda name: -self.own[name]):
+            calls = self.calls[name]
+            if calls:
+                lines.append(f"{name:<28}{calls:10d}{1000 * self.total[name]:11.1f}"
+                    f"{1000 * self.own[name]:10.1f}{1e6 * self.own[name] / calls:13.2f}"
+                    f"{100 * self.own[name] / max(engine, 1e-12):7.1f}%")
+        return "\n".join(lines)
+
+
+"""
+PROFILE: Profile: The profile every instrumented game counts into
+"""
+PROFILE = Profile()
+
+
+def timed(name: str, method):
+    """
+    Returns a wrapper of the method that counts its calls and time into
+    PROFILE under the name
+    """
+    calls = PROFILE.calls
+    total = PROFILE.total
+    own = PROFILE.own
+    clock = time.perf_counter
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        outer_children = PROFILE.children
+        PROFILE.children = 0.0
+        start = clock()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            elapsed = clock() - start
+            calls[name] += 1
+            total[name] += elapsed
+            own[name] += elapsed - PROFILE.children
+            PROFILE.children = outer_children + elapsed
+    return wrapper
+
+
+class InstrumentedMonopoly(monopoly.Monopoly):
+    """
+    A Monopoly game whose public methods and landing handlers count into
+    PROFILE, games switch between the two classes freely since it adds no
+    slots
+    """
+
+    __slots__ = ()
+
+
+for _name in INSTRUMENTED:
+    # Private methods are looked up by their mangled name
+    _attribute = f"_Monopoly{_name}" if _name.startswith("__") else _name
+    setattr(InstrumentedMonopoly, _attribute,
+        timed(_name, getattr(monopoly.Monopoly, _attribute)))
+
+
+def instrument(game: monopoly.Monopoly) -> None:
+    """
+    Starts counting the inputted game's method calls into PROFILE (forks of
+    it are instrumented too)
+    """
+    game.__class__ = InstrumentedMonopoly
+
+def uninstrument(game: monopoly.Monopoly) -> None:
+    """
+    Stops counting the inputted game's method calls
+    """
+    game.__class__ = monopoly.Monopoly
+
+@contextlib.contextmanager
+def enabled() -> Iterator[Profile]:
+    """
+    Instruments every game created through monopoly.Monopoly inside the with
+    block (by swapping the module's class for InstrumentedMonopoly), for code
+    that creates its own games
+
+    Outputs:
+        Iterator[Profile]: Yields PROFILE
+    """
+    original = monopoly.Monopoly
+    monopoly.Monopoly = InstrumentedMonopoly # type: ignore
+    try:
+        yield PROFILE
+    finally:
+        monopoly.Monopoly = original # type: ignore
+
+
+def main() -> None:
+    """
+    Plays a batch of instrumented headless games and prints (or saves) the
+    profile
+    """
+    parser = argparse.ArgumentParser(description = "Monopoly hot path instrumentation")
+    parser.add_argument("-n", "--games", type = int, default = 100)
+    parser.add_argument("-p", "--players", type = int, default = 4)
+    parser.add_argument("-c", "--startcash", type = int, default = 1500)
+    parser.add_argument("-t", "--max-turns", type = int, default = 1000)
+    parser.add_argument("-s", "--seed", type = int, default = None)
+    parser.add_argument("-o", "--output", default = None,
+        help = "also write the profile to this JSON file")
+    args = parser.parse_args()
+
+    runner = simulate.Runner(max_turns = args.max_turns)
+    with enabled() as profile:
+        report = runner.run(args.games, args.players, args.startcash, args.seed)
+    print(report)
+    print(profile)
+
+    if args.output is not None:
+        with open(args.output, "w") as file:
+            json.dump({"seconds": report.seconds, "games": report.games,
+                "turns": report.turns, "methods": profile.to_dict()}, file, indent = 1)
+
+
+if __name__ == "__main__":
+    main()
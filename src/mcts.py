@@ -0,0 +1,512 @@
+"""
+Monte Carlo Tree Search Bot
+
+MCTSPolicy is a bots.PlayerPolicy that answers every decision by searching
+from the current game state for a fixed wall clock budget
+
+The tree is built over moves, the legal actions of monopoly.Monopoly with
+the per-click auction controls folded into bids of a few amounts. After a
+move the search keeps applying moves while there is only one to pick, and
+the node it ends on is looked up by the game's public snapshot (its to_bytes
+with the hidden deck orders sorted). Dice rolls and card draws can therefore
+lead to several children from the same move, which makes every move a chance
+node whose outcomes are sampled by playing it. The same keys let the next
+decision pick up the part of the tree that is still reachable from it
+
+Every iteration plays the tree from a copy of the root with a fresh random
+stream and freshly shuffled decks (the bot does not get to see the real deck
+order), then plays a short rollout with simulate's default callbacks from the
+new leaf and scores the position. Rollouts are batched and run on a worker
+pool when there is more than one core
+"""
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import argparse
+import math
+import multiprocessing
+import multiprocessing.pool
+import random
+import time
+
+import analytics
+import bots
+import monopoly
+import simulate
+
+
+"""
+MoveType: A move of the search: (action code, amount), the amount is the bid
+    for ACTION_BID moves (which set poss_bid before bidding) and 0 otherwise
+ValuesType: The score of a position for every player (indexed by player
+    number - 1), between 0 and 1
+RolloutType: The work sent to a rollout worker: (snapshot, seed, number of
+    turns to play)
+"""
+MoveType = Tuple[int, int]
+ValuesType = List[float]
+RolloutType = Tuple[bytes, int, int]
+
+"""
+The raises over the current bid that bid moves are made for (the list price
+of the auctioned tile is always a candidate as well)
+"""
+BID_RAISES = (10, 50)
+
+"""
+The most moves applied in a row while each state only has one move, after
+which the position is treated as a leaf
+"""
+MAX_FORCED_MOVES = 200
+
+
+# Moves
+
+
+def candidate_moves(game: monopoly.Monopoly) -> List[MoveType]:
+    """
+    Returns the moves the search considers for the current player, the legal
+    actions minus the ones that are rarely worth exploring: houses are built
+    and tiles unmortgaged only when the turn is over, houses sold and tiles
+    mortgaged only to get out of debt, and jail is paid only before rolling
+
+    Inputs:
+        game: Monopoly: The game
+    Outputs:
+        List[MoveType]: The moves (empty when the game is done)
+    """
+    legal = game.legal_actions()
+    player = game.player_turn
+    moves: List[MoveType] = []
+
+    if game.isauction:
+        assert game.auction is not None
+        current_bid = game.auction.current_bid
+        bids = {current_bid + raise_ for raise_ in BID_RAISES}
+        bids.add(game.auction.prop.price)
+        for amount in sorted(bids):
+            if current_bid < amount <= player.money:
+                moves.append((monopoly.ACTION_BID * monopoly.ACTION_ARGS, amount))
+        moves.append((monopoly.ACTION_WITHDRAW * monopoly.ACTION_ARGS, 0))
+        return moves
+
+    end_phase = monopoly.ACTION_END_TURN * monopoly.ACTION_ARGS in legal
+    in_debt = player.money < 0
+    for code in legal:
+        kind = code // monopoly.ACTION_ARGS
+        if kind in (monopoly.ACTION_BUILD, monopoly.ACTION_UNMORTGAGE):
+            if not end_phase:
+                continue
+        elif kind in (monopoly.ACTION_SELL, monopoly.ACTION_MORTGAGE):
+            if not in_debt:
+                continue
+        elif kind in (monopoly.ACTION_PAY_JAIL, monopoly.ACTION_USE_JAIL_CARD):
+            if game.turn_taken:
+                continue
+        moves.append((code, 0))
+    return moves
+
+def apply_move(game: monopoly.Monopoly, move: MoveType) -> None:
+    """
+    Plays a move for the current player (see MoveType)
+    """
+    code, amount = move
+    if code == monopoly.ACTION_BID * monopoly.ACTION_ARGS:
+        game.poss_bid = amount
+    game.apply_action(code)
+
+def advance(game: monopoly.Monopoly) -> List[MoveType]:
+    """
+    Applies moves while the current player only has one to pick, stopping
+    early after MAX_FORCED_MOVES
+
+    Outputs:
+        List[MoveType]: The moves of the state it stopped at
+    """
+    moves = candidate_moves(game)
+    for _ in range(MAX_FORCED_MOVES):
+        if len(moves) != 1:
+            break
+        apply_move(game, moves[0])
+        moves = candidate_moves(game)
+    return moves
+
+def public_key(game: monopoly.Monopoly) -> bytes:
+    """
+    Returns the snapshot of the game with the chance and community chest
+    orders sorted, which identifies the state as far as the players can
+    see it (they know which cards are left, not their order)
+    """
+    chance_order = game.chance_order
+    community_chest_order = game.community_chest_order
+    game.chance_order = sorted(chance_order)
+    game.community_chest_order = sorted(community_chest_order)
+    key = game.to_bytes()
+    game.chance_order = chance_order
+    game.community_chest_order = community_chest_order
+    return key
+
+def determinize(game: monopoly.Monopoly, rng: random.Random) -> monopoly.Monopoly:
+    """
+    Returns a copy of the game with a new random stream and its remaining
+    chance and community chest cards reshuffled
+    """
+    child = game.fork(rng.getrandbits(64))
+    rng.shuffle(child.chance_order)
+    rng.shuffle(child.community_chest_order)
+    return child
+
+
+# Evaluation
+
+
+def evaluate(game: monopoly.Monopoly, income_turns: int = 20,
+    tables: Optional[analytics.RentTables] = None) -> ValuesType:
+    """
+    Scores a position for every player: 1 for the winner of a finished game,
+    otherwise each active player's share of the total worth of the active
+    players, where a player's worth is their cash, the value of their tiles
+    and houses and the rent they are expected to collect over income_turns
+    turns of each opponent
+
+    Inputs:
+        game: Monopoly: The position
+        income_turns: int: The number of opponent turns of rent counted
+        tables: Optional[RentTables]: The rent tables (defaults to
+            analytics.rent_tables())
+    Outputs:
+        ValuesType: The score of every player
+    """
+    values = [0.0] * game.num_players
+    if game.done:
+        values[game.active_players[0] - 1] = 1.0
+        return values
+
+    tables = analytics.rent_tables() if tables is None else tables
+    opponents = len(game.active_players) - 1
+    for pnum in game.active_players:
+        values[pnum - 1] = max(game.pdict[pnum].money, 0)
+    for tile in game.prop_dict.values():
+        owner = tile.owner
+        if owner is None or owner.pnum not in game.active_players:
+            continue
+        worth: float = tile.mortgage_price if tile.mortgaged else tile.price
+        if isinstance(tile, monopoly.Property):
+            worth += tile.houses * tile.house_price
+        worth += tables.tile_rent(tile, opponents) * income_turns
+        values[owner.pnum - 1] += worth
+
+    total = sum(values)
+    if total > 0:
+        values = [value / total for value in values]
+    return values
+
+def play_rollout(game: monopoly.Monopoly, turns: int) -> ValuesType:
+    """
+    Plays the given number of turns of the game with the default callbacks
+    and scores the result
+    """
+    simulate.Runner(max_turns = turns).play(game)
+    return evaluate(game)
+
+def rollout(task: RolloutType) -> ValuesType:
+    """
+    Plays a rollout inside a worker process, rebuilding the game from its
+    snapshot with the task's seed
+    """
+    data, seed, turns = task
+    return play_rollout(monopoly.Monopoly.from_bytes(data, seed), turns)
+
+
+# Search Tree
+
+
+class Node():
+    """
+    A decision of the search tree: the state reached (identified by its public
+    key), the player to move and the statistics of each of their moves
+    """
+
+    __slots__ = ("player", "moves", "visits", "totals", "outcomes")
+
+    def __init__(self, player: int, moves: List[MoveType]):
+        """
+        Parameters:
+            player: int: The player number of the player to move
+            moves: List[MoveType]: The moves of the state
+
+        Non-Parameter Attributes:
+            self.visits: List[int]: The number of iterations through each move
+            self.totals: List[float]: The sum of the mover's scores over those
+                iterations
+            self.outcomes: List[Dict[bytes, Node]]: The states each move has
+                led to, by public key (the chance node of the move)
+        """
+        self.player = player
+        self.moves = moves
+        self.visits = [0] * len(moves)
+        self.totals = [0.0] * len(moves)
+        self.outcomes: List[Dict[bytes, "Node"]] = [{} for _ in moves]
+
+    def select(self, exploration: float) -> int:
+        """
+        Picks the move to play next with UCB1, trying every move once first
+
+        Inputs:
+            exploration: float: The UCB1 exploration constant
+        Outputs:
+            int: The index of the move
+        """
+        visits = self.visits
+        if 0 in visits:
+            return visits.index(0)
+        log_parent = math.log(sum(visits))
+        totals = self.totals
+        return max(range(len(visits)), key = lambda index: totals[index] / visits[index]
+            + exploration * math.sqrt(log_parent / visits[index]))
+
+    def subtree(self) -> Iterable["Node"]:
+        """
+        Yields every node reachable from this one (including itself) once
+        """
+        seen = {id(self)}
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            for outcomes in node.outcomes:
+                for child in outcomes.values():
+                    if id(child) not in seen:
+                        seen.add(id(child))
+                        stack.append(child)
+
+
+# MCTS Policy
+
+
+class MCTSPolicy(bots.PlayerPolicy):
+    """
+    A bot that searches every decision with Monte Carlo tree search
+    """
+
+    def __init__(self, budget: float = 0.05, rollout_turns: int = 16,
+        exploration: float = 0.5, processes: Optional[int] = None,
+        batch_size: int = 4, seed: Optional[int] = None):
+        """
+        Parameters:
+            budget: float: The wall clock seconds spent on each decision
+            rollout_turns: int: The number of turns each rollout plays before
+                the position is scored
+            exploration: float: The UCB1 exploration constant
+            processes: Optional[int]: The number of rollout worker processes
+                (defaults to the number of cores), 1 or less runs the rollouts
+                in this process
+            batch_size: int: The number of rollouts sent to each worker at once
+            seed: Optional[int]: The seed of the search's random stream
+
+        Non-Parameter Attributes:
+            self.nodes: Dict[bytes, Node]: The nodes of the last search by
+                public key, used to reuse the tree between decisions
+            self.iterations: int: The number of iterations of the last search
+            self.pool: Optional[Pool]: The rollout workers (started on the
+                first search)
+        """
+        self.budget = budget
+        self.rollout_turns = rollout_turns
+        self.exploration = exploration
+        self.processes = (processes if processes is not None
+            else multiprocessing.cpu_count())
+        self.batch_size = batch_size
+        self.rng = random.Random(seed)
+        self.nodes: Dict[bytes, Node] = {}
+        self.iterations = 0
+        self.pool: Optional[multiprocessing.pool.Pool] = None
+
+    def close(self) -> None:
+        """
+        Shuts down the rollout workers and drops the search tree
+        """
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool.join()
+            self.pool = None
+        self.nodes = {}
+
+    def search(self, game: monopoly.Monopoly, kinds: Sequence[int]) -> Optional[MoveType]:
+        """
+        Searches from the current state for the budget and returns the best
+        scoring move among the ones of the given kinds
+
+        The moves at the root are not picked with UCB1, each round plays all
+        of them from the same determinization (same decks and dice stream)
+        so that they are compared on the same luck, which matters far more
+        than exploration with the few dozen rollouts a 50ms budget allows
+
+        Inputs:
+            game: Monopoly: The game (left unchanged)
+            kinds: Sequence[int]: The action kinds of the moves that answer
+                the decision being made
+        Outputs:
+            Optional[MoveType]: The chosen move, None if no move has one of
+                the kinds
+        """
+        deadline = time.perf_counter() + self.budget
+        key = public_key(game)
+        root = self.nodes.get(key)
+        if root is None:
+            root = Node(game.turn, candidate_moves(game))
+        allowed = [index for index, (code, _) in enumerate(root.moves)
+            if code // monopoly.ACTION_ARGS in kinds]
+        if len(allowed) <= 1:
+            return root.moves[allowed[0]] if allowed else None
+
+        # Keep only the part of the old tree that is reachable from here
+        self.nodes = {key: root}
+        for node in root.subtree():
+            for outcomes in node.outcomes:
+                self.nodes.update(outcomes)
+
+        workers = self.processes if self.processes > 1 else 0
+        if workers and self.pool is None:
+            self.pool = multiprocessing.Pool(workers)
+
+        self.iterations = 0
+        rounds = max(1, max(workers, 1) * self.batch_size // len(allowed))
+        while time.perf_counter() < deadline:
+            seeds = [self.rng.getrandbits(64) for _ in range(rounds)]
+            batch = [self.__descend(game, root, index, seed)
+                for seed in seeds for index in allowed]
+            if self.pool is not None:
+                tasks = [(leaf.to_bytes(), seeds[number // len(allowed)],
+                    self.rollout_turns) for number, (_, leaf) in enumerate(batch)]
+                results = self.pool.map(rollout, tasks, self.batch_size)
+            else:
+                # The leaves are already private copies with their own streams
+                results = [play_rollout(leaf, self.rollout_turns)
+                    for _, leaf in batch]
+
+            for (path, _), values in zip(batch, results):
+                for node, index in path:
+                    node.totals[index] += values[node.player - 1]
+            self.iterations += len(batch)
+
+        return root.moves[max(allowed,
+            key = lambda index: root.totals[index] / max(root.visits[index], 1))]
+
+    def __descend(self, game: monopoly.Monopoly, root: Node, first: int,
+        seed: int) -> Tuple[List[Tuple[Node, int]], monopoly.Monopoly]:
+        """
+        Plays one iteration down the tree from a copy of the game determinized
+        with the given seed, starting with the root move at index first and
+        adding the first new state reached as a leaf. Visits are counted on
+        the way down so that the rest of a batch spreads out
+
+        Outputs:
+            Tuple[List[Tuple[Node, int]], Monopoly]: The (node, move index)
+                path taken and the leaf position to roll out from
+        """
+        game = determinize(game, random.Random(seed))
+        path = []
+        node = root
+        index = first
+        while True:
+            if node is not root:
+                index = node.select(self.exploration)
+            node.visits[index] += 1
+            path.append((node, index))
+
+            apply_move(game, node.moves[index])
+            moves = advance(game)
+            if not moves:
+                break
+            key = public_key(game)
+            outcomes = node.outcomes[index]
+            child = outcomes.get(key)
+            if child is None:
+                child = self.nodes.get(key)
+                if child is None:
+                    child = Node(game.turn, moves)
+                    self.nodes[key] = child
+                    outcomes[key] = child
+                    break
+                outcomes[key] = child
+            node = child
+        return path, game
+
+    # Decisions
+
+    def decide_buy(self, game: monopoly.Monopoly, tile: monopoly.BuyableTileType) -> bool:
+        """
+        Searches buying against auctioning
+        """
+        move = self.search(game, (monopoly.ACTION_BUY, monopoly.ACTION_START_AUCTION))
+        return move is not None and move[0] // monopoly.ACTION_ARGS == monopoly.ACTION_BUY
+
+    def decide_auction_bid(self, game: monopoly.Monopoly) -> int:
+        """
+        Searches the bid moves against withdrawing (0 withdraws)
+        """
+        move = self.search(game, (monopoly.ACTION_BID, monopoly.ACTION_WITHDRAW))
+        return 0 if move is None else move[1]
+
+    def decide_build(self, game: monopoly.Monopoly) -> Optional[monopoly.Property]:
+        """
+        Searches each house that can be built against ending the turn
+        """
+        move = self.search(game, (monopoly.ACTION_BUILD, monopoly.ACTION_END_TURN))
+        if move is None or move[0] // monopoly.ACTION_ARGS != monopoly.ACTION_BUILD:
+            return None
+        prop = game.prop_dict[move[0] % monopoly.ACTION_ARGS]
+        assert isinstance(prop, monopoly.Property)
+        return prop
+
+    def decide_mortgage(self, game: monopoly.Monopoly) -> Optional[monopoly.BuyableTileType]:
+        """
+        Searches each house sale and mortgage
+        """
+        move = self.search(game, (monopoly.ACTION_SELL, monopoly.ACTION_MORTGAGE))
+        if move is None:
+            return None
+        return game.prop_dict[move[0] % monopoly.ACTION_ARGS]
+
+    def decide_jail(self, game: monopoly.Monopoly) -> bool:
+        """
+        Searches leaving jail against rolling for doubles
+        """
+        move = self.search(game, (monopoly.ACTION_ROLL, monopoly.ACTION_PAY_JAIL,
+            monopoly.ACTION_USE_JAIL_CARD))
+        return move is not None and move[0] // monopoly.ACTION_ARGS != monopoly.ACTION_ROLL
+
+
+def main() -> None:
+    """
+    Plays an MCTS bot against other policies and prints the report
+    """
+    parser = argparse.ArgumentParser(description = "Monopoly MCTS bot")
+    parser.add_argument("opponents", nargs = "*", help = "the policies of the "
+        f"other players, from {', '.join(sorted(bots.POLICIES))} (defaults to "
+        "rent)")
+    parser.add_argument("-n", "--games", type = int, default = 10)
+    parser.add_argument("-b", "--budget", type = float, default = 0.05,
+        help = "seconds per decision")
+    parser.add_argument("-j", "--processes", type = int, default = None)
+    parser.add_argument("-t", "--max-turns", type = int, default = 1000)
+    parser.add_argument("-s", "--seed", type = int, default = None)
+    args = parser.parse_args()
+    if not args.opponents:
+        args.opponents = ["rent"]
+    for name in args.opponents:
+        if name not in bots.POLICIES:
+            parser.error(f"unknown policy {name}")
+
+    policy = MCTSPolicy(args.budget, processes = args.processes, seed = args.seed)
+    selfplay = bots.SelfPlay([policy] + [bots.POLICIES[name]()
+        for name in args.opponents], max_turns = args.max_turns)
+    print("Players: " + ", ".join(f"{index + 1} = {name}"
+        for index, name in enumerate(["mcts"] + args.opponents)))
+    try:
+        print(selfplay.run(args.games, args.seed))
+    finally:
+        policy.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,10 @@
 """
 Monopoly Implementation
 """
-from typing import List, Tuple, Optional, Set, Callable, Dict, Union
+from typing import (List, Tuple, Optional, Set, Callable, Dict, Union, Iterator,
+    KeysView)
 import random
-import copy
+import struct
 
 """
 A png in the form images/image-name.png, used to pull an image from the images
@@ -48,6 +49,19 @@ RGBDICT: Dict[int, Tuple[int, int, int]] = {
     21: (0, 0, 139),
     22: (0, 0, 139)}
 
+"""
+Ownership groups counted by Player.owned: the color groups use their colornum
+(0-7), followed by the railroads and the utilities
+"""
+RAILROAD_GROUP = 8
+UTILITY_GROUP = 9
+NUM_GROUPS = 10
+
+"""
+GROUP_SIZES: Tuple[int, ...]: The number of tiles in each ownership group
+"""
+GROUP_SIZES: Tuple[int, ...] = (2, 3, 3, 3, 3, 3, 3, 2, 4, 2)
+
 
 # Tile Base Class
 
@@ -55,37 +69,125 @@ RGBDICT: Dict[int, Tuple[int, int, int]] = {
 class Tile():
     """
     A class representing a basic game-tile
-    Parameters:
+    Attributes:
         name: str: The name of the tile
-        pos: Tuple[int, int]: A tuple representing the (quadrant, distance
-            along the quadrant) on the game board
+        pos: int: The tile's index on the game board, from 0 (Mediterranean
+            Avenue) to 39 (Go), see quadrant_pos for the (quadrant, distance
+            along the quadrant) form used for drawing
         image: imagetype: a pathway that specifies the image displayed on the tile
+
+    Tiles (and the other per-game objects) use __slots__ rather than a
+    __dict__. Every game holds its own copy of the buyable tiles, so those
+    keep what never changes about them in shared tables (see BuyableTile)
     """
 
-    def __init__(self, name: str, pos: Tuple[int, int], image: imagetype):
-        self.name = name
-        self.pos = pos
-        self.image = image
+    __slots__ = ()
+
+    name: str
+    pos: int
+    image: imagetype
+
+
+# Board Positions
+
+"""
+The number of tiles on the board, the number of tiles in a quadrant, and the
+positions of Go and Jail
+"""
+BOARD_SIZE = 40
+QUADRANT_SIZE = 10
+GO_POS = 39
+JAIL_POS = 9
+
+def quadrant_pos(pos: int) -> Tuple[int, int]:
+    """
+    Converts a board index into the (quadrant, distance along the quadrant)
+    form, where each quadrant ends on a corner tile
+    """
+    return divmod(pos, QUADRANT_SIZE)
+
+def board_pos(quad: int, dist: int) -> int:
+    """
+    Converts a (quadrant, distance along the quadrant) position into a board
+    index
+    """
+    return quad * QUADRANT_SIZE + dist
+
+
+# Buyable Tiles
+
+"""
+BUYABLE_INFO: Dict[int, Tuple[str, int, imagetype]]: The name, position and
+    image of each buyable tile by property number, filled in as the tiles are
+    constructed below
+"""
+BUYABLE_INFO: Dict[int, Tuple[str, int, imagetype]] = {}
+
+
+class BuyableTile(Tile):
+    """
+    The base class of the tiles that can be owned. Their name, position and
+    image are read from BUYABLE_INFO, so the copies of a tile made for each
+    game (see fresh) only hold its property number, state and the attributes
+    read on every turn
+    """
+
+    __slots__ = ("propnum", "owner", "mortgaged")
+
+    def __init__(self, name: str, pos: int, image: imagetype, propnum: int):
+        """
+        Parameters:
+            name, pos, image: see tile base class
+            propnum: int: The property number associated with the tile in the
+                property dictionary created below
+        Non-Parameter Attributes:
+            self.owner: Optional[Player]: The player object that owns the tile
+            self.mortgaged: bool: Whether the tile is mortgaged or not
+        """
+        BUYABLE_INFO[propnum] = (name, pos, image)
+        self.propnum = propnum
+        self.owner: Optional["Player"] = None
+        self.mortgaged = False
+
+    @property
+    def name(self) -> str: # type: ignore
+        """
+        See tile base class
+        """
+        return BUYABLE_INFO[self.propnum][0]
+
+    @property
+    def pos(self) -> int: # type: ignore
+        """
+        See tile base class
+        """
+        return BUYABLE_INFO[self.propnum][1]
+
+    @property
+    def image(self) -> imagetype: # type: ignore
+        """
+        See tile base class
+        """
+        return BUYABLE_INFO[self.propnum][2]
 
 
 # Properties
 
 
-class Property(Tile):
+class Property(BuyableTile):
     """
     A class representing a color property tile
     """
 
-    def __init__(self, name: str, pos: Tuple[int, int], image: imagetype,
+    __slots__ = ("price", "rents", "house_price", "group", "houses")
+
+    def __init__(self, name: str, pos: int, image: imagetype,
         propnum: int, cost: int, r0: int, r1: int, r2: int, r3: int, r4: int,
         rh: int, hp: int):
 
         """
         Parameters:
-            name, pos, image: see tile base class
-
-            propnum: int: The property number associated with it in the property
-                dictionary created below
+            name, pos, image, propnum: see BuyableTile
             cost: int: the purchase price of the property
             r0 - r4: int: The rent paid on the property with the following number
                 referring to the number of houses (eg. r0 is rent with 0 houses,
@@ -94,41 +196,75 @@ class Property(Tile):
             hp: int: House Price, the price to build a house on the property
 
         Non-Parameter Attributes:
-            self.rents: Dict[int, int]: A dictionary to store the associated rents
+            self.rents: Tuple[int, ...]: The rents indexed by the number of
+                houses (5 is a hotel)
             self.houses: int: The number of houses on the property
-            self.owner: Optional[Player]: The player object that owns the property
-            self.mortgage_price: int: The amount the property can be mortgaged for
-            self.mortgaged: bool: Whether the property is mortgaged or not
-            self.color: Tuple[int, int, int]: The RGB value associated with the
-                property's color group
-            self.colornum: int: The integer representation of the property's color
-                group (eg. Baltic + Med. = group 0, light blues = group 1...)
-            self.monop: bool: Whether the owner of the property owns all the others
-                of the same color group (None notes the absence of an owner and thus
-                the absence of a monopoly)
-        """
-
-        super().__init__(name, pos, image)
-        self.propnum = propnum
+            self.group: int: The ownership group counted by Player.owned (the
+                same as colornum)
+        """
+
+        super().__init__(name, pos, image, propnum)
 
         self.price = cost
-        self.rents = {}
-        self.rents[0] = r0
-        self.rents[1] = r1
-        self.rents[2] = r2
-        self.rents[3] = r3
-        self.rents[4] = r4
-        self.rents[5] = rh
+        self.rents = (r0, r1, r2, r3, r4, rh)
 
         self.house_price = hp
 
         self.houses = 0
-        self.owner: Optional["Player"] = None
-        self.mortgage_price = cost // 2
+        self.group = propnum // 3
+
+    def fresh(self) -> "Property":
+        """
+        Returns an unowned, undeveloped copy of the property for a new game,
+        sharing the attributes that never change (like the rents)
+        """
+        prop = Property.__new__(Property)
+        prop.propnum = self.propnum
+        prop.price = self.price
+        prop.rents = self.rents
+        prop.house_price = self.house_price
+        prop.group = self.group
+        prop.reset()
+        return prop
+
+    def reset(self) -> None:
+        """
+        Returns the property to the bank with no houses on it
+        """
+        self.houses = 0
+        self.owner = None
         self.mortgaged = False
-        self.color = RGBDICT[self.propnum]
-        self.colornum = propnum // 3
-        self.monop: bool = False
+
+    @property
+    def mortgage_price(self) -> int:
+        """
+        The amount the property can be mortgaged for
+        """
+        return self.price // 2
+
+    @property
+    def colornum(self) -> int:
+        """
+        The integer representation of the property's color group (eg. Baltic
+        + Med. = group 0, light blues = group 1...)
+        """
+        return self.group
+
+    @property
+    def color(self) -> Tuple[int, int, int]:
+        """
+        The RGB value associated with the property's color group
+        """
+        return RGBDICT[self.propnum]
+
+    @property
+    def monop(self) -> bool:
+        """
+        Whether the owner of the property owns all the others of the same
+        color group (False if the property has no owner)
+        """
+        return (self.owner is not None
+            and self.owner.owned[self.group] == GROUP_SIZES[self.group])
 
     def rent(self) -> int:
         """
@@ -158,107 +294,118 @@ class Property(Tile):
 ### Construction of individual property objects (Thanks chatgpt) ###
 
 # Brown Properties
-mediterranean_ave = Property("Mediterranean Avenue", (0, 0),
+mediterranean_ave = Property("Mediterranean Avenue", 0,
                             "images/DARK_PURPLE.png",
                             1, 60, 2, 10, 30, 90, 160, 250, 50)
-baltic_ave = Property("Baltic Avenue", (0, 2), "images/DARK_PURPLE.png",
+baltic_ave = Property("Baltic Avenue", 2, "images/DARK_PURPLE.png",
                     2, 60, 4, 20, 60, 180, 320, 450, 50)
 
 # Light Blue Properties
-oriental_ave = Property("Oriental Avenue", (0, 5), "images/LIGHT_BLUE.png",
+oriental_ave = Property("Oriental Avenue", 5, "images/LIGHT_BLUE.png",
                         3, 100, 6, 30, 90, 270, 400, 550, 50)
-vermont_ave = Property("Vermont Avenue", (0, 7), "images/LIGHT_BLUE.png",
+vermont_ave = Property("Vermont Avenue", 7, "images/LIGHT_BLUE.png",
                     4, 100, 6, 30, 90, 270, 400, 550, 50)
-connecticut_ave = Property("Connecticut Avenue", (0, 8),
+connecticut_ave = Property("Connecticut Avenue", 8,
                         "images/LIGHT_BLUE.png",
                         5, 120, 8, 40, 100, 300, 450, 600, 50)
 
 # Pink Properties
-st_charles_place = Property("St. Charles Place", (1, 0),
+st_charles_place = Property("St. Charles Place", 10,
                             "images/LIGHT_PURPLE.png",
                             6, 140, 10, 50, 150, 450, 625, 750, 100)
-states_ave = Property("States Avenue", (1, 2), "images/LIGHT_PURPLE.png",
+states_ave = Property("States Avenue", 12, "images/LIGHT_PURPLE.png",
                     7, 140, 10, 50, 150, 450, 625, 750, 100)
-virginia_ave = Property("Virginia Avenue", (1, 3), "images/LIGHT_PURPLE.png",
+virginia_ave = Property("Virginia Avenue", 13, "images/LIGHT_PURPLE.png",
                         8, 160, 12, 60, 180, 500, 700, 900, 100)
 
 # Orange Properties
-st_james_place = Property("St. James Place", (1, 5),
+st_james_place = Property("St. James Place", 15,
                         "images/ORANGE.png",
                         9, 180, 14, 70, 200, 550, 750, 950, 100)
-tennessee_ave = Property("Tennessee Avenue", (1, 7),
+tennessee_ave = Property("Tennessee Avenue", 17,
                         "images/ORANGE.png",
                         10, 180, 14, 70, 200, 550, 750, 950, 100)
-new_york_ave = Property("New York Avenue", (1, 8),
+new_york_ave = Property("New York Avenue", 18,
                         "images/ORANGE.png",
                         11, 200, 16, 80, 220, 600, 800, 1000, 100)
 
 # Red Properties
-kentucky_ave = Property("Kentucky Avenue", (2, 0), "images/RED.png",
+kentucky_ave = Property("Kentucky Avenue", 20, "images/RED.png",
                         12, 220, 18, 90, 250, 700, 875, 1050, 150)
-indiana_ave = Property("Indiana Avenue", (2, 2), "images/RED.png",
+indiana_ave = Property("Indiana Avenue", 22, "images/RED.png",
                     13, 220, 18, 90, 250, 700, 875, 1050, 150)
-illinois_ave = Property("Illinois Avenue", (2, 3), "images/RED.png",
+illinois_ave = Property("Illinois Avenue", 23, "images/RED.png",
                         14, 240, 20, 100, 300, 750, 925, 1100, 150)
 
 # Yellow Properties
-atlantic_ave = Property("Atlantic Avenue", (2, 5), "images/YELLOW.png",
+atlantic_ave = Property("Atlantic Avenue", 25, "images/YELLOW.png",
                         15, 260, 22, 110, 330, 800, 975, 1150, 150)
-ventnor_ave = Property("Ventnor Avenue", (2, 6), "images/YELLOW.png",
+ventnor_ave = Property("Ventnor Avenue", 26, "images/YELLOW.png",
                     16, 260, 22, 110, 330, 800, 975, 1150, 150)
-marvin_gardens = Property("Marvin Gardens", (2, 8),
+marvin_gardens = Property("Marvin Gardens", 28,
                         "images/YELLOW.png",
                         17, 280, 24, 120, 360, 850, 1025, 1200, 150)
 
 # Green Properties
-pacific_ave = Property("Pacific Avenue", (3, 0), "images/GREEN.png",
+pacific_ave = Property("Pacific Avenue", 30, "images/GREEN.png",
                     18, 300, 26, 130, 390, 900, 1100, 1275, 200)
-north_carolina_ave = Property("North Carolina Avenue", (3, 1),
+north_carolina_ave = Property("North Carolina Avenue", 31,
                             "images/GREEN.png",
                             19, 300, 26, 130, 390, 900, 1100, 1275, 200)
-pennsylvania_ave = Property("Pennsylvania Avenue", (3, 3),
+pennsylvania_ave = Property("Pennsylvania Avenue", 33,
                             "images/GREEN.png",
                             20, 320, 28, 150, 450, 1000, 1200, 1400, 200)
 
 # Blue Properties
-park_place = Property("Park Place", (3, 6), "images/DARK_BLUE.png",
+park_place = Property("Park Place", 36, "images/DARK_BLUE.png",
                     21, 350, 35, 175, 500, 1100, 1300, 1500, 200)
-boardwalk = Property("Boardwalk", (3, 8), "images/DARK_BLUE.png",
+boardwalk = Property("Boardwalk", 38, "images/DARK_BLUE.png",
                     22, 400, 50, 200, 600, 1400, 1700, 2000, 200)
 
 
 # Utilities
 
 
-class Utility(Tile):
+class Utility(BuyableTile):
     """
     A class to represent utility tiles
+
+    Class Attributes:
+        price: int: The price of the utility
+        group: int: The ownership group counted by Player.owned
+        mortgage_price: int: The money gained when mortgaging the utility
     """
 
-    def __init__(self, name: str, pos: Tuple[int, int], image: str,
-        propnum: int):
+    __slots__ = ()
+
+    price = 150
+    group = UTILITY_GROUP
+    mortgage_price = 75
+
+    def fresh(self) -> "Utility":
         """
-        Parameters:
-            name, pos, image: see tile base class
-            propnum: int: The property number associated with the utility in the
-            propdict below
-        Non-Parameter Attributes:
-            self.price: int: The price of the utility
-            self.owner: Player: the player object that owns the utility
-            self.both: bool: Whether both utilities are owned by the same player
-            self.mortgage_price: int: The money gained when mortgaging the utility
-            self.mortgaged: bool: Whether the utility is mortgaged
+        Returns an unowned copy of the utility for a new game
         """
+        utility = Utility.__new__(Utility)
+        utility.propnum = self.propnum
+        utility.reset()
+        return utility
 
-        super().__init__(name, pos, image)
-        self.price = 150
-        self.propnum = propnum
-
-        self.owner: Optional["Player"] = None
-        self.both = False
-        self.mortgage_price = self.price // 2
+    def reset(self) -> None:
+        """
+        Returns the utility to the bank
+        """
+        self.owner = None
         self.mortgaged = False
 
+    @property
+    def both(self) -> bool:
+        """
+        Whether both utilities are owned by the same player
+        """
+        return (self.owner is not None
+            and self.owner.owned[self.group] == GROUP_SIZES[self.group])
+
     def rent(self, dieroll: int) -> int:
         """
         Rent charged for landing on the utility
@@ -275,52 +422,59 @@ class Utility(Tile):
 
 ### Construction of individual utility tiles ###
 
-ELECTRIC_COMPANY = Utility("Electric Company", (1,1), "images/Better_Electric.png",
+ELECTRIC_COMPANY = Utility("Electric Company", 11, "images/Better_Electric.png",
                             23)
-WATER_WORKS = Utility("Water Works", (2,7), "images/WATERWORKS.png",
+WATER_WORKS = Utility("Water Works", 27, "images/WATERWORKS.png",
                             24)
 
 
 # Railroads
 
 
-class Railroad(Tile):
+class Railroad(BuyableTile):
     """
     A class representing railroad tiles
+
+    Class Attributes:
+        price: int: The price of the railroad
+        group: int: The ownership group counted by Player.owned
+        mortgage_price: int: The money gained when mortgaging the railroad
+        rents: Tuple[int, ...]: The rent charged indexed by the number of
+            railroads owned (index 0 is unused)
     """
-    def __init__(self, name: str, pos: Tuple[int, int], image: imagetype,
-        propnum: int):
 
-        """
-        Parameters:
-            name, pos, image: see tile base class
-            propnum: int: The property number associated with the railroad in the
-            propdict below
-        Non-Parameter Attributes:
-            self.price: int: The price of the railroad
-            self.owner: Player: the player object that owns the utility
-            self.num_owned: int: The number of total railroads owned by the player
-                who owns this railroad
-            self.mortgage_price: int: The money gained when mortgaging the railroad
-            self.mortgaged: bool: Whether the railroad is mortgaged
-            self.rents: Dict[int, int]: A dictionary mapping the number of railroads
-                owned to the rent charged
-        """
+    __slots__ = ()
 
-        super().__init__(name, pos, image)
+    price = 200
+    group = RAILROAD_GROUP
+    mortgage_price = 100
+    rents = (0, 25, 50, 100, 200)
 
-        self.price = 200
-        self.propnum = propnum
-        self.owner: Optional["Player"] = None
+    def fresh(self) -> "Railroad":
+        """
+        Returns an unowned copy of the railroad for a new game
+        """
+        railroad = Railroad.__new__(Railroad)
+        railroad.propnum = self.propnum
+        railroad.reset()
+        return railroad
 
-        self.num_owned = 1
-        self.mortgage_price = 100
+    def reset(self) -> None:
+        """
+        Returns the railroad to the bank
+        """
+        self.owner = None
         self.mortgaged = False
 
-        self.rents = {1: 25,
-            2: 50,
-            3: 100,
-            4: 200}
+    @property
+    def num_owned(self) -> int:
+        """
+        The number of total railroads owned by the player who owns this
+        railroad (1 if it has no owner)
+        """
+        if self.owner is None:
+            return 1
+        return self.owner.owned[self.group]
 
     def rent(self) -> int:
         """
@@ -335,13 +489,13 @@ class Railroad(Tile):
 
 ### Construction of individual railroads ###
 
-READING_RAILROAD = Railroad("Reading Railroad", (0, 4), "images/RAILROAD.png",
+READING_RAILROAD = Railroad("Reading Railroad", 4, "images/RAILROAD.png",
     25)
-PENNSYLVANIA_RAILROAD = Railroad("Pennsylvania Railroad", (1, 4), "images/RAILROAD.png",
+PENNSYLVANIA_RAILROAD = Railroad("Pennsylvania Railroad", 14, "images/RAILROAD.png",
     26)
-BO_RAILROAD = Railroad("B&O Railroad", (2, 4), "images/RAILROAD.png",
+BO_RAILROAD = Railroad("B&O Railroad", 24, "images/RAILROAD.png",
     27)
-SHORTLINE_RAILROAD = Railroad("Shortline Railroad", (3, 4), "images/RAILROAD.png",
+SHORTLINE_RAILROAD = Railroad("Shortline Railroad", 34, "images/RAILROAD.png",
     28)
 
 
@@ -352,11 +506,17 @@ class CommunityChestTile(Tile):
     """
     Class for representing a community chest tile
     """
-    def __init__(self, pos: Tuple[int, int]):
+
+    __slots__ = ("pos",)
+
+    name = "Community Chest"
+    image = "images/COMMUNITY_CHEST.png"
+
+    def __init__(self, pos: int):
         """
         See Tile base class
         """
-        super().__init__("Community Chest", pos, "images/COMMUNITY_CHEST.png" )
+        self.pos = pos
 
 
 class ChanceTile(Tile):
@@ -364,23 +524,27 @@ class ChanceTile(Tile):
     Class for representing a chance tile
     """
 
-    def __init__(self, pos: Tuple[int, int]):
+    __slots__ = ("pos",)
+
+    name = "Chance"
+    image = "images/CHANCE.png"
+
+    def __init__(self, pos: int):
         """
         See Tile base class
         """
-
-        super().__init__("Chance", pos, "images/CHANCE.png" )
+        self.pos = pos
 
 
 ### Construction of community chest/chance tiles ###
 
-COMMUNITY_CHEST_TILE1 = CommunityChestTile((0,1))
-COMMUNITY_CHEST_TILE2 = CommunityChestTile((1,6))
-COMMUNITY_CHEST_TILE3 = CommunityChestTile((3,2))
+COMMUNITY_CHEST_TILE1 = CommunityChestTile(1)
+COMMUNITY_CHEST_TILE2 = CommunityChestTile(16)
+COMMUNITY_CHEST_TILE3 = CommunityChestTile(32)
 
-CHANCE_TILE1 = ChanceTile((0,6))
-CHANCE_TILE2 = ChanceTile((2,1))
-CHANCE_TILE3 = ChanceTile((3,5))
+CHANCE_TILE1 = ChanceTile(6)
+CHANCE_TILE2 = ChanceTile(21)
+CHANCE_TILE3 = ChanceTile(35)
 
 # Event Tiles
 
@@ -388,14 +552,19 @@ class EventTile(Tile):
     """
     Class to represent the event_tiles
     """
-    def __init__(self, name: str, pos: Tuple[int, int], image: imagetype,
+
+    __slots__ = ("name", "pos", "image", "effect")
+
+    def __init__(self, name: str, pos: int, image: imagetype,
         effect: Callable[["Monopoly"], None]):
         """
         Parameters:
             name, pos, image: see tile base class
             effect: Callable[["Monopoly"], None]: The effect that landing on the tile has on the game
         """
-        super().__init__(name, pos, image)
+        self.name = name
+        self.pos = pos
+        self.image = image
         self.effect = effect
 
     def apply_tile(self, game: "Monopoly"):
@@ -448,38 +617,46 @@ def luxury_tax(game: "Monopoly"):
     game.player_turn.money -= 75
     game.center_money += 200
 
-GO_TILE = EventTile("Go", (3,9), "images/GO_TILE.png", go_tile)
-JAIL_TILE = EventTile("Jail", (0,9), "images/JAIL_TILE.png", jail_tile)
-FREE_PARKING = EventTile("Free Parking", (1,9), "images/FREE_PARKING.png", free_parking)
-GO_TO_JAIL = EventTile("Go to Jail", (2,9), "images/GO_TO_JAIL.png", go_to_jail_tile)
-INCOME_TAX = EventTile("Income Tax", (0,3), "images/INCOME_TAX.png", income_tax)
-LUXURY_TAX = EventTile("Luxury Tax", (3,7), "images/LUXURY_TAX.png", luxury_tax)
+GO_TILE = EventTile("Go", 39, "images/GO_TILE.png", go_tile)
+JAIL_TILE = EventTile("Jail", 9, "images/JAIL_TILE.png", jail_tile)
+FREE_PARKING = EventTile("Free Parking", 19, "images/FREE_PARKING.png", free_parking)
+GO_TO_JAIL = EventTile("Go to Jail", 29, "images/GO_TO_JAIL.png", go_to_jail_tile)
+INCOME_TAX = EventTile("Income Tax", 3, "images/INCOME_TAX.png", income_tax)
+LUXURY_TAX = EventTile("Luxury Tax", 37, "images/LUXURY_TAX.png", luxury_tax)
 
 # Game Board
 """
-STARTBOARD: List[List[GameTileType]]: A List of Lists with each list representing
-    a quadrant, and each item within a quadrant list being a game tile, starting
-    with mediterranean at STARTBOARD[0][0] and going all the way to the GO_TILE
-    at [3][9]
+STARTBOARD: List[GameTileType]: A List of the 40 game tiles indexed by their
+    position, starting with mediterranean at STARTBOARD[0] and going all the way
+    to the GO_TILE at STARTBOARD[39]
 """
-STARTBOARD: List[List[GameTileType]] = [
+STARTBOARD: List[GameTileType] = [
     # Quadrant 0
-    [mediterranean_ave, COMMUNITY_CHEST_TILE1, baltic_ave, INCOME_TAX,
+    mediterranean_ave, COMMUNITY_CHEST_TILE1, baltic_ave, INCOME_TAX,
         READING_RAILROAD, oriental_ave, CHANCE_TILE1, vermont_ave, connecticut_ave,
-        JAIL_TILE],
+        JAIL_TILE,
     # Quadrant 1
-    [st_charles_place, ELECTRIC_COMPANY, states_ave, virginia_ave,
+    st_charles_place, ELECTRIC_COMPANY, states_ave, virginia_ave,
         PENNSYLVANIA_RAILROAD, st_james_place, COMMUNITY_CHEST_TILE2,
-        tennessee_ave, new_york_ave, FREE_PARKING],
+        tennessee_ave, new_york_ave, FREE_PARKING,
     # Quadrant 2
-    [kentucky_ave, CHANCE_TILE2, indiana_ave, illinois_ave,
+    kentucky_ave, CHANCE_TILE2, indiana_ave, illinois_ave,
         BO_RAILROAD, atlantic_ave, ventnor_ave, WATER_WORKS,
-        marvin_gardens, GO_TO_JAIL],
+        marvin_gardens, GO_TO_JAIL,
     # Quadrant 3
-    [pacific_ave, north_carolina_ave, COMMUNITY_CHEST_TILE3, pennsylvania_ave,
+    pacific_ave, north_carolina_ave, COMMUNITY_CHEST_TILE3, pennsylvania_ave,
         SHORTLINE_RAILROAD, CHANCE_TILE3, park_place, LUXURY_TAX,
         boardwalk, GO_TILE]
-        ]
+
+"""
+BUYABLE_TEMPLATE: List[Tuple[int, int]]: The (position, propnum) of every
+    buyable tile on STARTBOARD in board order. Only these tiles hold per-game
+    state, every other tile is shared between games
+"""
+BUYABLE_TEMPLATE: List[Tuple[int, int]] = [
+    (pos, tile.propnum)
+    for pos, tile in enumerate(STARTBOARD)
+    if isinstance(tile, (Property, Railroad, Utility))]
 
 # Property Dictionary
 """
@@ -516,6 +693,79 @@ PROPDICT = {
     27: BO_RAILROAD,
     28: SHORTLINE_RAILROAD}
 
+"""
+COLOR_GROUPS: List[Tuple[int, ...]]: The property numbers in each color group,
+    indexed by colornum (eg. COLOR_GROUPS[0] is (1, 2), Mediterranean and Baltic)
+"""
+COLOR_GROUPS: List[Tuple[int, ...]] = [
+    tuple(propnum for propnum, prop in PROPDICT.items()
+        if isinstance(prop, Property) and prop.colornum == colornum)
+    for colornum in range(max(prop.colornum for prop in PROPDICT.values()
+        if isinstance(prop, Property)) + 1)]
+
+"""
+PROPNUM_POSITIONS: Dict[int, int]: The board position of each property
+    number, in board order like BUYABLE_TEMPLATE
+COLOR_GROUP_POSITIONS: List[Tuple[int, ...]]: The board positions of each
+    color group (see COLOR_GROUPS)
+"""
+PROPNUM_POSITIONS: Dict[int, int] = {propnum: pos for pos, propnum in BUYABLE_TEMPLATE}
+COLOR_GROUP_POSITIONS: List[Tuple[int, ...]] = [
+    tuple(PROPNUM_POSITIONS[propnum] for propnum in group) for group in COLOR_GROUPS]
+
+
+class PropertyView():
+    """
+    A game's buyable tiles by property number, read from its board. It acts
+    like the dictionary of the tiles (in board order) without each game
+    holding one, see Monopoly.prop_dict
+    """
+
+    __slots__ = ("board",)
+
+    def __init__(self, board: List[GameTileType]):
+        """
+        Parameters:
+            board: List[GameTileType]: The board of the game
+        """
+        self.board = board
+
+    def __getitem__(self, propnum: int) -> BuyableTileType:
+        """
+        Returns the game's tile with the inputted property number
+
+        Raises:
+            KeyError if there is no such property number
+        """
+        return self.board[PROPNUM_POSITIONS[propnum]] # type: ignore
+
+    def __contains__(self, propnum: object) -> bool:
+        return propnum in PROPNUM_POSITIONS
+
+    def __len__(self) -> int:
+        return len(PROPNUM_POSITIONS)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(PROPNUM_POSITIONS)
+
+    def keys(self) -> KeysView[int]:
+        return PROPNUM_POSITIONS.keys()
+
+    def values(self) -> List[BuyableTileType]:
+        """
+        Returns the game's buyable tiles in board order
+        """
+        board = self.board
+        return [board[pos] for pos in PROPNUM_POSITIONS.values()] # type: ignore
+
+    def items(self) -> List[Tuple[int, BuyableTileType]]:
+        """
+        Returns the (property number, tile) pairs of the game in board order
+        """
+        board = self.board
+        return [(propnum, board[pos]) # type: ignore
+            for propnum, pos in PROPNUM_POSITIONS.items()]
+
 
 # Chance + Commmunity Chest Decks
 
@@ -578,7 +828,7 @@ def advance_to_go(game: "Monopoly"):
     Moves the player to go and gives them $200
     """
     game.passgo()
-    game.ploc[game.turn] = (3,9)
+    game.ploc[game.turn] = GO_POS
 def go_to_jail(game: "Monopoly"):
     """
     Sends the player to jail
@@ -632,6 +882,8 @@ class Player():
     Class to represent individual players
     """
 
+    __slots__ = ("pnum", "money", "proplist", "jail", "get_out", "owned")
+
     def __init__(self, pnum: int, money: int):
         """
         Parameters:
@@ -646,6 +898,9 @@ class Player():
                 jail, through 4 representing their 3rd turn in jail
             self.get_out: bool: a boolean tracking whether the player has a
                 get out of jail free card
+            self.owned: List[int]: The number of tiles the player owns in each
+                ownership group (see GROUP_SIZES), kept up to date by
+                Monopoly.transfer_property
         """
 
         self.pnum = pnum
@@ -653,6 +908,7 @@ class Player():
         self.proplist: List[BuyableTileType] = []
         self.jail: int = 0
         self.get_out: bool = False
+        self.owned: List[int] = [0] * NUM_GROUPS
     def __str__(self) -> str:
         """
         Returns a string of the player in the form "Player player.pnum"
@@ -690,6 +946,10 @@ class Auction():
             lists to represent the players who have not withdrawn from the
             auction
     """
+
+    __slots__ = ("saveturn", "active_players", "inactive_players", "game",
+        "prop", "current_bid")
+
     def __init__(self, prop: BuyableTileType, game: "Monopoly"):
         """
         Parameters:
@@ -705,8 +965,8 @@ class Auction():
         """
 
         self.saveturn = game.turn
-        self.active_players = copy.deepcopy(game.active_players)
-        self.inactive_players = copy.deepcopy(game.inactive_players)
+        self.active_players = list(game.active_players)
+        self.inactive_players = list(game.inactive_players)
         self.game = game
         self.prop = prop
         self.game.isauction = True
@@ -753,9 +1013,11 @@ class Auction():
 
             self.game.player_turn = self.game.pdict[self.game.turn]
 
-            self.prop.owner = self.game.player_turn
             self.game.player_turn.money -= self.current_bid
-            self.game.player_turn.proplist.append(self.prop)
+            self.game.transfer_property(self.prop, self.game.player_turn)
+            if self.game.recorder is not None:
+                self.game.recorder(EVENT_AUCTION_WON, self.game.turn,
+                    self.prop.propnum, 0, self.current_bid)
 
             self.game.isauction = False
             self.game.auction = None
@@ -774,6 +1036,167 @@ class Auction():
             self.game.player_turn = self.game.pdict[self.game.turn]
 
 
+# Action Codes
+
+"""
+Compact integer codes for the actions a player can take, used by
+Monopoly.legal_actions and Monopoly.apply_action. An action is encoded as
+kind * ACTION_ARGS + argument (see action_code), where the argument is the
+propnum for the tile actions (buy, start auction, build, sell, mortgage and
+unmortgage), the index into BID_CHANGES for ACTION_CHANGE_BID and 0 for the
+rest
+"""
+ACTION_ARGS = 32
+ACTION_ROLL = 0
+ACTION_END_TURN = 1
+ACTION_BUY = 2
+ACTION_START_AUCTION = 3
+ACTION_BID = 4
+ACTION_CHANGE_BID = 5
+ACTION_WITHDRAW = 6
+ACTION_PAY_JAIL = 7
+ACTION_USE_JAIL_CARD = 8
+ACTION_BANKRUPTCY = 9
+ACTION_BUILD = 10
+ACTION_SELL = 11
+ACTION_MORTGAGE = 12
+ACTION_UNMORTGAGE = 13
+
+"""
+BID_CHANGES: Tuple[int, ...]: The changes to poss_bid that ACTION_CHANGE_BID
+    can make (the same steps as the auction buttons)
+"""
+BID_CHANGES: Tuple[int, ...] = (1, -1, 10, -10, 100, -100)
+
+def action_code(kind: int, arg: int = 0) -> int:
+    """
+    Returns the action code for the given kind of action and argument
+    """
+    return kind * ACTION_ARGS + arg
+
+def action_kind(code: int) -> Tuple[int, int]:
+    """
+    Splits an action code into its (kind, argument)
+    """
+    return divmod(code, ACTION_ARGS)
+
+
+# Event Codes
+
+"""
+The events a game reports to its recorder (see Monopoly.recorder), which is
+called as recorder(kind, player, a, b, amount) with the player number the
+event is about and the rest depending on the kind:
+
+EVENT_GAME_START: a is the number of players, amount the starting cash
+EVENT_GAME_SEED: follows EVENT_GAME_START twice when the game was reset with
+    a seed from 0 to 2**64 - 1, a is 0 for the seed's low 32 bits and 1 for
+    its high 32 bits, amount those bits (as a signed integer)
+EVENT_ROLL: a and b are the dice
+EVENT_MOVE: a is the old position, b the new one, for moves made by a roll
+    or a card (being sent to jail is reported as EVENT_JAIL)
+EVENT_LAND: a is the position landed on by a roll
+EVENT_RENT: a is the owner paid, b the propnum, amount the rent
+EVENT_CARD: a is the deck (EVENT_DECK_CHANCE or EVENT_DECK_COMMUNITY_CHEST),
+    b the key of the card drawn
+EVENT_PASS_GO: amount is the money collected
+EVENT_BUY: a is the propnum, amount the price
+EVENT_AUCTION_START: a is the propnum
+EVENT_BID: a is the propnum, amount the bid
+EVENT_WITHDRAW: a is the propnum
+EVENT_AUCTION_WON: a is the propnum, amount the price paid
+EVENT_BUILD, EVENT_SELL: a is the propnum, b the houses left on it, amount
+    the money paid or received
+EVENT_MORTGAGE, EVENT_UNMORTGAGE: a is the propnum, amount the money received
+    or paid
+EVENT_JAIL: the player was sent to jail
+EVENT_LEAVE_JAIL: a is how (EVENT_JAIL_PAID, EVENT_JAIL_CARD or
+    EVENT_JAIL_DOUBLES), amount the money paid
+EVENT_BANKRUPT: a is the creditor (0 for the bank), amount the debt
+EVENT_END_TURN: the player ended their turn
+EVENT_GAME_END: the player won
+
+a and b always fit in a byte and amount in a signed 32 bit integer
+"""
+EVENT_GAME_START = 0
+EVENT_ROLL = 1
+EVENT_MOVE = 2
+EVENT_LAND = 3
+EVENT_RENT = 4
+EVENT_CARD = 5
+EVENT_PASS_GO = 6
+EVENT_BUY = 7
+EVENT_AUCTION_START = 8
+EVENT_BID = 9
+EVENT_WITHDRAW = 10
+EVENT_AUCTION_WON = 11
+EVENT_BUILD = 12
+EVENT_SELL = 13
+EVENT_MORTGAGE = 14
+EVENT_UNMORTGAGE = 15
+EVENT_JAIL = 16
+EVENT_LEAVE_JAIL = 17
+EVENT_BANKRUPT = 18
+EVENT_END_TURN = 19
+EVENT_GAME_END = 20
+EVENT_GAME_SEED = 21
+
+EVENT_DECK_CHANCE = 0
+EVENT_DECK_COMMUNITY_CHEST = 1
+EVENT_JAIL_PAID = 0
+EVENT_JAIL_CARD = 1
+EVENT_JAIL_DOUBLES = 2
+
+"""
+RecorderType: The signature of a game's event recorder
+"""
+RecorderType = Callable[[int, int, int, int, int], None]
+
+
+# Snapshot Format
+
+"""
+The binary snapshot format written by Monopoly.to_bytes, all integers are
+little endian:
+
+SNAPSHOT_HEADER: magic, format version, number of players, starting cash
+SNAPSHOT_GAME: turn, bank houses, bank hotels, center money, turn_count,
+    done, turn_taken, die 1, die 2, poss_bid, position of the landed tile,
+    key of the last chance card, key of the last community chest card
+    (NO_SNAPSHOT_INDEX marks a None)
+SNAPSHOT_PLAYER: money, position, jail counter, get out of jail free card,
+    once per player and each followed by their proplist
+SNAPSHOT_TILE: owner (0 for the bank), houses, mortgaged, once per buyable
+    tile in propnum order
+SNAPSHOT_AUCTION: auctioned propnum, saved turn, current bid, followed by
+    the auction's active and inactive player lists
+
+The active and inactive player lists and the chance and community chest
+orders follow the tiles, and the auction (if isauction) comes last. Lists
+are written as a length byte followed by one byte per entry. The random
+number generator is not part of a snapshot
+"""
+SNAPSHOT_MAGIC = b"MNPY"
+SNAPSHOT_VERSION = 1
+NO_SNAPSHOT_INDEX = 255
+SNAPSHOT_HEADER = struct.Struct("<4sBBi")
+SNAPSHOT_GAME = struct.Struct("<BBBiB??BBiBBB")
+SNAPSHOT_PLAYER = struct.Struct("<iBB?")
+SNAPSHOT_TILE = struct.Struct("<BB?")
+SNAPSHOT_AUCTION = struct.Struct("<BBi")
+
+
+"""
+JournalFrameType: One frame of the undo journal, the state an action could
+    change captured just before it: the game's scalar attributes, each
+    player's state, the touched buyable tiles, the player lists, the decks and
+    random number generator (for turns) and the auction's state (see
+    Monopoly.undo)
+"""
+JournalFrameType = Tuple[tuple, tuple, tuple, Optional[tuple], Optional[tuple],
+    Optional[tuple]]
+
+
 # Class to represent a game of Monopoly
 
 
@@ -783,15 +1206,23 @@ class Monopoly():
     attributes and tile objects and functions to play a game of monopoly
     """
 
+    __slots__ = ("num_players", "startcash", "__seed", "__rng", "board",
+        "prop_dict", "chance_deck", "community_chest_deck", "__d1", "__d2",
+        "pdict", "ploc", "turn", "houses", "hotels", "center_money",
+        "turn_count", "active_players", "inactive_players", "done",
+        "turn_taken", "auction", "isauction", "poss_bid", "chance_order",
+        "community_chest_order", "landed", "lastchance", "lastcommchest",
+        "player_turn", "journal", "recorder")
+
     pdict: Dict[int, Player]
-    ploc: Dict[int, Tuple[int, int]]
+    ploc: Dict[int, int]
     turn: int
     houses: int
     __d1: int
     __d2: int
     hotels: int
-    board: List[List[GameTileType]]
-    prop_dict: Dict[int, Union[Property, Railroad, Utility]]
+    board: List[GameTileType]
+    prop_dict: PropertyView
     center_money: int
     active_players: List[int]
     inactive_players: List[int]
@@ -807,8 +1238,13 @@ class Monopoly():
     landed: Optional[GameTileType]
     lastchance: Optional[ChanceCard]
     lastcommchest: Optional[CommunityChestCard]
+    __seed: Optional[int]
+    __rng: Optional[random.Random]
+    journal: Optional[List[JournalFrameType]]
+    recorder: Optional[RecorderType]
 
-    def __init__(self, num_players: int, startcash: int = 1500):
+    def __init__(self, num_players: int, startcash: int = 1500,
+        seed: Optional[int] = None):
         """
         Initializes the monopoly object
 
@@ -816,21 +1252,27 @@ class Monopoly():
             num_players: int: The number of players that should be in the game
             startcash: int: The starting amount of money for each player (
                 defaults to $1500)
+            seed: Optional[int]: The seed for the game's random number
+                generator, games created with the same seed (and played
+                the same way) are identical. None seeds it from the system
         Non-Parameter Attributes:
             self.__d1: int: the value of the first die that was rolled
             self.__d2: int: the value of the second die that was rolled
             self.pdict: Dict[int, Player]: A dictionary mapping player numbers
                 to player objects
-            self.ploc: Dict[int, Tuple[int, int]]: A dictionary mapping
-                player number to the player's location
+            self.ploc: Dict[int, int]: A dictionary mapping player number
+                to the player's position on the board
             self.turn: int: The player number of the current player who's turn
                 it is
             self.houses: int: the number of houses available for purchase
             self.hotels: int: the number of hotels available for purchase
-            self.board: List[List[GameTileType]]: A deepcopy of startboard
-                which serves as the list of tiles/property objects for the game
-            self.prop_dict: Dict[int, BuyableTileType]: A dictionary that maps
-                property numbers to the specific buyable tile objects used in the game
+            self.board: List[GameTileType]: A copy of startboard which
+                serves as the list of tiles/property objects for the game, the
+                buyable tiles are fresh copies (see BUYABLE_TEMPLATE) and the
+                stateless tiles are shared with STARTBOARD
+            self.prop_dict: PropertyView: Maps property numbers to the
+                specific buyable tile objects used in the game, like a
+                dictionary
             self.center_money: int: the amount of money that has been confiscated
                 through fines and put into the center, the player who lands on
                 free parking collects this money
@@ -867,33 +1309,200 @@ class Monopoly():
             self.lastchance: Optional[ChanceCard]: The chance card that was just drawn
             self.lastcommchest: Optional[CommunityChestCard]: The last
                 communitychest card that was drawn
+            self.__seed: Optional[int]: The seed of the game's random number
+                generator
+            self.__rng: Optional[random.Random]: The game's own random number
+                generator (see rng), None until a seeded game first needs it
+            self.startcash: int: The starting cash, kept for reset
+            self.journal: Optional[List[JournalFrameType]]: The undo journal,
+                one frame per action taken since start_journal (None when
+                the journal is off, see undo)
+            self.recorder: Optional[RecorderType]: Called with every event of
+                the game (see the event codes), None records nothing. Copies
+                made by fork and from_bytes start without one
+        """
+        assert num_players >= 2, "Must have at least 2 players"
+
+        self.num_players = num_players
+        self.startcash = startcash
+        self.__seed_rng(seed)
 
+        self.board = list(STARTBOARD)
+        for pos, _ in BUYABLE_TEMPLATE:
+            self.board[pos] = STARTBOARD[pos].fresh() # type: ignore
+        self.prop_dict = PropertyView(self.board)
 
+        self.chance_deck = CHANCE_DECK
+        self.community_chest_deck = COMMUNITY_CHEST_DECK
+        self.journal = None
+        self.recorder = None
 
+        self.__start()
 
+    def reset(self, seed: Optional[int] = None) -> None:
         """
-        assert num_players >= 2, "Must have at least 2 players"
+        Recycles the game, putting it back into the state of a new game with
+        the same number of players and starting cash
 
-        self.__d1: int = 1
-        self.__d2: int = 1
+        Inputs:
+            seed: Optional[int]: The seed for the new game (see __init__)
+        """
+        self.__seed_rng(seed)
+        for tile in self.prop_dict.values():
+            tile.reset()
+        if self.journal is not None:
+            self.journal = []
+        self.__start()
+        if self.recorder is not None:
+            self.recorder(EVENT_GAME_START, 0, self.num_players, 0, self.startcash)
+            if isinstance(seed, int) and 0 <= seed < 1 << 64:
+                for half in range(2):
+                    bits = seed >> 32 * half & 0xFFFFFFFF
+                    self.recorder(EVENT_GAME_SEED, 0, half, 0,
+                        bits - (1 << 32) if bits >= 1 << 31 else bits)
+
+    def fork(self, seed: Optional[int] = None) -> "Monopoly":
+        """
+        Returns an independent copy of the game for looking ahead, much faster
+        than a deepcopy. Only the buyable tiles, players and per-game lists are
+        copied, the other tiles and the card decks are shared since they
+        never change during a game
+
+        Inputs:
+            seed: Optional[int]: The seed for the child's random number
+                generator, None continues the parent's stream (so the child
+                rolls the same dice the parent would)
+        Outputs:
+            Monopoly: The child game
+        """
+        child = type(self).__new__(type(self))
+        child.num_players = self.num_players
+        child.startcash = self.startcash
+        if seed is not None:
+            child.__seed = seed
+            child.__rng = random.Random(seed)
+        else:
+            child.__seed = self.__seed
+            child.__rng = None
+            if self.__rng is not None:
+                child.__rng = random.Random()
+                child.__rng.setstate(self.__rng.getstate())
+
+        child.pdict = {}
+        for pnum, player in self.pdict.items():
+            copied = Player.__new__(Player)
+            copied.pnum = pnum
+            copied.money = player.money
+            copied.jail = player.jail
+            copied.get_out = player.get_out
+            copied.owned = list(player.owned)
+            child.pdict[pnum] = copied
+
+        child.board = list(self.board)
+        for pos, _ in BUYABLE_TEMPLATE:
+            prop = self.board[pos]
+            tile = prop.fresh() # type: ignore
+            tile.mortgaged = prop.mortgaged # type: ignore
+            if prop.owner is not None: # type: ignore
+                tile.owner = child.pdict[prop.owner.pnum] # type: ignore
+            if isinstance(prop, Property) and isinstance(tile, Property):
+                tile.houses = prop.houses
+            child.board[pos] = tile
+        child.prop_dict = PropertyView(child.board)
+
+        for pnum, player in self.pdict.items():
+            child.pdict[pnum].proplist = [
+                child.prop_dict[prop.propnum] for prop in player.proplist]
+
+        child.chance_deck = self.chance_deck
+        child.community_chest_deck = self.community_chest_deck
+        child.journal = None
+        child.recorder = None
+
+        child.__d1 = self.__d1
+        child.__d2 = self.__d2
+        child.ploc = dict(self.ploc)
+        child.turn = self.turn
+        child.houses = self.houses
+        child.hotels = self.hotels
+        child.center_money = self.center_money
+        child.turn_count = self.turn_count
+        child.active_players = list(self.active_players)
+        child.inactive_players = list(self.inactive_players)
+        child.done = self.done
+        child.turn_taken = self.turn_taken
+        child.poss_bid = self.poss_bid
+        child.chance_order = list(self.chance_order)
+        child.community_chest_order = list(self.community_chest_order)
+        child.landed = None if self.landed is None else child.board[self.landed.pos]
+        child.lastchance = self.lastchance
+        child.lastcommchest = self.lastcommchest
+        child.player_turn = child.pdict[self.player_turn.pnum]
+
+        child.isauction = self.isauction
+        child.auction = None
+        if self.auction is not None:
+            auction = Auction.__new__(Auction)
+            auction.saveturn = self.auction.saveturn
+            auction.active_players = list(self.auction.active_players)
+            auction.inactive_players = list(self.auction.inactive_players)
+            auction.game = child
+            auction.prop = child.prop_dict[self.auction.prop.propnum]
+            auction.current_bid = self.auction.current_bid
+            child.auction = auction
+
+        return child
+
+    def __seed_rng(self, seed: Optional[int]) -> None:
+        """
+        Seeds the game's random number generator. A seeded game holds only its
+        seed until it first rolls the dice (see rng), so the many new games
+        kept by searches and batches do not each hold a generator
+        """
+        self.__seed = seed
+        self.__rng = random.Random() if seed is None else None
+
+    @property
+    def rng(self) -> random.Random:
+        """
+        The game's own random number generator, used for the dice and deck
+        shuffles. A seeded game creates it when first needed, replaying the
+        deck shuffles of __start to reach the same point of its stream
+        """
+        rng = self.__rng
+        if rng is None:
+            rng = self.__rng = random.Random(self.__seed)
+            self.__deal(rng)
+        return rng
+
+    @staticmethod
+    def __deal(rng: random.Random) -> Tuple[List[int], List[int]]:
+        """
+        Shuffles the chance and community chest decks for the start of a game,
+        the only draws __start makes from a seeded game's stream
+
+        Outputs:
+            Tuple[List[int], List[int]]: The chance and community chest orders
+        """
+        chance_order = list(range(len(CHANCE_DECK)))
+        community_chest_order = list(range(len(COMMUNITY_CHEST_DECK)))
+        rng.shuffle(chance_order)
+        rng.shuffle(community_chest_order)
+        return chance_order, community_chest_order
+
+    def __start(self) -> None:
+        """
+        Sets up the players, decks and the rest of the per-game state for the
+        start of a game (the board has to be set up already)
+        """
+        self.__d1 = 1
+        self.__d2 = 1
 
         self.pdict = {}
         self.ploc = {}
         self.turn = 1
-        self.num_players = num_players
         self.houses = 32
         self.hotels = 12
-        self.board = copy.deepcopy(STARTBOARD)
-
-
-        self.prop_dict = {}
-        for quadrant in self.board:
-            for tile in quadrant:
-                if (isinstance(tile, Property)
-                    or isinstance(tile, Railroad)
-                    or isinstance(tile, Utility)):
-
-                    self.prop_dict[tile.propnum] = tile
 
         self.center_money = 0
         self.turn_count = 0
@@ -907,23 +1516,19 @@ class Monopoly():
         self.isauction = False
         self.poss_bid = 1
 
-        self.chance_deck = CHANCE_DECK
-        self.chance_order = [i for i in range(len(CHANCE_DECK.keys()))]
-        self.community_chest_deck = COMMUNITY_CHEST_DECK
-        self.community_chest_order = [
-            i for i in range(len(COMMUNITY_CHEST_DECK.keys()))]
+        # A seeded game's own generator is only made once it is needed (see
+        # rng), until then the decks are dealt from a throwaway copy of it
+        self.chance_order, self.community_chest_order = self.__deal(
+            self.__rng if self.__rng is not None else random.Random(self.__seed))
 
 
         self.landed = None
         self.lastchance = None
         self.lastcommchest = None
 
-        random.shuffle(self.chance_order)
-        random.shuffle(self.community_chest_order)
-
-        for i in range(1, num_players + 1, 1):
-            self.pdict[i] = Player(i, startcash)
-            self.ploc[i] = (3, 9)
+        for i in range(1, self.num_players + 1, 1):
+            self.pdict[i] = Player(i, self.startcash)
+            self.ploc[i] = GO_POS
             self.active_players.append(i)
 
         self.player_turn = self.pdict[1]
@@ -937,14 +1542,22 @@ class Monopoly():
         Returns: Tile occupied by player who's turn it is
         """
 
-        player = self.player_turn
-
-        pnum = player.pnum
-        cloc = self.ploc[pnum]
+        return self.board[self.ploc[self.player_turn.pnum]]
 
-        quad, dist = cloc
+    def color_group(self, colornum: int) -> List[Property]:
+        """
+        Returns the game's Property objects in the inputted color group (see
+        COLOR_GROUPS), used to check the even building rules
+        """
+        board = self.board
+        return [board[pos] for pos in COLOR_GROUP_POSITIONS[colornum]] # type: ignore
 
-        return self.board[quad][dist]
+    def child_seed(self) -> int:
+        """
+        Returns a seed drawn from this game's random number generator, used to
+        split off independent (but reproducible) streams for child games
+        """
+        return self.rng.getrandbits(64)
 
     @property
     def d1(self) -> int:
@@ -999,6 +1612,10 @@ class Monopoly():
         assert cur_tile.owner is None, "Can't auction an owned property"
         assert not self.isauction, "The auction is already ongoing"
 
+        if self.journal is not None:
+            self.__record()
+        if self.recorder is not None:
+            self.recorder(EVENT_AUCTION_START, self.turn, cur_tile.propnum, 0, 0)
         self.auction = Auction(cur_tile, self)
 
     def bid(self) -> None:
@@ -1015,6 +1632,11 @@ class Monopoly():
         assert self.player_turn.money >= self.poss_bid, "You do not have enough money"
         assert self.poss_bid > self.auction.current_bid, "You must bid more than the current bid"
 
+        if self.journal is not None:
+            self.__record()
+        if self.recorder is not None:
+            self.recorder(EVENT_BID, self.turn, self.auction.prop.propnum, 0,
+                self.poss_bid)
         self.auction.bid(self.poss_bid)
 
     def can_bid(self) -> bool:
@@ -1037,6 +1659,8 @@ class Monopoly():
         assert self.auction is not None
         assert self.player_turn.money >= self.poss_bid + inc, "You do not have enough money"
         assert self.poss_bid + inc > self.auction.current_bid, "You must bid more than the current bid"
+        if self.journal is not None:
+            self.__record()
         self.poss_bid += inc
 
     def can_change_poss_bid(self, inc: int) -> bool:
@@ -1059,77 +1683,73 @@ class Monopoly():
         """
         assert self.isauction, "There is no auction currently happening"
         assert self.auction is not None, "Cannot withdraw from a nonexistant auction"
+        if self.journal is not None:
+            self.__record((self.auction.prop,))
+        if self.recorder is not None:
+            self.recorder(EVENT_WITHDRAW, self.turn, self.auction.prop.propnum, 0, 0)
         self.auction.quit_auction()
 
     # Update Player Property List Methods
 
-    def update_monopoly(self, player: Player) -> None:
+    def transfer_property(self, prop: BuyableTileType,
+        new_owner: Optional[Player]) -> None:
         """
-        Updates the inputted player's Property objects if their monopoly status
-            has changed
+        Changes the owner of a buyable tile, updating both owners' ownership
+            counters (the old owner's proplist is left to the caller)
 
         Inputs:
-            player: Player: The player whose properties need to be checked
+            prop: BuyableTileType: The tile changing hands
+            new_owner: Optional[Player]: The player getting the tile, None
+                returns it to the bank
         """
+        if prop.owner is not None:
+            prop.owner.owned[prop.group] -= 1
+        prop.owner = new_owner
+        if new_owner is not None:
+            new_owner.owned[prop.group] += 1
+            new_owner.proplist.append(prop)
 
-        count = {}
-
+    def __recount(self, player: Player, groups: range) -> None:
+        """
+        Rebuilds the inputted player's ownership counters for the given groups
+            from their property list
+        """
+        for group in groups:
+            player.owned[group] = 0
         for prop in player.proplist:
-            if isinstance(prop, Property):
-                if prop.colornum not in count:
-                    count[prop.colornum] = [prop]
-                else:
-                    count[prop.colornum].append(prop)
-        for colornum, colorlist in count.items():
-            if colornum == 0 or colornum == 7:
-                if len(colorlist) == 2:
-                    for prop in colorlist:
-                        prop.monop = True
-                else:
-                    for prop in colorlist:
-                        prop.monop = False
-            else:
-                if len(colorlist) == 3:
-                    for prop in colorlist:
-                        prop.monop = True
-                else:
-                    for prop in colorlist:
-                        prop.monop = False
+            if prop.owner is player and prop.group in groups:
+                player.owned[prop.group] += 1
+
+    def update_monopoly(self, player: Player) -> None:
+        """
+        Resyncs the inputted player's color group counters (and so the monop
+            status of their Property objects) with their property list, only
+            needed if the proplist was edited without transfer_property
+
+        Inputs:
+            player: Player: The player whose properties need to be checked
+        """
+        self.__recount(player, range(RAILROAD_GROUP))
 
     def update_railroad(self, player: Player) -> None:
         """
-        Updates the inputted player's Railroad objects if the number owned status
-            has changed
+        Resyncs the inputted player's railroad counter with their property
+            list (see update_monopoly)
 
         Inputs:
             player: Player: The player whose Railroads need to be checked
         """
-
-        count = []
-        for prop in player.proplist:
-            if isinstance(prop, Railroad):
-                count.append(prop)
-        for railroad in count:
-            railroad.num_owned = len(count)
+        self.__recount(player, range(RAILROAD_GROUP, RAILROAD_GROUP + 1))
 
     def update_utility(self, player: Player) -> None:
         """
-        Updates the inputted player's Utility objects if their both owned status
-            has changed
+        Resyncs the inputted player's utility counter with their property
+            list (see update_monopoly)
+
         Inputs:
             player: Player: The player whose Utilities need to be checked
         """
-
-        count = 0
-        for prop in player.proplist:
-            if isinstance(prop, Utility):
-                count += 1
-        if count == 2:
-            self.prop_dict[23].both = True # type: ignore
-            self.prop_dict[24].both = True # type: ignore
-        else:
-            self.prop_dict[23].both = False # type: ignore
-            self.prop_dict[24].both = False # type: ignore
+        self.__recount(player, range(UTILITY_GROUP, UTILITY_GROUP + 1))
 
     # Movement + Landing Methods
 
@@ -1138,34 +1758,38 @@ class Monopoly():
         Simulates rolling dice by setting the d1 and d2 attributes to random 
         integers between 1 and 6
         """
-        self.__d1 = random.randint(1,6)
-        self.__d2 = random.randint(1,6)
+        # The same draws randint(1,6) makes (3 random bits, redrawn while
+        # above 5) without its argument handling, a sixth of the turn time
+        getrandbits = self.rng.getrandbits
+        d1 = getrandbits(3)
+        while d1 >= 6:
+            d1 = getrandbits(3)
+        d2 = getrandbits(3)
+        while d2 >= 6:
+            d2 = getrandbits(3)
+        self.__d1 = d1 + 1
+        self.__d2 = d2 + 1
 
     def __apply_move(self) -> None:
         """
         Applies the move given by the sum of the 2 dice attributes to the 
             current player who's turn it is
         """
-        move = self.__d1 + self.__d2
-
-        quadrant, dist = self.ploc[self.turn]
-
-
-        tot_move = dist + move
-
-        quadmove = tot_move // 10
-
-        new_dist = (tot_move) % 10
-        new_quad = (quadrant + quadmove) % 4
-
-        if ((quadrant + quadmove >= 4) or (new_quad == 3
-            and new_dist == 9)) and not (quadrant == 3 and dist == 9):
+        pos = self.ploc[self.turn]
+        new_pos = pos + self.__d1 + self.__d2
 
+        # Landing on go counts as passing it, moving off of it does not
+        if new_pos >= GO_POS and pos != GO_POS:
             self.passgo()
+        if new_pos >= BOARD_SIZE:
+            new_pos -= BOARD_SIZE
 
-        self.ploc[self.turn] = (new_quad, new_dist)
+        self.ploc[self.turn] = new_pos
+        if self.recorder is not None:
+            self.recorder(EVENT_MOVE, self.turn, pos, new_pos, 0)
+            self.recorder(EVENT_LAND, self.turn, new_pos, 0, 0)
 
-        self.landed = self.current_tile()
+        self.landed = self.board[new_pos]
 
         landed = self.landed
 
@@ -1187,6 +1811,9 @@ class Monopoly():
         if prop.owner is not None:
             prop.owner.money += prop.rent(self.__d1 + self.__d2)
             self.player_turn.money -= prop.rent(self.__d1 + self.__d2)
+            if self.recorder is not None:
+                self.recorder(EVENT_RENT, self.turn, prop.owner.pnum,
+                    prop.propnum, prop.rent(self.__d1 + self.__d2))
 
     def __property_landing(self, prop: Union[Railroad, Property]) -> None:
         """
@@ -1197,6 +1824,9 @@ class Monopoly():
 
             prop.owner.money += prop.rent()
             self.player_turn.money -= prop.rent()
+            if self.recorder is not None:
+                self.recorder(EVENT_RENT, self.turn, prop.owner.pnum,
+                    prop.propnum, prop.rent())
 
     def __community_chest_landing(self) -> None:
         """
@@ -1204,13 +1834,16 @@ class Monopoly():
         """
 
         commnum = self.community_chest_order.pop()
-        self.community_chest_deck[commnum].apply_card(self)
+        if self.recorder is not None:
+            self.__record_card(EVENT_DECK_COMMUNITY_CHEST, commnum)
+        else:
+            self.community_chest_deck[commnum].apply_card(self)
         self.lastcommchest = self.community_chest_deck[commnum]
 
         if len(self.community_chest_order) == 0:
             self.community_chest_order = [
             i for i in range(len(COMMUNITY_CHEST_DECK.keys()))]
-            random.shuffle(self.community_chest_order)
+            self.rng.shuffle(self.community_chest_order)
 
     def __chance_landing(self) -> None:
         """
@@ -1218,13 +1851,31 @@ class Monopoly():
         """
 
         chancenum = self.chance_order.pop()
-        self.chance_deck[chancenum].apply_card(self)
+        if self.recorder is not None:
+            self.__record_card(EVENT_DECK_CHANCE, chancenum)
+        else:
+            self.chance_deck[chancenum].apply_card(self)
         self.lastchance = self.chance_deck[chancenum]
 
         if len(self.chance_order) == 0:
             self.chance_order = [
             i for i in range(len(CHANCE_DECK.keys()))]
-            random.shuffle(self.chance_order)
+            self.rng.shuffle(self.chance_order)
+
+    def __record_card(self, deck: int, key: int) -> None:
+        """
+        Applies a drawn card while reporting the draw, and the move if the
+            card moved the player, to the recorder
+        """
+        assert self.recorder is not None
+        self.recorder(EVENT_CARD, self.turn, deck, key, 0)
+        pos = self.ploc[self.turn]
+        if deck == EVENT_DECK_CHANCE:
+            self.chance_deck[key].apply_card(self)
+        else:
+            self.community_chest_deck[key].apply_card(self)
+        if self.ploc[self.turn] != pos and self.player_turn.jail == 0:
+            self.recorder(EVENT_MOVE, self.turn, pos, self.ploc[self.turn], 0)
 
     def __event_tile_landing(self, tile: EventTile) -> None:
         """
@@ -1239,6 +1890,8 @@ class Monopoly():
         off of go is not passing)
         """
         self.player_turn.money += 200
+        if self.recorder is not None:
+            self.recorder(EVENT_PASS_GO, self.turn, 0, 0, 200)
 
 
     # Jail Methods
@@ -1249,8 +1902,10 @@ class Monopoly():
         """
         self.turn_count = 0
         self.player_turn.jail += 1
-        self.ploc[self.turn] = (0,9)
+        self.ploc[self.turn] = JAIL_POS
         self.turn_taken = True
+        if self.recorder is not None:
+            self.recorder(EVENT_JAIL, self.turn, 0, 0, 0)
 
     def get_out_free(self) -> None:
         """
@@ -1262,8 +1917,12 @@ class Monopoly():
         """
         assert self.player_turn.jail != 0, "You are not in jail"
         assert self.player_turn.get_out, "You don't have a get out of jail free card"
+        if self.journal is not None:
+            self.__record()
         self.player_turn.get_out = False
         self.player_turn.jail = 0
+        if self.recorder is not None:
+            self.recorder(EVENT_LEAVE_JAIL, self.turn, EVENT_JAIL_CARD, 0, 0)
 
     def pay_50_get_out(self) -> None:
         """
@@ -1274,8 +1933,12 @@ class Monopoly():
             AssertionError if the current player is not in jail
         """
         assert self.player_turn.jail != 0, "You are not in jail"
+        if self.journal is not None:
+            self.__record()
         self.player_turn.money -= 50
         self.player_turn.jail = 0
+        if self.recorder is not None:
+            self.recorder(EVENT_LEAVE_JAIL, self.turn, EVENT_JAIL_PAID, 0, 50)
 
     # Turn Methods
     def can_take_turn(self) -> bool:
@@ -1333,7 +1996,11 @@ class Monopoly():
 
         assert not self.in_debt(), "You must mortgage all properties and sell all houses"
 
+        if self.journal is not None:
+            self.__record(dice = True)
         self.__roll_dice()
+        if self.recorder is not None:
+            self.recorder(EVENT_ROLL, self.turn, self.__d1, self.__d2, 0)
 
         if self.__d1 != self.__d2:
             self.turn_count = 0
@@ -1346,6 +2013,8 @@ class Monopoly():
                 self.player_turn.jail = 0
                 self.turn_count = 0
                 self.turn_taken = True
+                if self.recorder is not None:
+                    self.recorder(EVENT_LEAVE_JAIL, self.turn, EVENT_JAIL_DOUBLES, 0, 0)
             else:
                 self.turn_count += 1
 
@@ -1397,6 +2066,10 @@ class Monopoly():
 
         assert not self.in_debt(), "You must mortgage all properties and sell all houses to declare bankruptcy"
 
+        if self.journal is not None:
+            self.__record()
+        if self.recorder is not None:
+            self.recorder(EVENT_END_TURN, self.turn, 0, 0, 0)
         self.landed = None
         self.turn = self.turn % self.num_players + 1
 
@@ -1407,6 +2080,8 @@ class Monopoly():
 
         if len(self.active_players) == 1:
             self.done = True
+            if self.recorder is not None:
+                self.recorder(EVENT_GAME_END, self.active_players[0], 0, 0, 0)
 
         self.turn_taken = False
 
@@ -1444,7 +2119,13 @@ class Monopoly():
                 the bank if they went in debt to the bank
                 the player who bankrupted them if they couldn't afford rent
         Also moves on to the following player's turn
+
+        Raises:
+            AssertionError if the current player is not in debt or the game
+                is over
         """
+        assert not self.done, "Game is Over"
+        assert self.in_debt(), "You are not in debt"
 
         cur_tile = self.current_tile()
 
@@ -1456,27 +2137,21 @@ class Monopoly():
         else:
             bankrupter = cur_tile.owner
 
-
+        if self.journal is not None:
+            self.__record(tuple(self.player_turn.proplist), players = True)
+        if self.recorder is not None:
+            self.recorder(EVENT_BANKRUPT, self.turn,
+                0 if bankrupter is None else bankrupter.pnum, 0,
+                -self.player_turn.money)
 
         if bankrupter is None:
             for prop in self.player_turn.proplist:
-                prop.owner = bankrupter
+                self.transfer_property(prop, None)
                 prop.mortgaged = False
-                if isinstance(prop, Property):
-                    prop.monop = False
-                if isinstance(prop, Railroad):
-                    prop.num_owned = 1
-                if isinstance(prop, Utility):
-                    prop.both = False
 
         else:
             for prop in self.player_turn.proplist:
-                prop.owner = bankrupter
-                bankrupter.proplist.append(prop)
-            self.update_monopoly(bankrupter)
-            self.update_railroad(bankrupter)
-            self.update_utility(bankrupter)
-
+                self.transfer_property(prop, bankrupter)
 
             bankrupter.money += self.player_turn.money
 
@@ -1494,6 +2169,8 @@ class Monopoly():
 
         if len(self.active_players) == 1:
             self.done = True
+            if self.recorder is not None:
+                self.recorder(EVENT_GAME_END, self.active_players[0], 0, 0, 0)
 
         self.turn_taken = False
 
@@ -1525,8 +2202,13 @@ class Monopoly():
         if isinstance(prop, Property):
             assert prop.houses == 0, "You must sell all houses first"
 
+        if self.journal is not None:
+            self.__record((prop,))
         prop.mortgaged = True
         self.player_turn.money += prop.mortgage_price
+        if self.recorder is not None:
+            self.recorder(EVENT_MORTGAGE, self.turn, prop.propnum, 0,
+                prop.mortgage_price)
     
     def can_unmortgage(self, prop: GameTileType) -> bool:
         """
@@ -1552,9 +2234,14 @@ class Monopoly():
         assert self.player_turn.money >= (prop.mortgage_price
             + prop.mortgage_price // 10), "Not enough money"
 
+        if self.journal is not None:
+            self.__record((prop,))
         prop.mortgaged = False
         self.player_turn.money -= prop.mortgage_price
         self.player_turn.money -= prop.mortgage_price // 10
+        if self.recorder is not None:
+            self.recorder(EVENT_UNMORTGAGE, self.turn, prop.propnum, 0,
+                prop.mortgage_price + prop.mortgage_price // 10)
 
     def can_build(self, prop: GameTileType) -> bool:
         """
@@ -1574,38 +2261,11 @@ class Monopoly():
         if prop.houses == 5:
             return False
 
-        propnum = prop.propnum
-
-        if 1 <= propnum <= 2:
-            propnum2 = 1
-            propnum3 = 2
-        elif 3 <= propnum <= 20:
-            if propnum % 3 == 0:
-
-                propnum2 = propnum + 1
-                propnum3 = propnum + 2
-            elif propnum % 3 == 1:
-                propnum2 = propnum + 1
-                propnum3 = propnum - 1
-            elif propnum % 3 == 2:
-                propnum2 = propnum - 1
-                propnum3 = propnum - 2
-        elif 21 <= propnum <= 22:
-            propnum2 = 21
-            propnum3 = 22
-
-
-        prop2 = self.prop_dict[propnum2]
-        prop3 = self.prop_dict[propnum3]
-
-
-        assert isinstance(prop2, Property)
-        assert isinstance(prop3, Property)
-
-        if prop.houses - prop2.houses > 0 or prop2.mortgaged:
-            return False
-        if prop.houses - prop3.houses > 0 or prop3.mortgaged:
-            return False
+        board = self.board
+        for pos in COLOR_GROUP_POSITIONS[prop.group]:
+            other = board[pos]
+            if prop.houses - other.houses > 0 or other.mortgaged: # type: ignore
+                return False
 
         if self.player_turn.money <= prop.house_price:
             return False
@@ -1627,54 +2287,35 @@ class Monopoly():
         assert prop in self.player_turn.proplist, ("You don't own this Property")
         assert isinstance(prop, Property), "You can't build on non-color Properties"
         assert prop.monop, "You do not have a monopoly on this property"
-        propnum = prop.propnum
 
         assert not prop.mortgaged, "This property is mortgaged, unmortgage it to build"
         assert prop.houses <= 4, "There is already a hotel here"
 
-        if 1 <= propnum <= 2:
-            propnum2 = 1
-            propnum3 = 2
-        elif 3 <= propnum <= 20:
-            if propnum % 3 == 0:
-
-                propnum2 = propnum + 1
-                propnum3 = propnum + 2
-            elif propnum % 3 == 1:
-                propnum2 = propnum + 1
-                propnum3 = propnum - 1
-            elif propnum % 3 == 2:
-                propnum2 = propnum - 1
-                propnum3 = propnum - 2
-        elif 21 <= propnum <= 22:
-            propnum2 = 21
-            propnum3 = 22
-
-
-        prop2 = self.prop_dict[propnum2]
-        prop3 = self.prop_dict[propnum3]
-
-
-        assert isinstance(prop2, Property)
-        assert isinstance(prop3, Property)
-
-        assert prop.houses - prop2.houses <= 0, f"Not enough houses on {prop2.name}"
-        assert prop.houses - prop3.houses <= 0, f"Not enough houses on {prop3.name}"
-        assert not prop2.mortgaged, f"{prop2.name} is mortgaged, unmortgage it to build on this property"
-        assert not prop3.mortgaged, f"{prop3.name} is mortgaged, unmortgage it to build on this property"
+        group = self.color_group(prop.group)
+        for other in group:
+            assert prop.houses - other.houses <= 0, f"Not enough houses on {other.name}"
+        for other in group:
+            assert not other.mortgaged, f"{other.name} is mortgaged, unmortgage it to build on this property"
         assert self.player_turn.money >= prop.house_price, "Not enough money"
-
         if prop.houses == 4:
             assert self.hotels >= 1, "Not enough hotels"
+        else:
+            assert self.houses >= 1, "Not enough houses"
+
+        if self.journal is not None:
+            self.__record((prop,))
+        if prop.houses == 4:
             self.houses += 4
             self.hotels -= 1
         else:
-            assert self.houses >= 1, "Not enough houses"
             self.houses -= 1
 
 
         prop.build_house()
         self.player_turn.money -= prop.house_price
+        if self.recorder is not None:
+            self.recorder(EVENT_BUILD, self.turn, prop.propnum, prop.houses,
+                prop.house_price)
 
     def can_sell(self, prop: GameTileType):
         """
@@ -1691,36 +2332,11 @@ class Monopoly():
         if prop.houses == 5:
             if self.houses < 4:
                 return False
-        propnum = prop.propnum
-
-        if 1 <= propnum <= 2:
-            propnum2 = 1
-            propnum3 = 2
-        elif 3 <= propnum <= 20:
-            if propnum % 3 == 0:
-
-                propnum2 = propnum + 1
-                propnum3 = propnum + 2
-            elif propnum % 3 == 1:
-                propnum2 = propnum + 1
-                propnum3 = propnum - 1
-            elif propnum % 3 == 2:
-                propnum2 = propnum - 1
-                propnum3 = propnum - 2
-        elif 21 <= propnum <= 22:
-            propnum2 = 21
-            propnum3 = 22
-
 
-        prop2 = self.prop_dict[propnum2]
-        prop3 = self.prop_dict[propnum3]
-
-
-        assert isinstance(prop2, Property)
-        assert isinstance(prop3, Property)
-
-        if prop.houses - prop2.houses < 0 or prop.houses - prop3.houses < 0:
-            return False
+        board = self.board
+        for pos in COLOR_GROUP_POSITIONS[prop.group]:
+            if prop.houses - board[pos].houses < 0: # type: ignore
+                return False
 
         return True
 
@@ -1737,40 +2353,15 @@ class Monopoly():
 
         assert prop.houses >= 1, "There are no houses on this property"
 
-
-        propnum = prop.propnum
-
-        if 1 <= propnum <= 2:
-            propnum2 = 1
-            propnum3 = 2
-        elif 3 <= propnum <= 20:
-            if propnum % 3 == 0:
-
-                propnum2 = propnum + 1
-                propnum3 = propnum + 2
-            elif propnum % 3 == 1:
-                propnum2 = propnum + 1
-                propnum3 = propnum - 1
-            elif propnum % 3 == 2:
-                propnum2 = propnum - 1
-                propnum3 = propnum - 2
-        elif 21 <= propnum <= 22:
-            propnum2 = 21
-            propnum3 = 22
-
-
-        prop2 = self.prop_dict[propnum2]
-        prop3 = self.prop_dict[propnum3]
-
-
-        assert isinstance(prop2, Property)
-        assert isinstance(prop3, Property)
-
-        assert prop.houses - prop2.houses >= 0, f"Sell houses on {prop2.name} first"
-        assert prop.houses - prop3.houses >= 0, f"Sell houses on {prop3.name} first"
+        for other in self.color_group(prop.group):
+            assert prop.houses - other.houses >= 0, f"Sell houses on {other.name} first"
 
         if prop.houses == 5:
             assert self.houses >= 4, "Not enough houses left to sell your hotel"
+
+        if self.journal is not None:
+            self.__record((prop,))
+        if prop.houses == 5:
             self.hotels += 1
             self.houses -= 4
         if prop.houses <= 4:
@@ -1778,6 +2369,9 @@ class Monopoly():
 
         prop.remove_house()
         self.player_turn.money += prop.house_price // 2
+        if self.recorder is not None:
+            self.recorder(EVENT_SELL, self.turn, prop.propnum, prop.houses,
+                prop.house_price // 2)
 
     def can_buy(self, tile: GameTileType) -> bool:
         """
@@ -1813,17 +2407,416 @@ class Monopoly():
         assert self.player_turn.money >= prop.price, "You cannot afford this tile, mortgage properties to raise money or put it up for auction"
         assert not self.isauction, "You can't buy a property that is currently being auctioned"
 
+        if self.journal is not None:
+            self.__record((prop,))
         self.player_turn.money -= prop.price
-        self.player_turn.proplist.append(prop)
-        prop.owner = self.player_turn
+        self.transfer_property(prop, self.player_turn)
+        if self.recorder is not None:
+            self.recorder(EVENT_BUY, self.turn, prop.propnum, 0, prop.price)
+
+    # Action Methods
+
+    def legal_actions(self) -> List[int]:
+        """
+        Returns the action codes of every action the current player can take
+            right now, checking the conditions the can_ methods share only
+            once (see the action codes above)
+
+        Outputs:
+            List[int]: The legal action codes (empty when the game is done)
+        """
+        actions: List[int] = []
+        if self.done:
+            return actions
+
+        player = self.player_turn
+        money = player.money
+
+        if self.isauction:
+            assert self.auction is not None
+            current_bid = self.auction.current_bid
+            if money >= self.poss_bid > current_bid:
+                actions.append(ACTION_BID * ACTION_ARGS)
+            for index, inc in enumerate(BID_CHANGES):
+                if money >= self.poss_bid + inc > current_bid:
+                    actions.append(ACTION_CHANGE_BID * ACTION_ARGS + index)
+            actions.append(ACTION_WITHDRAW * ACTION_ARGS)
+            self.__mortgage_actions(actions)
+            return actions
+
+        tile = self.current_tile()
+        unowned = (isinstance(tile, (Property, Railroad, Utility))
+            and tile.owner is None)
+        in_debt = money < 0
+
+        if unowned:
+            if tile.price <= money: # type: ignore
+                actions.append(ACTION_BUY * ACTION_ARGS + tile.propnum) # type: ignore
+            actions.append(ACTION_START_AUCTION * ACTION_ARGS + tile.propnum) # type: ignore
+
+        elif not self.turn_taken:
+            if not in_debt and player.jail != 4:
+                actions.append(ACTION_ROLL * ACTION_ARGS)
+
+        elif self.turn_count == 0 and not in_debt:
+            actions.append(ACTION_END_TURN * ACTION_ARGS)
+
+        if player.jail != 0:
+            if money >= 50 or player.jail == 4:
+                actions.append(ACTION_PAY_JAIL * ACTION_ARGS)
+            if player.get_out:
+                actions.append(ACTION_USE_JAIL_CARD * ACTION_ARGS)
+
+        self.__mortgage_actions(actions)
+
+        bankrupt = in_debt
+        for prop in player.proplist:
+            houses = prop.houses if isinstance(prop, Property) else 0
+            bankrupt = bankrupt and prop.mortgaged and houses == 0
+            if prop.mortgaged or not isinstance(prop, Property):
+                continue
+
+            propnum = prop.propnum
+            if (prop.monop and houses != 5 and money >= prop.house_price
+                and (self.hotels >= 1 if houses == 4 else self.houses >= 1)
+                and all(houses <= other.houses and not other.mortgaged
+                    for other in self.color_group(prop.group))):
+
+                actions.append(ACTION_BUILD * ACTION_ARGS + propnum)
+            if (houses != 0 and (houses != 5 or self.houses >= 4)
+                and all(houses >= other.houses
+                    for other in self.color_group(prop.group))):
+
+                actions.append(ACTION_SELL * ACTION_ARGS + propnum)
+
+        if bankrupt:
+            actions.append(ACTION_BANKRUPTCY * ACTION_ARGS)
+
+        return actions
+
+    def __mortgage_actions(self, actions: List[int]) -> None:
+        """
+        Adds the current player's legal mortgage and unmortgage actions (which
+            are also allowed during an auction) to actions
+        """
+        money = self.player_turn.money
+        for prop in self.player_turn.proplist:
+            if prop.mortgaged:
+                if money >= prop.mortgage_price + prop.mortgage_price // 10:
+                    actions.append(ACTION_UNMORTGAGE * ACTION_ARGS + prop.propnum)
+            elif not isinstance(prop, Property) or prop.houses == 0:
+                actions.append(ACTION_MORTGAGE * ACTION_ARGS + prop.propnum)
+
+    def apply_action(self, code: int) -> None:
+        """
+        Takes the action with the given action code for the current player
+
+        Inputs:
+            code: int: The action code (see legal_actions)
+        Raises:
+            AssertionError if the code is not a known action, or the action
+                is not legal (see the method it calls)
+        """
+        kind, arg = action_kind(code)
+        if kind == ACTION_CHANGE_BID:
+            assert arg < len(BID_CHANGES), f"Unknown action code {code}"
+        elif kind < ACTION_BUILD and kind not in (ACTION_BUY, ACTION_START_AUCTION):
+            assert arg == 0, f"Unknown action code {code}"
+
+        if kind == ACTION_ROLL:
+            self.take_turn()
+        elif kind == ACTION_END_TURN:
+            self.end_turn()
+        elif kind == ACTION_BID:
+            self.bid()
+        elif kind == ACTION_CHANGE_BID:
+            self.change_poss_bid(BID_CHANGES[arg])
+        elif kind == ACTION_WITHDRAW:
+            self.withdraw()
+        elif kind == ACTION_PAY_JAIL:
+            self.pay_50_get_out()
+        elif kind == ACTION_USE_JAIL_CARD:
+            self.get_out_free()
+        elif kind == ACTION_BANKRUPTCY:
+            self.declare_bankruptcy()
+        else:
+            assert arg in self.prop_dict, f"Unknown action code {code}"
+            prop = self.prop_dict[arg]
+            if kind == ACTION_BUY:
+                self.buy_property(prop)
+            elif kind == ACTION_START_AUCTION:
+                assert self.current_tile() is prop, "You can only auction the tile you are on"
+                self.start_auction()
+            elif kind == ACTION_BUILD:
+                assert isinstance(prop, Property), "You can't build on non-color Properties"
+                self.build_house(prop)
+            elif kind == ACTION_SELL:
+                assert isinstance(prop, Property), "You can't sell houses on non-color Properties"
+                self.sell_house(prop)
+            elif kind == ACTION_MORTGAGE:
+                self.mortgage_property(prop)
+            elif kind == ACTION_UNMORTGAGE:
+                self.unmortgage_property(prop)
+            else:
+                raise AssertionError(f"Unknown action code {code}")
+
+    # Undo Journal Methods
+
+    def start_journal(self) -> None:
+        """
+        Starts recording every action into the undo journal (clearing any
+            previous frames), so that they can be rolled back with undo
+        """
+        self.journal = []
+
+    def stop_journal(self) -> None:
+        """
+        Stops recording actions and drops the undo journal
+        """
+        self.journal = None
 
+    def can_undo(self) -> bool:
+        """
+        Returns whether there is a recorded action that undo can roll back
+        """
+        return bool(self.journal)
+
+    def undo(self) -> None:
+        """
+        Rolls the game back to the state before the last recorded action,
+            including the random number generator, so the same action replays
+            the same way
+
+        The actions recorded are take_turn, buy_property, build_house,
+        sell_house, mortgage_property, unmortgage_property, start_auction,
+        change_poss_bid, bid, withdraw, get_out_free, pay_50_get_out,
+        declare_bankruptcy and end_turn
+
+        Raises:
+            AssertionError if the journal is off or empty
+        """
+        assert self.journal is not None, "The undo journal is not on"
+        assert self.journal, "There is nothing to undo"
+
+        scalars, players, tiles, lists, dice, auction = self.journal.pop()
+
+        (self.__d1, self.__d2, self.turn, self.houses, self.hotels,
+            self.center_money, self.turn_count, self.done, self.turn_taken,
+            self.poss_bid, self.landed, self.lastchance, self.lastcommchest,
+            self.player_turn, self.isauction, self.auction) = scalars
+
+        for player, money, jail, get_out, pos, num_props, owned in players:
+            player.money = money
+            player.jail = jail
+            player.get_out = get_out
+            self.ploc[player.pnum] = pos
+            del player.proplist[num_props:]
+            player.owned[:] = owned
+
+        for tile, owner, houses, mortgaged in tiles:
+            tile.owner = owner
+            tile.mortgaged = mortgaged
+            if isinstance(tile, Property):
+                tile.houses = houses
+
+        if lists is not None:
+            self.active_players = list(lists[0])
+            self.inactive_players = list(lists[1])
+
+        if dice is not None:
+            self.chance_order = list(dice[0])
+            self.community_chest_order = list(dice[1])
+            self.rng.setstate(dice[2])
+
+        if auction is not None:
+            (self.auction.current_bid, active, inactive) = auction # type: ignore
+            self.auction.active_players = list(active) # type: ignore
+            self.auction.inactive_players = list(inactive) # type: ignore
+
+    def __record(self, tiles: Tuple[BuyableTileType, ...] = (),
+        players: bool = False, dice: bool = False) -> None:
+        """
+        Pushes a journal frame with the state the next action can change
+
+        Inputs:
+            tiles: Tuple[BuyableTileType, ...]: The buyable tiles the action
+                can change
+            players: bool: Whether the action changes the active and inactive
+                player lists
+            dice: bool: Whether the action rolls the dice (and so can draw
+                cards)
+        """
+        assert self.journal is not None
+
+        scalars = (self.__d1, self.__d2, self.turn, self.houses, self.hotels,
+            self.center_money, self.turn_count, self.done, self.turn_taken,
+            self.poss_bid, self.landed, self.lastchance, self.lastcommchest,
+            self.player_turn, self.isauction, self.auction)
+
+        player_states = tuple(
+            (player, player.money, player.jail, player.get_out,
+                self.ploc[player.pnum], len(player.proplist), tuple(player.owned))
+            for player in self.pdict.values())
+
+        tile_states = tuple(
+            (tile, tile.owner, tile.houses if isinstance(tile, Property) else 0,
+                tile.mortgaged)
+            for tile in tiles)
+
+        lists = None
+        if players:
+            lists = (tuple(self.active_players), tuple(self.inactive_players))
+
+        deck_state = None
+        if dice:
+            deck_state = (tuple(self.chance_order),
+                tuple(self.community_chest_order), self.rng.getstate())
 
+        auction_state = None
+        if self.auction is not None:
+            auction_state = (self.auction.current_bid,
+                tuple(self.auction.active_players),
+                tuple(self.auction.inactive_players))
 
-        if isinstance(prop, Utility):
-            self.update_utility(self.player_turn)
+        self.journal.append((scalars, player_states, tile_states, lists,
+            deck_state, auction_state))
 
+    # Snapshot Methods
 
-        elif isinstance(prop, Railroad):
-            self.update_railroad(self.player_turn)
-        elif isinstance(prop, Property):
-            self.update_monopoly(self.player_turn)
+    def to_bytes(self) -> bytes:
+        """
+        Returns a compact binary snapshot of the game state (see the snapshot
+        format above), a few hundred bytes that from_bytes turns back into an
+        identical game
+
+        Outputs:
+            bytes: The snapshot
+        """
+        chance_keys = list(CHANCE_DECK.values())
+        community_chest_keys = list(COMMUNITY_CHEST_DECK.values())
+
+        parts = [SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION,
+            self.num_players, self.startcash)]
+        parts.append(SNAPSHOT_GAME.pack(self.turn, self.houses, self.hotels,
+            self.center_money, self.turn_count, self.done, self.turn_taken,
+            self.__d1, self.__d2, self.poss_bid,
+            NO_SNAPSHOT_INDEX if self.landed is None else self.landed.pos,
+            NO_SNAPSHOT_INDEX if self.lastchance is None
+                else chance_keys.index(self.lastchance),
+            NO_SNAPSHOT_INDEX if self.lastcommchest is None
+                else community_chest_keys.index(self.lastcommchest)))
+
+        for pnum in range(1, self.num_players + 1):
+            player = self.pdict[pnum]
+            parts.append(SNAPSHOT_PLAYER.pack(player.money, self.ploc[pnum],
+                player.jail, player.get_out))
+            parts.append(self.__pack_list([prop.propnum for prop in player.proplist]))
+
+        for propnum in range(1, len(self.prop_dict) + 1):
+            prop = self.prop_dict[propnum]
+            parts.append(SNAPSHOT_TILE.pack(
+                0 if prop.owner is None else prop.owner.pnum,
+                prop.houses if isinstance(prop, Property) else 0,
+                prop.mortgaged))
+
+        parts.append(self.__pack_list(self.active_players))
+        parts.append(self.__pack_list(self.inactive_players))
+        parts.append(self.__pack_list(self.chance_order))
+        parts.append(self.__pack_list(self.community_chest_order))
+
+        if self.isauction:
+            assert self.auction is not None
+            parts.append(SNAPSHOT_AUCTION.pack(self.auction.prop.propnum,
+                self.auction.saveturn, self.auction.current_bid))
+            parts.append(self.__pack_list(self.auction.active_players))
+            parts.append(self.__pack_list(self.auction.inactive_players))
+
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, seed: Optional[int] = None) -> "Monopoly":
+        """
+        Creates a game from a snapshot made by to_bytes
+
+        Inputs:
+            data: bytes: The snapshot
+            seed: Optional[int]: The seed for the restored game's random
+                number generator (snapshots do not include it)
+        Outputs:
+            Monopoly: The restored game
+        Raises:
+            AssertionError if the data is not a snapshot of a supported version
+        """
+        magic, version, num_players, startcash = SNAPSHOT_HEADER.unpack_from(data)
+        assert magic == SNAPSHOT_MAGIC, "This is not a monopoly snapshot"
+        assert version == SNAPSHOT_VERSION, f"Unsupported snapshot version {version}"
+        offset = SNAPSHOT_HEADER.size
+
+        game = cls(num_players, startcash, seed)
+
+        (game.turn, game.houses, game.hotels, game.center_money,
+            game.turn_count, game.done, game.turn_taken, game.__d1, game.__d2,
+            game.poss_bid, landed, lastchance,
+            lastcommchest) = SNAPSHOT_GAME.unpack_from(data, offset)
+        offset += SNAPSHOT_GAME.size
+
+        game.landed = None if landed == NO_SNAPSHOT_INDEX else game.board[landed]
+        game.lastchance = (None if lastchance == NO_SNAPSHOT_INDEX
+            else CHANCE_DECK[lastchance])
+        game.lastcommchest = (None if lastcommchest == NO_SNAPSHOT_INDEX
+            else COMMUNITY_CHEST_DECK[lastcommchest])
+
+        for pnum in range(1, num_players + 1):
+            player = game.pdict[pnum]
+            (player.money, game.ploc[pnum], player.jail,
+                player.get_out) = SNAPSHOT_PLAYER.unpack_from(data, offset)
+            offset += SNAPSHOT_PLAYER.size
+            propnums, offset = cls.__unpack_list(data, offset)
+            player.proplist = [game.prop_dict[propnum] for propnum in propnums]
+
+        for propnum in range(1, len(game.prop_dict) + 1):
+            prop = game.prop_dict[propnum]
+            owner, houses, prop.mortgaged = SNAPSHOT_TILE.unpack_from(data, offset)
+            offset += SNAPSHOT_TILE.size
+            if owner != 0:
+                prop.owner = game.pdict[owner]
+                prop.owner.owned[prop.group] += 1
+            if isinstance(prop, Property):
+                prop.houses = houses
+
+        game.active_players, offset = cls.__unpack_list(data, offset)
+        game.inactive_players, offset = cls.__unpack_list(data, offset)
+        game.chance_order, offset = cls.__unpack_list(data, offset)
+        game.community_chest_order, offset = cls.__unpack_list(data, offset)
+
+        if offset < len(data):
+            propnum, saveturn, current_bid = SNAPSHOT_AUCTION.unpack_from(data, offset)
+            offset += SNAPSHOT_AUCTION.size
+            auction = Auction(game.prop_dict[propnum], game)
+            auction.saveturn = saveturn
+            auction.current_bid = current_bid
+            auction.active_players, offset = cls.__unpack_list(data, offset)
+            auction.inactive_players, offset = cls.__unpack_list(data, offset)
+            game.auction = auction
+
+        game.player_turn = game.pdict[game.turn]
+        return game
+
+    @staticmethod
+    def __pack_list(values: List[int]) -> bytes:
+        """
+        Packs a list of small integers as a length byte followed by the values
+        """
+        return bytes([len(values)]) + bytes(values)
+
+    @staticmethod
+    def __unpack_list(data: bytes, offset: int) -> Tuple[List[int], int]:
+        """
+        Unpacks a list packed by __pack_list starting at offset
+
+        Outputs:
+            Tuple[List[int], int]: The list and the offset just past it
+        """
+        length = data[offset]
+        start = offset + 1
+        return list(data[start:start + length]), start + length
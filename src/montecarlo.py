@@ -0,0 +1,143 @@
+"""
+Parallel Monte Carlo Simulation
+
+Shards a batch of headless games (see simulate.py) across worker processes
+and merges the per-game summaries as they arrive
+"""
+from typing import Iterator, List, Optional, Tuple
+import argparse
+import multiprocessing
+import random
+import time
+
+import monopoly
+import simulate
+
+
+"""
+A compact per-game summary sent back from the workers: (winner, turns)
+"""
+SummaryType = Tuple[Optional[int], int]
+
+"""
+The work sent to a worker: (runner, shard seed, number of games, number of
+players, starting cash)
+"""
+ShardType = Tuple[simulate.Runner, int, int, int, int]
+
+
+def play_shard(shard: ShardType) -> List[SummaryType]:
+    """
+    Plays a shard of games inside a worker process
+
+    Every game gets its own seed drawn from the shard seed, so a shard plays
+    the same games no matter which process runs it
+
+    Inputs:
+        shard: ShardType: The shard to play
+    Outputs:
+        List[SummaryType]: One summary per game in the shard
+    """
+    runner, seed, num_games, num_players, startcash = shard
+    seeds = random.Random(seed)
+
+    summaries = []
+    for _ in range(num_games):
+        game = monopoly.Monopoly(num_players, startcash, seeds.getrandbits(64))
+        result = runner.play(game)
+        summaries.append((result.winner, result.turns))
+    return summaries
+
+
+class MonteCarlo():
+    """
+    Runs batches of games on a pool of worker processes
+    """
+
+    def __init__(self, runner: Optional[simulate.Runner] = None,
+        processes: Optional[int] = None, shard_size: int = 64):
+        """
+        Parameters:
+            runner: Optional[Runner]: The runner (and decision callbacks) each
+                worker plays with, the callbacks must be picklable (module level
+                functions). Defaults to a Runner with the default callbacks
+            processes: Optional[int]: The number of worker processes (defaults
+                to the number of cores)
+            shard_size: int: The number of games sent to a worker at once
+        """
+        assert shard_size >= 1, "Shards must contain at least 1 game"
+
+        self.runner = runner if runner is not None else simulate.Runner()
+        self.processes = processes if processes is not None else multiprocessing.cpu_count()
+        self.shard_size = shard_size
+
+    def shards(self, num_games: int, num_players: int, startcash: int,
+        seed: int) -> List[ShardType]:
+        """
+        Splits num_games into shards, each with its own seed drawn from a
+        stream seeded with the given seed
+        """
+        seeds = random.Random(seed)
+        shards = []
+        remaining = num_games
+        while remaining > 0:
+            size = min(self.shard_size, remaining)
+            shards.append((self.runner, seeds.getrandbits(64), size,
+                num_players, startcash))
+            remaining -= size
+        return shards
+
+    def iter_results(self, num_games: int, num_players: int = 4,
+        startcash: int = 1500, seed: int = 0) -> Iterator[simulate.GameResult]:
+        """
+        Yields the results of num_games games in the order the shards finish
+
+        Inputs:
+            num_games: int: The number of games to play
+            num_players, startcash: see Monopoly
+            seed: int: The seed that the shard seeds are drawn from
+        """
+        shards = self.shards(num_games, num_players, startcash, seed)
+
+        with multiprocessing.Pool(self.processes) as pool:
+            for summaries in pool.imap_unordered(play_shard, shards):
+                for winner, turns in summaries:
+                    yield simulate.GameResult(winner, turns)
+
+    def run(self, num_games: int, num_players: int = 4, startcash: int = 1500,
+        seed: int = 0) -> simulate.BatchReport:
+        """
+        Plays num_games games across the pool and reports on them
+
+        Inputs: see iter_results
+        Outputs:
+            BatchReport: The merged statistics of all the games
+        """
+        report = simulate.BatchReport()
+        start = time.perf_counter()
+        for result in self.iter_results(num_games, num_players, startcash, seed):
+            report.add(result)
+        report.seconds = time.perf_counter() - start
+        return report
+
+
+def main() -> None:
+    """
+    Runs a parallel batch of games with the default callbacks and prints the
+    report
+    """
+    parser = argparse.ArgumentParser(description = "Parallel monopoly simulation")
+    parser.add_argument("-n", "--games", type = int, default = 10000)
+    parser.add_argument("-p", "--players", type = int, default = 4)
+    parser.add_argument("-c", "--startcash", type = int, default = 1500)
+    parser.add_argument("-t", "--max-turns", type = int, default = 1000)
+    parser.add_argument("-j", "--processes", type = int, default = None)
+    parser.add_argument("-s", "--seed", type = int, default = 0)
+    args = parser.parse_args()
+
+    engine = MonteCarlo(simulate.Runner(max_turns = args.max_turns), args.processes)
+    print(engine.run(args.games, args.players, args.startcash, args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1161 @@
+"""
+Board Rendering
+
+The drawing functions of the GUI, kept apart from the interactive window so
+they can be imported on a machine without a display. Importing this module
+does no pygame work: init sets the layout up for a window or frame size and
+loads the fonts, and images are loaded (and scaled) on first use and cached
+"""
+import os
+os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "hide"
+import functools
+from typing import Union, Tuple, List, Dict, Optional
+
+import pygame
+
+import monopoly
+
+
+
+BUYABLE_TILE = Union[monopoly.Property, monopoly.Utility, monopoly.Railroad]
+RGBTYPE = Tuple[int, int, int]
+
+"""
+ASSET_DIR: The directory the images/ and Fonts/ paths are relative to, so
+    rendering works from any working directory
+"""
+ASSET_DIR: str = os.path.dirname(os.path.abspath(__file__))
+
+"""
+DEFAULT_SIZE: The window size the layout is set up for until init is called
+"""
+DEFAULT_SIZE: Tuple[int, int] = (1920, 1080)
+
+BORDER: int = 50
+HOUSE_SPACING: int = 2
+
+BACKGROUND_COLOR: RGBTYPE = (191, 219, 174)
+HOUSECOLOR: RGBTYPE = (0,255,0)
+HOTELCOLOR: RGBTYPE = (255, 0, 0)
+TEXT_COLOR: RGBTYPE = (0, 0, 0)
+BUTTON_TEXT_COLOR: RGBTYPE = (0, 0, 0)
+MORGAGE_WARNING_COLOR: RGBTYPE = (255, 0, 0)
+PROPERTY_CARD_COLOR: RGBTYPE = (255, 255, 255)
+LINE_BORDER_COLOR: RGBTYPE = (0, 0, 0)
+HIGHLIGHT_COLOR: RGBTYPE = (255, 255, 0)
+ACTIVE_BUTTON_BACKGROUND: RGBTYPE =  (170, 255, 190)
+INACTIVE_BUTTON_BACKGROUND: RGBTYPE =  (120, 120, 120)
+CHANCE_CARD_COLOR = (255, 102, 0)
+COMMUNITY_CHEST_CARD_COLOR = (255, 209, 0)
+
+PROPCARD_Y_PADDING: int = 5
+PROPCARD_X_PADDING: int = 5
+PROPCARD_TEXT_SPACING: int = 4
+LINE_WIDTH = 2
+BUTTON_PADDING = 5
+AUCTION_TEXT_SPACING = 10
+
+DICE_IMAGES = {
+    1: "images/dice1.png",
+    2: "images/dice2.png",
+    3: "images/dice3.png",
+    4: "images/dice4.png",
+    5: "images/dice5.png",
+    6: "images/dice6.png"}
+
+PLAYER_PIECES = {
+    1: "images/RACECAR.png",
+    2: "images/DOG.png",
+    3: "images/DOG.png",
+    4: "images/DOG.png",
+    5: "images/DOG.png",
+    6: "images/DOG.png",
+    7: "images/DOG.png",
+    8: "images/DOG.png",
+    9: "images/DOG.png",
+    10: "images/DOG.png"}
+
+### Layout ###
+
+# Sizes and positions that depend on the window size (see set_layout)
+
+DISPLAY_WIDTH: int
+DISPLAY_HEIGHT: int
+TILE_WIDTH: int
+TILE_HEIGHT: int
+BOARD_WINDOW: int
+PROPCARD_XPOS: int
+PROPCARD_YPOS: int
+PROPCARD_POS: Tuple[int, int]
+PROPCARD_HEIGHT: int
+PROPCARD_WIDTH: int
+PLAYER_XPOS: int
+PLAYER_YPOS: int
+BUTTON_HEIGHT: int
+BUTTON_WIDTH: int
+SMALL_BUTTON_WIDTH: int
+GAMEINFOWIDTH: int
+GAMEINFOHEIGHT: int
+BUTTON_FONTSIZE: int
+LABELFONTSIZE: int
+FONTSIZE: int
+AUCTIONBUTTON_FONTSIZE: int
+
+# Fonts for the layout's sizes, None until init loads them
+
+AUCTION_BUTTON_FONT: pygame.font.Font = None # type: ignore
+BUTTON_FONT: pygame.font.Font = None # type: ignore
+SMALLBUTTON_FONT: pygame.font.Font = None # type: ignore
+TILETEXT: pygame.font.Font = None # type: ignore
+LABELFONT: pygame.font.Font = None # type: ignore
+
+"""
+INITIALIZED_SIZE: The window size the fonts were loaded for, None before init
+"""
+INITIALIZED_SIZE: Optional[Tuple[int, int]] = None
+
+"""
+TILE_CACHE: The drawn image of each tile by (position, houses), for the
+    current layout (see tile_surface)
+"""
+TILE_CACHE: Dict[Tuple[int, int], pygame.Surface] = {}
+
+
+def set_layout(width: int, height: int) -> None:
+    """
+    Sets the tile, card, button and font sizes and the positions of
+    everything for a window of the inputted size
+    """
+    global DISPLAY_WIDTH, DISPLAY_HEIGHT, TILE_WIDTH, TILE_HEIGHT, BOARD_WINDOW
+    global PROPCARD_XPOS, PROPCARD_YPOS, PROPCARD_POS, PROPCARD_HEIGHT, PROPCARD_WIDTH
+    global PLAYER_XPOS, PLAYER_YPOS, BUTTON_HEIGHT, BUTTON_WIDTH, SMALL_BUTTON_WIDTH
+    global GAMEINFOWIDTH, GAMEINFOHEIGHT
+    global BUTTON_FONTSIZE, LABELFONTSIZE, FONTSIZE, AUCTIONBUTTON_FONTSIZE
+
+    DISPLAY_WIDTH = width
+    DISPLAY_HEIGHT = height
+
+    TILE_WIDTH = (DISPLAY_HEIGHT - 2 * BORDER) // 13 
+    TILE_HEIGHT = TILE_WIDTH * 2
+
+    BOARD_WINDOW = 13 * TILE_WIDTH
+
+    PROPCARD_XPOS = 2 * BORDER + BOARD_WINDOW
+    PROPCARD_YPOS = 2 * BORDER
+    PROPCARD_POS = (PROPCARD_XPOS, PROPCARD_YPOS)
+    PROPCARD_HEIGHT = 2 * TILE_HEIGHT
+    PROPCARD_WIDTH = 2 * TILE_WIDTH
+
+    PLAYER_XPOS = PROPCARD_XPOS + BORDER + PROPCARD_WIDTH
+    PLAYER_YPOS = PROPCARD_YPOS
+
+    BUTTON_HEIGHT = TILE_WIDTH // 2
+    BUTTON_WIDTH = PROPCARD_WIDTH - 2 * BUTTON_PADDING
+    SMALL_BUTTON_WIDTH = (BUTTON_WIDTH - BUTTON_PADDING) // 2
+
+    GAMEINFOWIDTH = DISPLAY_WIDTH - 4 * BORDER - BOARD_WINDOW - BUTTON_WIDTH
+    GAMEINFOHEIGHT = TILE_HEIGHT
+
+    BUTTON_FONTSIZE = TILE_WIDTH // 3 - 1
+    LABELFONTSIZE = 4 * TILE_WIDTH // 9
+    FONTSIZE = TILE_WIDTH // 6 + 2
+    AUCTIONBUTTON_FONTSIZE = TILE_WIDTH // 2 - 2
+
+set_layout(*DEFAULT_SIZE)
+
+def init(size: Optional[Tuple[int, int]] = None) -> None:
+    """
+    Sets the layout up for a window of the inputted size and loads the fonts
+    for it. Without a size the layout fills the screen, which is the only
+    case that starts pygame's display. Calling it again with the same size
+    does nothing
+    """
+    global AUCTION_BUTTON_FONT, BUTTON_FONT, SMALLBUTTON_FONT, TILETEXT, LABELFONT
+    global INITIALIZED_SIZE
+
+    if size is None:
+        pygame.display.init()
+        info = pygame.display.Info()
+        size = (info.current_w, info.current_h)
+    if size == INITIALIZED_SIZE:
+        return
+
+    pygame.font.init()
+    set_layout(*size)
+    TILE_CACHE.clear()
+
+    AUCTION_BUTTON_FONT = pygame.font.Font(None, size = AUCTIONBUTTON_FONTSIZE)
+    BUTTON_FONT = pygame.font.Font(None, size = BUTTON_FONTSIZE)
+    SMALLBUTTON_FONT = pygame.font.Font(None, size = round(BUTTON_FONTSIZE * .7)) 
+    TILETEXT = pygame.font.Font(None, size = FONTSIZE)
+    LABELFONT = pygame.font.Font(asset_path("Fonts/arial.ttf"), size = LABELFONTSIZE)
+    INITIALIZED_SIZE = size
+
+def asset_path(path: str) -> str:
+    """
+    Returns the path of an image or font given relative to ASSET_DIR (the
+    form of the image paths in monopoly.py)
+    """
+    return os.path.join(ASSET_DIR, path)
+
+@functools.lru_cache(maxsize = None)
+def default_font(size: int) -> pygame.font.Font:
+    """
+    Returns pygame's default font at the size, loaded once and shared, so
+    callers must not change its style
+    """
+    return pygame.font.Font(None, size = size)
+
+@functools.lru_cache(maxsize = None)
+def load_image(path: str, size: Optional[Tuple[int, int]] = None) -> pygame.Surface:
+    """
+    Returns the image at the path, scaled to the size if one is given. Each
+    image is loaded once per size and shared, so callers blit it but never
+    draw onto it
+    """
+    if size is None:
+        return pygame.image.load(asset_path(path))
+    return pygame.transform.scale(load_image(path), size)
+
+
+### Surface Drawing Functions ###
+
+
+# Game Tile Helper Functions 
+
+def empty_tile() -> pygame.Surface:
+    """
+    Draws surfaces the size of empty tiles with a background fill of the 
+    background color
+    """
+    
+    tile_image = pygame.Surface((TILE_WIDTH, TILE_HEIGHT))
+    tile_image.fill(BACKGROUND_COLOR)
+    
+
+    
+    return tile_image
+
+def tile_finish(tile_image: pygame.Surface):
+    """
+    Finishes game tile surfaces by putting in line borders around the tile
+    """
+    
+    pygame.draw.line(tile_image, LINE_BORDER_COLOR, (0,1),(TILE_WIDTH - 1, 1))
+    
+    pygame.draw.line(tile_image, LINE_BORDER_COLOR, (0, TILE_HEIGHT - 2),(TILE_WIDTH, TILE_HEIGHT - 2))
+
+    pygame.draw.rect(tile_image, color = LINE_BORDER_COLOR, rect = (0,0,TILE_WIDTH,TILE_HEIGHT), width = 1)
+
+def draw_house() -> pygame.Surface:
+    """
+    Draws the house that goes on a tile
+    """
+    house_img = pygame.Surface((TILE_WIDTH // 5, TILE_HEIGHT // 10))
+    house_img.fill(HOUSECOLOR)
+    return house_img
+
+def draw_hotel() -> pygame.Surface:
+    """
+    Draws the hotel that goes on a tile
+    """
+    hotel_img = pygame.Surface((2 * (TILE_HEIGHT // 5), TILE_HEIGHT // 5))
+    hotel_img.fill(HOTELCOLOR)
+    return hotel_img
+
+
+# Game Tile Functions Drawing Functions 
+
+def draw_property_tile(prop: monopoly.Property) -> pygame.Surface:
+    """
+    Draws a color property tile given a property object
+    """
+    tile_image = empty_tile()
+    
+    
+    image = pygame.Surface((TILE_WIDTH, TILE_HEIGHT // 4))
+    image.fill(prop.color)
+
+    tile_image.blit(image, (0,2))
+    
+    if 1 <= prop.houses <= 4:
+        houserow = pygame.Surface(((TILE_WIDTH // 5 + HOUSE_SPACING) * prop.houses, TILE_HEIGHT // 10))
+        
+        for house in range(prop.houses):
+            houserow.blit(draw_house(), (house * (TILE_WIDTH // 5 + HOUSE_SPACING) + HOUSE_SPACING, 0))
+    
+        tile_image.blit(houserow, houserow.get_rect(center = (TILE_WIDTH // 2, TILE_HEIGHT // 8)))
+    if prop.houses == 5:
+        hotel = draw_hotel()
+        tile_image.blit(hotel, hotel.get_rect(center = (TILE_WIDTH // 2, TILE_HEIGHT // 8)))
+
+
+    
+    
+    newnames = prop.name.split()
+    addname = ""
+    row = 0
+    
+    for name in newnames:
+        
+        if len(name) <= 3:
+            addname = name + " "
+            continue
+        
+        name = addname + name
+        addname = ""
+        text = TILETEXT.render(name, True, TEXT_COLOR, BACKGROUND_COLOR)
+        
+        text_rect = text.get_rect(center=(TILE_WIDTH // 2, TILE_HEIGHT // 4 + (row + 1) * FONTSIZE))
+
+        tile_image.blit(text, text_rect)
+        row += 1
+    
+    cost = TILETEXT.render("$" + str(prop.price), True, TEXT_COLOR, BACKGROUND_COLOR)
+    cost_rect = cost.get_rect(center=(TILE_WIDTH // 2, 7 * TILE_HEIGHT // 8 ))
+    tile_image.blit(cost, cost_rect)
+
+    tile_finish(tile_image)
+    
+    return tile_image
+
+def draw_special_property_tile(prop: Union[monopoly.Utility, monopoly.Railroad]) -> pygame.Surface:
+    """
+    Draws a Utility or Railroad tile depending on whether it is given a Utility
+    or Railroad object
+    """
+    tile_image = empty_tile()
+
+    
+    image = load_image(prop.image, (TILE_WIDTH, TILE_HEIGHT))
+
+    image_rect = image.get_rect(center = (TILE_WIDTH // 2, TILE_HEIGHT // 2))
+    
+
+    tile_image.blit(image, image_rect)
+
+    newnames = prop.name.split()
+    
+    for row, name in enumerate(newnames):
+        text = TILETEXT.render(name, True, TEXT_COLOR, BACKGROUND_COLOR)
+            
+        text_rect = text.get_rect(center=(TILE_WIDTH // 2, (row + 1) * FONTSIZE))
+
+        tile_image.blit(text, text_rect)
+    
+    cost = TILETEXT.render("$" + str(prop.price), True, TEXT_COLOR, BACKGROUND_COLOR)
+    cost_rect = cost.get_rect(center=(TILE_WIDTH // 2, 7 * TILE_HEIGHT // 8 ))
+    tile_image.blit(cost, cost_rect)
+
+    tile_finish(tile_image)
+    
+    return tile_image
+
+def draw_chance_tile(ch_tile: monopoly.ChanceTile) -> pygame.Surface:
+    """
+    Draws a chance tile given a chance-tile object
+    """
+    tile_image = empty_tile()
+    
+    image = load_image(ch_tile.image, (TILE_WIDTH // 5 * 2, TILE_HEIGHT // 5 * 2))
+
+    image_rect = image.get_rect(center = (TILE_WIDTH // 2, TILE_HEIGHT // 2))
+    
+
+    tile_image.blit(image, image_rect)
+
+    newnames = ch_tile.name.split()
+    
+    for row, name in enumerate(newnames):
+        text = TILETEXT.render(name, True, TEXT_COLOR, BACKGROUND_COLOR)
+            
+        text_rect = text.get_rect(center=(TILE_WIDTH // 2, (row + 1) * FONTSIZE))
+
+        tile_image.blit(text, text_rect)
+    
+    tile_finish(tile_image)
+    return tile_image
+
+def draw_community_tile(c_tile: monopoly.CommunityChestTile) -> pygame.Surface:
+    """
+    Draws a commchest tile given a CommunityChestTile object
+    """
+    tile_image = empty_tile()
+    
+    image = load_image(c_tile.image, (TILE_WIDTH - TILE_WIDTH // 8, TILE_HEIGHT // 2))
+
+    image_rect = image.get_rect(center = (TILE_WIDTH // 2, TILE_HEIGHT // 2))
+    
+
+    tile_image.blit(image, image_rect)
+
+    newnames = c_tile.name.split()
+    
+    for row, name in enumerate(newnames):
+        text = TILETEXT.render(name, True, TEXT_COLOR, BACKGROUND_COLOR)
+        
+        if row == 0:
+            text_rect = text.get_rect(center=(TILE_WIDTH // 2, 2 * (FONTSIZE)))
+        if row == 1:
+            text_rect = text.get_rect(center=(TILE_WIDTH // 2, (TILE_HEIGHT - 2 * FONTSIZE)))
+
+        tile_image.blit(text, text_rect)
+
+    tile_finish(tile_image)
+    
+    return tile_image
+
+def draw_event_tile(e_tile: monopoly.EventTile):
+    """
+    Draws a non-corner event tile given an event tile object
+    """
+    tile_image = empty_tile()
+    
+    
+    image = load_image(e_tile.image, (TILE_WIDTH // 4 * 3, TILE_HEIGHT // 4 * 3))
+
+    image_rect = image.get_rect(center = (TILE_WIDTH // 2, TILE_HEIGHT // 2))
+    
+
+    tile_image.blit(image, image_rect)
+
+    newnames = e_tile.name.split()
+    
+    for row, name in enumerate(newnames):
+        text = TILETEXT.render(name, True, TEXT_COLOR, BACKGROUND_COLOR)
+            
+        text_rect = text.get_rect(center=(TILE_WIDTH // 2, (row + 1) * FONTSIZE))
+
+
+        tile_image.blit(text, text_rect)
+
+    tile_finish(tile_image)
+    
+    return tile_image
+
+def draw_corner_tile(se_tile: monopoly.EventTile) -> pygame.Surface:
+    """
+    Draws a corner tile given an event tile object
+    """
+    tile_image = pygame.Surface((TILE_HEIGHT, TILE_HEIGHT))
+    
+    tile_image.fill(BACKGROUND_COLOR)
+    
+    image = load_image(se_tile.image, (TILE_HEIGHT, TILE_HEIGHT))
+
+    image_rect = image.get_rect(center = (TILE_HEIGHT // 2, TILE_HEIGHT // 2))
+    
+
+    tile_image.blit(image, image_rect)
+    
+    pygame.draw.rect(tile_image, color = LINE_BORDER_COLOR, rect = (0,0,TILE_HEIGHT,TILE_HEIGHT), width = 1)
+    
+    pygame.draw.line(tile_image, LINE_BORDER_COLOR, (0, TILE_HEIGHT - 2),(TILE_HEIGHT, TILE_HEIGHT - 2))
+    pygame.draw.line(tile_image, LINE_BORDER_COLOR, (TILE_HEIGHT - 2, 0),(TILE_HEIGHT - 2, TILE_HEIGHT))
+
+
+    return tile_image
+
+# Property Card Drawing Functions
+
+def draw_utility_card(prop: monopoly.Utility) -> pygame.Surface:
+    """
+    Draws a Utility card
+    """
+    small_text = pygame.font.Font(None, size = FONTSIZE - FONTSIZE // 6)
+    small_spacing = PROPCARD_TEXT_SPACING // 2
+    
+    height = PROPCARD_HEIGHT
+    width = PROPCARD_WIDTH
+
+    prop_card = pygame.Surface((width, height))
+    prop_card.fill(PROPERTY_CARD_COLOR)
+
+    image = load_image(prop.image, (width - 2 * PROPCARD_X_PADDING, height))
+    
+    prop_card.blit(image, (image.get_rect(center = (width // 2, PROPCARD_Y_PADDING + height // 6))))
+
+
+    pygame.draw.line(prop_card, LINE_BORDER_COLOR, (PROPCARD_X_PADDING,height // 3 + PROPCARD_TEXT_SPACING), 
+        (width - PROPCARD_X_PADDING, height // 3 + PROPCARD_TEXT_SPACING), 
+        width = LINE_WIDTH)
+    
+    TILETEXT.set_bold(True)
+    
+
+    proptext = TEXT_COLOR
+    
+    name_text = TILETEXT.render(prop.name, True, proptext)
+    
+    name_rect = name_text.get_rect(center = (width // 2, PROPCARD_Y_PADDING 
+        + height // 3 + PROPCARD_TEXT_SPACING 
+        + LINE_WIDTH + PROPCARD_TEXT_SPACING 
+        + FONTSIZE // 2))
+    
+    prop_card.blit(name_text, name_rect)
+    
+    TILETEXT.set_bold(False)
+
+
+    pygame.draw.line(prop_card, LINE_BORDER_COLOR, (PROPCARD_X_PADDING, PROPCARD_Y_PADDING 
+        + height // 3 + PROPCARD_TEXT_SPACING + LINE_WIDTH 
+        + PROPCARD_TEXT_SPACING + FONTSIZE + PROPCARD_TEXT_SPACING),
+        (width - PROPCARD_X_PADDING, PROPCARD_Y_PADDING 
+        + height // 3 + PROPCARD_TEXT_SPACING + LINE_WIDTH 
+        + PROPCARD_TEXT_SPACING + FONTSIZE + PROPCARD_TEXT_SPACING),
+        width = LINE_WIDTH)
+    
+
+    for row in range(1,9):
+        if prop.both and  4 <= row <= 6:
+            small_text.set_underline(True)
+        if not prop.both and 1 <= row <= 3:
+            small_text.set_underline(True)
+        if row == 1:
+            text = small_text.render('   If one "Utility" is owned', True, TEXT_COLOR)
+        if row == 2:
+            text = small_text.render('rent is 4 times the amount shown', True, TEXT_COLOR)
+        if row == 3:
+            text = small_text.render('on dice', True, TEXT_COLOR)
+        if row == 4:
+            text = small_text.render('   If both "Utilities" are owned', True, TEXT_COLOR)
+        if row == 5:
+            text = small_text.render('rent is 10 times the amount shown', True, TEXT_COLOR)
+        if row == 6:
+            text = small_text.render('on dice', True, TEXT_COLOR)
+        if row == 7:
+            text = small_text.render(f'Mortgage Value:       ${prop.mortgage_price}', True, TEXT_COLOR)
+        if row == 8:
+            text = small_text.render(f'              Owner: {str(prop.owner)}', True, TEXT_COLOR)
+        
+        prop_card.blit(text, (PROPCARD_X_PADDING, PROPCARD_Y_PADDING 
+            + height // 3 + PROPCARD_TEXT_SPACING + LINE_WIDTH 
+            + PROPCARD_TEXT_SPACING + FONTSIZE + PROPCARD_TEXT_SPACING + LINE_WIDTH + 
+            (small_spacing + FONTSIZE) * row))
+        small_text.set_underline(False)
+    if prop.mortgaged:
+        mortgage_text = small_text.render(f"MORGAGED, PAY ${prop.mortgage_price + prop.mortgage_price // 10}", True, MORGAGE_WARNING_COLOR)
+        
+        rect = mortgage_text.get_rect(center = (PROPCARD_WIDTH // 2, PROPCARD_Y_PADDING 
+            + height // 3 + PROPCARD_TEXT_SPACING + LINE_WIDTH 
+            + PROPCARD_TEXT_SPACING + FONTSIZE + PROPCARD_TEXT_SPACING + LINE_WIDTH + 
+            (small_spacing + FONTSIZE) * 9))
+        
+        prop_card.blit(mortgage_text, rect)
+
+        mortgage_text = small_text.render(f"TO UNMORGAGE", True, MORGAGE_WARNING_COLOR)
+        
+        rect = mortgage_text.get_rect(center = (PROPCARD_WIDTH // 2, PROPCARD_Y_PADDING 
+            + height // 3 + PROPCARD_TEXT_SPACING + LINE_WIDTH 
+            + PROPCARD_TEXT_SPACING + FONTSIZE + LINE_WIDTH + 
+            (small_spacing + FONTSIZE) * 10))
+        
+        prop_card.blit(mortgage_text, rect)
+
+    pygame.draw.rect(prop_card, color = LINE_BORDER_COLOR, rect = (0,0,width,height), width = 2)
+
+    return prop_card
+
+def draw_railroad_card(prop: monopoly.Railroad) -> pygame.Surface:
+    """
+    Draws a railroad card
+    """
+    small_text = pygame.font.Font(None, size = FONTSIZE)
+
+    height = PROPCARD_HEIGHT
+    width = PROPCARD_WIDTH
+
+    prop_card = pygame.Surface((width, height))
+    prop_card.fill(PROPERTY_CARD_COLOR)
+
+    image = load_image(prop.image, (width - 2 * PROPCARD_X_PADDING, height))
+    
+    prop_card.blit(image, (image.get_rect(center = (width // 2, PROPCARD_Y_PADDING + height // 6))))
+
+
+    pygame.draw.line(prop_card, LINE_BORDER_COLOR, (PROPCARD_X_PADDING,height // 3 + PROPCARD_TEXT_SPACING), 
+        (width - PROPCARD_X_PADDING, height // 3 + PROPCARD_TEXT_SPACING), 
+        width = LINE_WIDTH)
+    
+    TILETEXT.set_bold(True)
+    
+
+    proptext = TEXT_COLOR
+    
+    name_text = TILETEXT.render(prop.name, True, proptext)
+    
+    name_rect = name_text.get_rect(center = (width // 2, PROPCARD_Y_PADDING 
+        + height // 3 + PROPCARD_TEXT_SPACING 
+        + LINE_WIDTH + PROPCARD_TEXT_SPACING 
+        + FONTSIZE // 2))
+    
+    prop_card.blit(name_text, name_rect)
+    
+    TILETEXT.set_bold(False)
+
+
+    pygame.draw.line(prop_card, LINE_BORDER_COLOR, (PROPCARD_X_PADDING, PROPCARD_Y_PADDING 
+        + height // 3 + PROPCARD_TEXT_SPACING + LINE_WIDTH 
+        + PROPCARD_TEXT_SPACING + FONTSIZE + PROPCARD_TEXT_SPACING),
+        (width - PROPCARD_X_PADDING, PROPCARD_Y_PADDING 
+        + height // 3 + PROPCARD_TEXT_SPACING + LINE_WIDTH 
+        + PROPCARD_TEXT_SPACING + FONTSIZE + PROPCARD_TEXT_SPACING),
+        width = LINE_WIDTH)
+    
+
+    for row in range(1,7):
+        if prop.num_owned == row:
+            small_text.set_underline(True)
+        if row == 1:
+            text = small_text.render(f'Rent                                 ${prop.rents[row]}', True, TEXT_COLOR)
+        if row == 2:
+            text = small_text.render(f"If 2 R.R.'s are owned     {prop.rents[row]}", True, TEXT_COLOR)
+        if row == 3:
+            text = small_text.render(f'If 3    "     "     "                {prop.rents[row]}', True, TEXT_COLOR)
+        if row == 4:
+            text = small_text.render(f'If 4    "     "     "                {prop.rents[row]}', True, TEXT_COLOR)
+        if row == 5:
+            text = small_text.render(f'Mortgage Value                ${prop.mortgage_price}', True, TEXT_COLOR)
+        if row == 6:
+            text = small_text.render(f'Owner: {str(prop.owner)}', True, TEXT_COLOR)
+        
+        prop_card.blit(text, (PROPCARD_X_PADDING, PROPCARD_Y_PADDING 
+            + height // 3 + PROPCARD_TEXT_SPACING + LINE_WIDTH 
+            + PROPCARD_TEXT_SPACING + FONTSIZE + PROPCARD_TEXT_SPACING + LINE_WIDTH + 
+            (2 * PROPCARD_TEXT_SPACING + FONTSIZE) * row))
+        small_text.set_underline(False)
+
+    if prop.mortgaged:
+        
+        mortgage_text = TILETEXT.render(f"MORGAGED, PAY ${prop.mortgage_price + prop.mortgage_price // 10}", True, MORGAGE_WARNING_COLOR)
+        
+        
+        prop_card.blit(mortgage_text,  (PROPCARD_X_PADDING, PROPCARD_Y_PADDING 
+            + height // 3 + PROPCARD_TEXT_SPACING 
+            + PROPCARD_TEXT_SPACING + FONTSIZE + LINE_WIDTH + 
+            (2 * PROPCARD_TEXT_SPACING + FONTSIZE) * 7))
+
+        mortgage_text = TILETEXT.render(f"TO UNMORGAGE", True, MORGAGE_WARNING_COLOR)
+
+        prop_card.blit(mortgage_text,   (PROPCARD_X_PADDING, PROPCARD_Y_PADDING 
+            + height // 3 
+            + FONTSIZE + LINE_WIDTH + 
+            (2 * PROPCARD_TEXT_SPACING + FONTSIZE) * 8 - PROPCARD_TEXT_SPACING))
+
+    pygame.draw.rect(prop_card, color = LINE_BORDER_COLOR, rect = (0,0,width,height), width = 2)
+
+
+    return prop_card
+
+def draw_property_card(prop: monopoly.Property) -> pygame.Surface:
+    """
+    Draws a property card
+    """
+
+    height = PROPCARD_HEIGHT
+    width = PROPCARD_WIDTH
+
+    prop_card = pygame.Surface((width, height))
+    
+
+    prop_card.fill(PROPERTY_CARD_COLOR)
+    
+    
+    image = load_image(prop.image, (width - 2 * PROPCARD_X_PADDING, height // 5))
+
+    prop_card.blit(image, (PROPCARD_X_PADDING,PROPCARD_Y_PADDING))
+    
+    SMALLBUTTON_FONT.set_bold(True)
+    
+    if 1 <= prop.propnum <= 2 or 21 <= prop.propnum <= 22:
+        proptext = (255,255,255)
+    else:
+        proptext = TEXT_COLOR
+    name_text = SMALLBUTTON_FONT.render(prop.name, True, proptext)
+    name_rect = name_text.get_rect(center = (width // 2, PROPCARD_Y_PADDING + height // 10))
+    prop_card.blit(name_text, name_rect)
+    
+    SMALLBUTTON_FONT.set_bold(False)
+    
+    
+    for row, cost in enumerate(prop.rents):
+        if row == prop.houses:
+            TILETEXT.set_underline(True)
+            TILETEXT.set_bold(True)
+            if prop.mortgaged:
+                TILETEXT.set_strikethrough(True)
+        
+        if row == 0:
+            cost_text = TILETEXT.render("RENT $" + str(cost), True, TEXT_COLOR)
+        if 0 < row < 5:
+            cost_text = TILETEXT.render(f"With {row} House(s)    ${str(cost)}", True, TEXT_COLOR)
+        if row == 5:
+            cost_text = TILETEXT.render(f"With HOTEL ${str(cost)}", True, TEXT_COLOR)
+
+        cost_rect = cost_text.get_rect(center = (width // 2, PROPCARD_Y_PADDING 
+            + height // 5 + PROPCARD_TEXT_SPACING + FONTSIZE
+            + row * (PROPCARD_TEXT_SPACING + FONTSIZE)))
+       
+        prop_card.blit(cost_text, cost_rect)
+
+        if row == prop.houses:
+            TILETEXT.set_underline(False)
+            TILETEXT.set_bold(False)
+            if prop.mortgaged:
+                TILETEXT.set_strikethrough(False)
+
+
+    for i in range(6,10):
+        
+        if i == 6:
+            addin_text = TILETEXT.render(f"Mortgage Value ${prop.mortgage_price}", True, TEXT_COLOR)
+        if i == 7:
+            addin_text = TILETEXT.render(f"Houses Cost ${prop.house_price} each", True, TEXT_COLOR)
+        if i == 8:
+            addin_text = TILETEXT.render(f"Hotels, ${prop.house_price} plus 4 houses", True, TEXT_COLOR)
+
+        if i == 9:
+            addin_text = TILETEXT.render(f"Owner: {str(prop.owner)}", True, TEXT_COLOR)
+        
+        addin_rect = addin_text.get_rect(center = (width // 2, PROPCARD_Y_PADDING 
+            + height // 5 + PROPCARD_TEXT_SPACING + FONTSIZE
+            + i * (PROPCARD_TEXT_SPACING + FONTSIZE)))
+        
+        prop_card.blit(addin_text, addin_rect)
+
+    if prop.mortgaged:
+        mortgage_text = TILETEXT.render(f"MORGAGED, PAY ${prop.mortgage_price + prop.mortgage_price // 10}", True, MORGAGE_WARNING_COLOR)
+        
+        mortgage_rect = mortgage_text.get_rect(center = (width // 2, PROPCARD_Y_PADDING 
+            + height // 5 + PROPCARD_TEXT_SPACING + FONTSIZE
+            + 10 * (PROPCARD_TEXT_SPACING + FONTSIZE)))
+        
+        prop_card.blit(mortgage_text, mortgage_rect)
+
+        mortgage_text = TILETEXT.render(f"TO UNMORGAGE", True, MORGAGE_WARNING_COLOR)
+
+        
+        mortgage_rect = mortgage_text.get_rect(center = (width // 2, PROPCARD_Y_PADDING 
+            + height // 5 + PROPCARD_TEXT_SPACING + FONTSIZE
+            + 11 * (PROPCARD_TEXT_SPACING + FONTSIZE)))
+        
+        prop_card.blit(mortgage_text, mortgage_rect)
+
+    pygame.draw.rect(prop_card, color = LINE_BORDER_COLOR, rect = (0,0,width,height), width = 2)
+
+    return prop_card
+
+# Chance + Commchest Cards
+
+def draw_chance_card(chance: monopoly.ChanceCard) -> pygame.Surface:
+    card = pygame.Surface((2 * TILE_HEIGHT, TILE_HEIGHT))
+    card.fill(CHANCE_CARD_COLOR)
+    chanceimg = load_image(chance.image, (2 * TILE_HEIGHT, TILE_HEIGHT))
+    card.blit(chanceimg, (0, 0))
+    
+    return card
+
+def draw_community_chest_card(comm_chest: monopoly.CommunityChestCard) -> pygame.Surface:
+
+    card = pygame.Surface((2 * TILE_HEIGHT, TILE_HEIGHT))
+    card.fill(COMMUNITY_CHEST_CARD_COLOR)
+    comm_chestimg = load_image(comm_chest.image, (2 * TILE_HEIGHT, TILE_HEIGHT))
+    card.blit(comm_chestimg, (0, 0))
+    
+    return card
+
+
+
+### Display Functions ###
+
+# Display Helper Functions
+
+def cover_event(surface: pygame.Surface):
+    cover = pygame.Surface((BOARD_WINDOW - 2 * TILE_HEIGHT - 1, BOARD_WINDOW - 2 * TILE_HEIGHT - 1))
+    cover.fill(BACKGROUND_COLOR)
+    coverrect = cover.get_rect(center = (BORDER + BOARD_WINDOW // 2, BORDER + BOARD_WINDOW // 2))
+    surface.blit(cover, coverrect)
+
+def tile_loc(tile: monopoly.GameTileType) -> Tuple[int, int]: 
+    quad, dist = monopoly.quadrant_pos(tile.pos)
+    if dist == 9:
+        if quad == 0:
+            return(BORDER, BORDER + BOARD_WINDOW - TILE_HEIGHT)
+            
+
+        if quad == 1:
+            return (BORDER, BORDER)
+    
+            
+        if quad == 2:
+            return (BORDER + BOARD_WINDOW - TILE_HEIGHT, BORDER)
+        
+
+        if quad == 3:
+            return (BORDER + BOARD_WINDOW - TILE_HEIGHT, BORDER + BOARD_WINDOW - TILE_HEIGHT)
+
+    if quad == 0:
+        return (BOARD_WINDOW + BORDER - (3 * TILE_WIDTH + TILE_WIDTH * dist), BOARD_WINDOW + BORDER - TILE_HEIGHT)
+
+    if quad == 1:
+        return (BORDER, BOARD_WINDOW + BORDER  - (3 * TILE_WIDTH + dist * TILE_WIDTH))
+
+
+    if quad == 2:
+        return (BORDER + TILE_WIDTH * 2 + TILE_WIDTH * dist, BORDER)
+    
+
+    if quad == 3:
+        return (BOARD_WINDOW + BORDER - TILE_HEIGHT, BORDER + 2 * TILE_WIDTH + dist * TILE_WIDTH)
+    
+    else:
+        raise ValueError("Something is wrong")
+        return
+
+# Tile Selection/Deselection
+
+def select_tile(surface: pygame.Surface, prop: Union[monopoly.Property, monopoly.Utility, monopoly.Railroad]):
+    if isinstance(prop, monopoly.Property):
+        prop_card = draw_property_card(prop)
+    if isinstance(prop, monopoly.Utility):
+        prop_card = draw_utility_card(prop)
+    if isinstance(prop, monopoly.Railroad):
+        prop_card = draw_railroad_card(prop)
+    
+    surface.blit(prop_card, PROPCARD_POS)
+
+    x, y = tile_loc(prop)
+    quad, dist = monopoly.quadrant_pos(prop.pos)
+    
+    if quad == 0 or quad == 2:
+        pygame.draw.rect(surface, color = HIGHLIGHT_COLOR, rect = (x, y, TILE_WIDTH, TILE_HEIGHT), width = 1)
+    if quad == 1 or quad == 3:
+        pygame.draw.rect(surface, color = HIGHLIGHT_COLOR, rect = (x, y, TILE_HEIGHT, TILE_WIDTH), width = 1)
+
+def de_select_tile(surface: pygame.Surface, prop: Union[monopoly.Property, monopoly.Utility, monopoly.Railroad]):
+    
+    x, y = tile_loc(prop)
+    quad, dist = monopoly.quadrant_pos(prop.pos)
+
+    cover = pygame.Surface((PROPCARD_WIDTH, PROPCARD_HEIGHT))
+    cover.fill((BACKGROUND_COLOR))
+    surface.blit(cover, PROPCARD_POS)
+    
+    if quad == 0 or quad == 2:
+        pygame.draw.rect(surface, color = LINE_BORDER_COLOR, rect = (x, y, TILE_WIDTH, TILE_HEIGHT), width = 1)
+    if quad == 1 or quad == 3:
+        pygame.draw.rect(surface, color = LINE_BORDER_COLOR, rect = (x, y, TILE_HEIGHT, TILE_WIDTH), width = 1)
+
+
+# Player Specific Info
+def clear_player_display(surface: pygame.Surface):
+    clearsurface = pygame.Surface((DISPLAY_WIDTH - PLAYER_XPOS, DISPLAY_HEIGHT - PLAYER_YPOS + BORDER))
+    clearsurface.fill(BACKGROUND_COLOR)
+    surface.blit(clearsurface, (PLAYER_XPOS, PLAYER_YPOS - BORDER))
+    
+def draw_player_label(surface: pygame.Surface, player: monopoly.Player):
+    selectedtext = LABELFONT.render(f"Player {player.pnum}", True, TEXT_COLOR, BACKGROUND_COLOR)
+    selected_rect = selectedtext.get_rect(
+        center = (PLAYER_XPOS + (DISPLAY_WIDTH - PLAYER_XPOS) // 2, PLAYER_YPOS - BORDER // 2))
+    surface.blit(selectedtext, selected_rect)
+
+# Game Board Drawing
+
+def draw_board(surface: pygame.Surface, game: monopoly.Monopoly):
+    
+    # Drawing all the tiles onfo the surface
+    for tile in game.board:
+        draw_tile_onto_display(surface, tile)
+
+def draw_tile_onto_display(surface: pygame.Surface, tile: monopoly.GameTileType) -> None:
+    surface.blit(tile_surface(tile), tile_loc(tile))
+
+def tile_surface(tile: monopoly.GameTileType) -> pygame.Surface:
+    """
+    Returns the drawn and rotated image of a tile, drawn once per state (a
+    property's houses are the only part of a tile that changes) and cached
+    """
+    key = (tile.pos, tile.houses if isinstance(tile, monopoly.Property) else 0)
+    drawn = TILE_CACHE.get(key)
+    if drawn is not None:
+        return drawn
+
+    quad, dist = monopoly.quadrant_pos(tile.pos)
+
+    if dist == 9:
+        assert isinstance(tile, monopoly.EventTile)
+        drawn = draw_corner_tile(tile)
+        quad = (quad + 1) % 4 #Change for rots bcs rot deps on rot of pngs
+
+    elif isinstance(tile, monopoly.Property):
+        drawn = draw_property_tile(tile)
+    elif isinstance(tile, monopoly.Railroad) or isinstance(tile, monopoly.Utility):
+        drawn = draw_special_property_tile(tile)
+    elif isinstance(tile, monopoly.CommunityChestTile):
+        drawn = draw_community_tile(tile)
+    elif isinstance(tile, monopoly.ChanceTile):
+        drawn = draw_chance_tile(tile)
+        
+    elif isinstance(tile, monopoly.EventTile):
+        drawn = draw_event_tile(tile)
+
+    if quad == 1:
+        drawn = pygame.transform.rotate(drawn, 270)
+
+    if quad == 2:
+        drawn = pygame.transform.rotate(drawn, 180)    
+
+    if quad == 3:
+        drawn = pygame.transform.rotate(drawn, 90)
+    
+    TILE_CACHE[key] = drawn
+    return drawn
+
+def draw_pieces(surface: pygame.Surface, game: monopoly.Monopoly):
+
+    pcount: Dict[int, Dict[int, List[int]]]  = {}
+
+    for pnum in range(1, game.num_players + 1):
+        if pnum not in game.active_players:
+            continue
+        
+        quad, dist = monopoly.quadrant_pos(game.ploc[pnum])
+        
+        if quad in pcount:
+            if dist in pcount[quad]:
+                pcount[quad][dist].append(pnum)
+            else:
+                pcount[quad][dist] = [pnum]
+        else:
+            pcount[quad] = {}
+            pcount[quad][dist] = [pnum]
+    
+    for quad, distdict in pcount.items():
+        for dist, plist in distdict.items():
+            draw_player_piece(surface, game, plist, (quad, dist))
+
+def draw_player_piece(surface: pygame.Surface, game: monopoly.Monopoly, plist: List[int], loc: Tuple[int, int]):
+
+
+    num_same_loc = len(plist)
+    pquad, pdist = loc
+    tilex, tiley = tile_loc(game.board[monopoly.board_pos(pquad, pdist)])
+
+    if pdist == 9 and num_same_loc > 1:
+        num_same_loc = (num_same_loc + 1) // 2
+    
+    row = 0
+    if pdist == 9:
+        tile_image = pygame.Surface((TILE_HEIGHT, TILE_HEIGHT), pygame.SRCALPHA)
+    else:
+        tile_image = pygame.Surface((TILE_WIDTH, TILE_HEIGHT), pygame.SRCALPHA)
+    
+    for pnum in plist:
+        image_load = load_image(PLAYER_PIECES[pnum], (TILE_WIDTH // num_same_loc, TILE_HEIGHT // num_same_loc))
+        tile_image.blit(image_load, (row * (TILE_WIDTH // num_same_loc), TILE_HEIGHT - (TILE_HEIGHT // num_same_loc)))
+        row += 1 
+
+                
+    if pquad == 0: 
+        pass
+    if pquad == 1:
+        tile_image = pygame.transform.rotate(tile_image, 90)
+        tile_image = pygame.transform.flip(tile_image, True, True)
+    if pquad == 2:
+        tile_image = pygame.transform.rotate(tile_image, 180)
+    if pquad == 3:
+        tile_image = pygame.transform.rotate(tile_image, 270)
+        tile_image = pygame.transform.flip(tile_image, True, True)
+
+    surface.blit(tile_image, (tilex, tiley))
+
+# Auction Drawing
+
+def draw_auction(game, surface):
+    currbidtxt = LABELFONT.render("Curr. Bid", True, TEXT_COLOR)
+    prop = game.auction.prop
+    
+    if isinstance(prop, monopoly.Railroad):
+        prop = draw_railroad_card(prop)
+    elif isinstance(prop, monopoly.Property):
+        prop = draw_property_card(prop)
+    elif isinstance(prop, monopoly.Utility):
+        prop = draw_utility_card(prop)
+
+    possbidtxt = LABELFONT.render("Your Bid", True, TEXT_COLOR)
+    
+    currbidrect = currbidtxt.get_rect(center = (
+        BORDER + TILE_HEIGHT + BORDER + (9 * TILE_WIDTH - 2 * BORDER) // 6, 
+        BORDER + TILE_HEIGHT + BORDER + + LABELFONTSIZE + AUCTION_TEXT_SPACING + LABELFONTSIZE // 2))
+    proprect = prop.get_rect(center = (
+        BORDER + TILE_HEIGHT + BORDER + (9 * TILE_WIDTH - 2 * BORDER) // 2, 
+        BORDER + TILE_HEIGHT + BORDER + LABELFONTSIZE + AUCTION_TEXT_SPACING + PROPCARD_HEIGHT // 2))
+    possbidrect = possbidtxt.get_rect(center = (
+        BORDER + TILE_HEIGHT + BORDER + (5 * (9 * TILE_WIDTH - 2 * BORDER)) // 6, 
+        BORDER + TILE_HEIGHT + BORDER + + LABELFONTSIZE + AUCTION_TEXT_SPACING + LABELFONTSIZE // 2
+        ))
+
+    surface.blit(currbidtxt, currbidrect)
+    surface.blit(prop, proprect)
+    surface.blit(possbidtxt, possbidrect)
+
+def update_bids(game, surface):
+    cover = pygame.Surface((TILE_HEIGHT, TILE_WIDTH))
+    cover.fill(BACKGROUND_COLOR)
+    surface.blit(cover,(
+        BORDER + TILE_HEIGHT + BORDER, 
+        BORDER + TILE_HEIGHT + BORDER + 2 * LABELFONTSIZE + 2 * AUCTION_TEXT_SPACING))
+    surface.blit(cover,(
+        BORDER + BOARD_WINDOW - TILE_HEIGHT - 3 * TILE_WIDTH, 
+        BORDER + TILE_HEIGHT + BORDER + 2 * LABELFONTSIZE + 2 * AUCTION_TEXT_SPACING))
+    surface.blit(cover,(
+        BORDER + TILE_HEIGHT + 3 * TILE_WIDTH + TILE_WIDTH // 2, 
+        BORDER + TILE_HEIGHT))
+    
+    currbid = game.auction.current_bid
+    possbid = game.poss_bid
+
+    currbidtxt = LABELFONT.render(f"${currbid}", True, TEXT_COLOR)
+    possbidtxt = LABELFONT.render(f"${possbid}", True, TEXT_COLOR)
+    playerturntxt = LABELFONT.render(f"Player {game.turn}", True, TEXT_COLOR)
+    
+
+    currbidrect = currbidtxt.get_rect(center = (
+        BORDER + TILE_HEIGHT + BORDER + (9 * TILE_WIDTH - 2 * BORDER) // 6, 
+        BORDER + TILE_HEIGHT + BORDER + 2 * LABELFONTSIZE + 2 * AUCTION_TEXT_SPACING + LABELFONTSIZE // 2))
+    possbidrect = possbidtxt.get_rect(center = (
+        BORDER + TILE_HEIGHT + BORDER + (5 * (9 * TILE_WIDTH - 2 * BORDER)) // 6, 
+        BORDER + TILE_HEIGHT + BORDER + 2 * LABELFONTSIZE + 2 * AUCTION_TEXT_SPACING + LABELFONTSIZE // 2))
+    playerturnrect = playerturntxt.get_rect(center = (
+        BORDER + BOARD_WINDOW // 2, 
+        BORDER + TILE_HEIGHT + BORDER + LABELFONTSIZE // 2
+    ))
+    
+    surface.blit(playerturntxt, playerturnrect)
+    surface.blit(currbidtxt, currbidrect)
+    surface.blit(possbidtxt, possbidrect)
+    
+def clear_auction(game, surface):
+    cover = pygame.Surface((BOARD_WINDOW - 2 * TILE_HEIGHT - 2 * BORDER + 5, BOARD_WINDOW - 2 * TILE_HEIGHT - 2 * BORDER + 5))
+    cover.fill(BACKGROUND_COLOR)
+    surface.blit(cover, (BORDER + TILE_HEIGHT + BORDER - 2, BORDER + TILE_HEIGHT + BORDER - 2))
+
+# Other Images/Info
+
+def draw_dice(surface: pygame.Surface, game: monopoly.Monopoly):
+    d1img = load_image(DICE_IMAGES[game.d1], (SMALL_BUTTON_WIDTH, 2 * BUTTON_HEIGHT))
+    d2img = load_image(DICE_IMAGES[game.d2], (SMALL_BUTTON_WIDTH, 2 * BUTTON_HEIGHT))
+
+    d1img_rect = d1img.get_rect(topleft = (PROPCARD_XPOS, DISPLAY_HEIGHT - BORDER - TILE_WIDTH + BUTTON_PADDING))
+    d2img_rect = d2img.get_rect(topleft = (PROPCARD_XPOS + BUTTON_PADDING + SMALL_BUTTON_WIDTH, DISPLAY_HEIGHT - BORDER - TILE_WIDTH + BUTTON_PADDING))
+
+    surface.blit(d1img, d1img_rect)
+    surface.blit(d2img, d2img_rect)
+
+def gameinfo(game, surface):
+    gameinfo = pygame.Surface((GAMEINFOWIDTH, GAMEINFOHEIGHT))
+    gameinfo.fill(BACKGROUND_COLOR)
+    num_players = game.num_players
+
+    padding = 4
+
+    if num_players >= 7:
+        fontsize = round(BUTTON_FONTSIZE * (8.5 / 10) ** (num_players - 6))
+    else:
+        fontsize = BUTTON_FONTSIZE
+    
+    font = default_font(fontsize)
+
+    numdone = 0
+
+    for player in game.pdict.values():
+        playercard = pygame.Surface((GAMEINFOWIDTH // num_players - padding, GAMEINFOHEIGHT))
+        playercard.fill(BACKGROUND_COLOR)
+        
+        playernumtext = font.render(f"Player {player.pnum}", True, TEXT_COLOR)
+        playernumrect = playernumtext.get_rect(center = ((GAMEINFOWIDTH // num_players - padding) // 2, GAMEINFOHEIGHT // 6))
+        playercard.blit(playernumtext, playernumrect)
+
+        playermoneytext = font.render(f"$ {player.money}", True, TEXT_COLOR)
+        playermoneyrect = playermoneytext.get_rect(center = ((GAMEINFOWIDTH // num_players - padding) // 2, GAMEINFOHEIGHT // 2))
+        playercard.blit(playermoneytext, playermoneyrect)
+        
+        if num_players >= 7:
+            image_load = load_image(PLAYER_PIECES[player.pnum], (round((9 / 10) ** (num_players - 6) * TILE_WIDTH),  round((9 / 10) ** (num_players - 6) * TILE_HEIGHT)))
+        else:
+            image_load = load_image(PLAYER_PIECES[player.pnum], (TILE_WIDTH, TILE_HEIGHT))
+        image_load_rect = image_load.get_rect(center = (((GAMEINFOWIDTH // num_players - padding) // 2, GAMEINFOHEIGHT // 2)))
+
+        playercard.blit(image_load, image_load_rect)
+
+
+
+        
+
+        gameinfo.blit(playercard,((GAMEINFOWIDTH // num_players) * numdone + padding // 2, 0))
+        numdone += 1
+    surface.blit(gameinfo, (2 * BORDER + BOARD_WINDOW + BUTTON_WIDTH + BORDER, BORDER + BOARD_WINDOW - TILE_HEIGHT))
+
+def print_error_message(surface: pygame.Surface, emessage: str):
+    error_words = emessage.split()
+    
+    error_line = ""
+    
+    error_img = pygame.Surface((PROPCARD_WIDTH, PROPCARD_WIDTH))
+    error_img.fill(BACKGROUND_COLOR)
+    row = 0
+
+    for word in error_words:
+        error_line += " " + word
+        if len(error_line) >= 20:
+            errortxt = TILETEXT.render(error_line, True, MORGAGE_WARNING_COLOR)
+            errortxtrect = errortxt.get_rect(center = (PROPCARD_WIDTH // 2, (row + 1) * (FONTSIZE + PROPCARD_TEXT_SPACING)))
+            error_img.blit(errortxt, errortxtrect)
+            error_line = ""
+            row += 1
+    if len(error_line) > 0:
+        errortxt = TILETEXT.render(error_line, True, MORGAGE_WARNING_COLOR)
+        errortxtrect = errortxt.get_rect(center = (PROPCARD_WIDTH // 2, (row + 1) * (FONTSIZE + PROPCARD_TEXT_SPACING)))
+        error_img.blit(errortxt, errortxtrect)
+    
+    surface.blit(error_img, (PROPCARD_XPOS, BORDER + BOARD_WINDOW // 2 + BUTTON_PADDING))
+
+
+# Property Button Images
+
+def draw_player_property(prop: BUYABLE_TILE) -> pygame.Surface:    
+    
+    if isinstance(prop, monopoly.Utility):
+        propcrop = pygame.Surface((PROPCARD_WIDTH // 2, (PROPCARD_HEIGHT // 3 + 2 * LINE_WIDTH + 2 * PROPCARD_TEXT_SPACING * 2 + FONTSIZE) // 2))
+        propimg = draw_utility_card(prop)
+        propimg = pygame.transform.scale(propimg, (PROPCARD_WIDTH // 2, PROPCARD_HEIGHT // 2))
+
+    if isinstance(prop, monopoly.Railroad):
+        propcrop = pygame.Surface((PROPCARD_WIDTH // 2, (PROPCARD_HEIGHT // 3 + 2 * LINE_WIDTH + 2 * PROPCARD_TEXT_SPACING * 2 + FONTSIZE) // 2))
+        propimg = draw_railroad_card(prop)
+        propimg = pygame.transform.scale(propimg, (PROPCARD_WIDTH // 2, PROPCARD_HEIGHT // 2))
+
+    if isinstance(prop, monopoly.Property):
+        propcrop = pygame.Surface((PROPCARD_WIDTH // 2, (PROPCARD_HEIGHT // 5) // 2))
+        propimg = draw_property_card(prop)
+        propimg = pygame.transform.scale(propimg, (PROPCARD_WIDTH // 2, PROPCARD_HEIGHT // 2))
+
+
+    propcrop.blit(propimg, (0,0))
+    
+    return propcrop
+
+# Button Drawing Function
+
+def draw_button(width: int, height: int, text: str, background: RGBTYPE, font: Optional[pygame.font.Font] = None) -> pygame.Surface:
+    if font is None:
+        font = SMALLBUTTON_FONT
+    surface = pygame.Surface((width, height))
+    surface.fill(background)
+    
+    txtrender = font.render(text, True, BUTTON_TEXT_COLOR)
+        
+    
+    text_rect = txtrender.get_rect(center = (width // 2, height // 2))
+    surface.blit(txtrender, text_rect)
+    return surface
@@ -0,0 +1,556 @@
+"""
+Game Replays
+
+Re-executes a recorded game through monopoly.Monopoly from its seed and
+decision stream, without the GUI, the decision callbacks or the legal action
+checks, to get back to any point of a game found in aggregate statistics
+without rerunning the campaign it was played in
+
+A decision stream is the list of action codes (see monopoly.py) of every
+choice made in the game, an ACTION_BID code is followed by the amount bid. It
+can be captured while the game is played (ReplayRecorder) or taken from a game
+in an event log (Replay.from_events), whose decision events map one to one
+onto the actions. Keyframes, snapshots of the game with its random number
+generator every few turns, let a replay jump to a turn without replaying the
+turns before it
+"""
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+import argparse
+import itertools
+import random
+import struct
+import time
+
+import events
+import monopoly
+
+
+"""
+REPLAY_HEADER: magic, format version, number of players, starting cash, seed,
+    number of decisions, number of keyframes, length of the final snapshot
+    (0 if there is none)
+KEYFRAME_HEADER: turns ended, index of the next decision, snapshot length
+RNG_STATE: The internal state of a random.Random (Mersenne Twister words and
+    position), stored after each keyframe's snapshot
+"""
+REPLAY_MAGIC = b"MNRP"
+REPLAY_VERSION = 1
+REPLAY_HEADER = struct.Struct("<4sBBiQIIH")
+KEYFRAME_HEADER = struct.Struct("<IIH")
+RNG_STATE = struct.Struct("<625I")
+
+"""
+The default number of turns between keyframes
+"""
+DEFAULT_KEYFRAME_TURNS = 25
+
+"""
+KeyframeType: (turns ended, index of the next decision, snapshot, random
+    number generator state)
+"""
+KeyframeType = Tuple[int, int, bytes, tuple]
+
+"""
+DECISION_EVENTS: The action kind of every event that records a decision
+    without an argument
+TILE_DECISION_EVENTS: The action kind of every event that records a decision
+    on a tile, the event's a is the propnum
+(EVENT_BID and EVENT_LEAVE_JAIL are handled by add_decision)
+"""
+DECISION_EVENTS = {
+    monopoly.EVENT_ROLL: monopoly.ACTION_ROLL,
+    monopoly.EVENT_END_TURN: monopoly.ACTION_END_TURN,
+    monopoly.EVENT_WITHDRAW: monopoly.ACTION_WITHDRAW,
+    monopoly.EVENT_BANKRUPT: monopoly.ACTION_BANKRUPTCY}
+TILE_DECISION_EVENTS = {
+    monopoly.EVENT_BUY: monopoly.ACTION_BUY,
+    monopoly.EVENT_AUCTION_START: monopoly.ACTION_START_AUCTION,
+    monopoly.EVENT_BUILD: monopoly.ACTION_BUILD,
+    monopoly.EVENT_SELL: monopoly.ACTION_SELL,
+    monopoly.EVENT_MORTGAGE: monopoly.ACTION_MORTGAGE,
+    monopoly.EVENT_UNMORTGAGE: monopoly.ACTION_UNMORTGAGE}
+
+"""
+Action codes without an argument, compared against in the replay loop
+"""
+_ROLL = monopoly.action_code(monopoly.ACTION_ROLL)
+_END_TURN = monopoly.action_code(monopoly.ACTION_END_TURN)
+_BID = monopoly.action_code(monopoly.ACTION_BID)
+_WITHDRAW = monopoly.action_code(monopoly.ACTION_WITHDRAW)
+_PAY_JAIL = monopoly.action_code(monopoly.ACTION_PAY_JAIL)
+_USE_JAIL_CARD = monopoly.action_code(monopoly.ACTION_USE_JAIL_CARD)
+_BANKRUPTCY = monopoly.action_code(monopoly.ACTION_BANKRUPTCY)
+
+
+def add_decision(decisions: List[int], kind: int, a: int, amount: int) -> None:
+    """
+    Appends the decision an event records to a decision stream, events that
+    are not decisions are ignored
+
+    Inputs:
+        decisions: List[int]: The decision stream
+        kind, a, amount: The event (see the event codes in monopoly.py)
+    """
+    if kind in DECISION_EVENTS:
+        decisions.append(monopoly.action_code(DECISION_EVENTS[kind]))
+    elif kind in TILE_DECISION_EVENTS:
+        decisions.append(monopoly.action_code(TILE_DECISION_EVENTS[kind], a))
+    elif kind == monopoly.EVENT_BID:
+        decisions.append(_BID)
+        decisions.append(amount)
+    elif kind == monopoly.EVENT_LEAVE_JAIL:
+        if a == monopoly.EVENT_JAIL_PAID:
+            decisions.append(_PAY_JAIL)
+        elif a == monopoly.EVENT_JAIL_CARD:
+            decisions.append(_USE_JAIL_CARD)
+
+def game_seeds(batch_seed: Optional[int], first_game: int = 0) -> Iterator[Optional[int]]:
+    """
+    Yields the seeds of the games of a batch played from a single seed, as
+    simulate.Runner.run and events.py's main draw them. Only needed for logs
+    written before games recorded their seeds (see events.game_seed), since a
+    log appended to more than once holds several batches
+
+    Inputs:
+        batch_seed: Optional[int]: The seed of the batch, None yields None
+            for every game
+        first_game: int: The game to start from (counting from 0)
+    """
+    if batch_seed is None:
+        yield from itertools.repeat(None)
+        return
+    seeds = random.Random(batch_seed)
+    for _ in range(first_game):
+        seeds.getrandbits(64)
+    while True:
+        yield seeds.getrandbits(64)
+
+
+# Replays
+
+
+class Replay():
+    """
+    The seed and decision stream of a game, with the keyframes found so far
+    """
+
+    def __init__(self, num_players: int, startcash: int, seed: int,
+        decisions: Optional[List[int]] = None):
+        """
+        Parameters:
+            num_players, startcash: The settings of the game (see Monopoly)
+            seed: int: The seed the game was played with
+            decisions: Optional[List[int]]: The decision stream
+
+        Non-Parameter Attributes:
+            self.keyframes: List[KeyframeType]: The keyframes in turn order
+            self.final: Optional[bytes]: The snapshot of the game when it was
+                recorded, if known
+        """
+        self.num_players = num_players
+        self.startcash = startcash
+        self.seed = seed
+        self.decisions = [] if decisions is None else decisions
+        self.keyframes: List[KeyframeType] = []
+        self.final: Optional[bytes] = None
+
+    @classmethod
+    def from_events(cls, game_events: Sequence[events.EventType],
+        seed: Optional[int] = None) -> "Replay":
+        """
+        Builds the replay of a game from its events in an event log
+
+        Inputs:
+            game_events: Sequence[EventType]: The game's events, starting
+                with its EVENT_GAME_START (see events.read_games)
+            seed: Optional[int]: The seed the game was played with (see
+                game_seeds), only used if the log did not record it
+        Outputs:
+            Replay: The replay, without a final snapshot
+        Raises:
+            AssertionError if the events don't start with a game start or
+                the seed is neither recorded nor given
+        """
+        iterator = iter(game_events)
+        kind, _, num_players, _, startcash = next(iterator)
+        assert kind == monopoly.EVENT_GAME_START, "The events must start with a game start"
+        recorded = events.game_seed(game_events)
+        if recorded is not None:
+            seed = recorded
+        assert seed is not None, "The game's seed is not in the log, give the seed of its batch"
+        replay = cls(num_players, startcash, seed)
+        for kind, _, a, _, amount in iterator:
+            add_decision(replay.decisions, kind, a, amount)
+        return replay
+
+    @property
+    def turns(self) -> int:
+        """
+        Returns the number of turns ended in the game (bankruptcies included,
+        as simulate.Runner counts them)
+        """
+        return sum(1 for code in self.__codes()
+            if code == _END_TURN or code == _BANKRUPTCY)
+
+    def __codes(self) -> Iterable[int]:
+        """
+        Yields the action codes of the decision stream, skipping bid amounts
+        """
+        decisions = self.decisions
+        index = 0
+        while index < len(decisions):
+            yield decisions[index]
+            index += 2 if decisions[index] == _BID else 1
+
+    def play(self, keyframe_turns: int = 0,
+        recorder: Optional[monopoly.RecorderType] = None) -> monopoly.Monopoly:
+        """
+        Replays the whole game from its seed
+
+        Inputs:
+            keyframe_turns: int: If not 0 the keyframes are replaced by one
+                every keyframe_turns turns
+            recorder: Optional[RecorderType]: A recorder attached to the game
+                while it is replayed
+        Outputs:
+            Monopoly: The game in its final state
+        """
+        game = monopoly.Monopoly(self.num_players, self.startcash, self.seed)
+        game.recorder = recorder
+        if keyframe_turns:
+            self.keyframes = []
+        self.__run(game, 0, 0, None, keyframe_turns)
+        game.recorder = None
+        return game
+
+    def game_at(self, turn: int) -> monopoly.Monopoly:
+        """
+        Returns the game at the start of a turn, replayed from the last
+        keyframe before it
+
+        Inputs:
+            turn: int: The number of turns ended (the game's last state if it
+                has fewer)
+        Outputs:
+            Monopoly: The game
+        """
+        keyframe = None
+        for candidate in self.keyframes:
+            if candidate[0] > turn:
+                break
+            keyframe = candidate
+
+        if keyframe is None:
+            game = monopoly.Monopoly(self.num_players, self.startcash, self.seed)
+            self.__run(game, 0, 0, turn, 0)
+        else:
+            turns, index, snapshot, state = keyframe
+            game = monopoly.Monopoly.from_bytes(snapshot, 0)
+            game.rng.setstate(state)
+            self.__run(game, index, turns, turn, 0)
+        return game
+
+    def verify(self) -> bool:
+        """
+        Returns whether replaying the game ends in its recorded final state
+
+        Raises:
+            AssertionError if there is no final snapshot to check against
+        """
+        assert self.final is not None, "The replay has no final snapshot"
+        return self.play().to_bytes() == self.final
+
+    def states(self, every: int = 1) -> Iterator[Tuple[int, monopoly.Monopoly]]:
+        """
+        Replays the whole game from its seed, stopping at the start of every
+        every-th turn and at the end
+
+        Outputs:
+            Iterator[Tuple[int, Monopoly]]: The number of turns ended and the
+                game, which is the same object every time and changes once
+                the next one is asked for
+        """
+        assert every >= 1, "States must be at least 1 turn apart"
+        game = monopoly.Monopoly(self.num_players, self.startcash, self.seed)
+        index = turns = 0
+        yield turns, game
+        while index < len(self.decisions):
+            index, turns = self.__run(game, index, turns, turns + every, 0)
+            yield turns, game
+
+    def __run(self, game: monopoly.Monopoly, index: int, turns: int,
+        stop_turn: Optional[int], keyframe_turns: int) -> Tuple[int, int]:
+        """
+        Applies the decisions from index on by calling the game's methods
+        directly, stopping once stop_turn turns have been ended
+
+        Inputs:
+            game: Monopoly: The game, in the state before decision index
+            index: int: The decision to start at
+            turns: int: The number of turns ended before decision index
+            stop_turn: Optional[int]: The turn to stop at, None for the end
+            keyframe_turns: int: Adds a keyframe every keyframe_turns turns
+                (0 for none)
+        Outputs:
+            Tuple[int, int]: The next decision's index and the number of
+                turns ended where it stopped
+        """
+        decisions = self.decisions
+        end = len(decisions)
+        if stop_turn is not None and turns >= stop_turn:
+            return index, turns
+
+        take_turn = game.take_turn
+        end_turn = game.end_turn
+        prop_dict = game.prop_dict
+        args = monopoly.ACTION_ARGS
+
+        while index < end:
+            code = decisions[index]
+            index += 1
+
+            if code == _ROLL:
+                take_turn()
+                continue
+            if code == _END_TURN or code == _BANKRUPTCY:
+                if code == _END_TURN:
+                    end_turn()
+                else:
+                    game.declare_bankruptcy()
+                turns += 1
+                if keyframe_turns and turns % keyframe_turns == 0:
+                    self.keyframes.append((turns, index, game.to_bytes(),
+                        game.rng.getstate()))
+                if turns == stop_turn:
+                    return index, turns
+                continue
+
+            if code == _BID:
+                game.poss_bid = decisions[index]
+                index += 1
+                game.bid()
+            elif code == _WITHDRAW:
+                game.withdraw()
+            elif code == _PAY_JAIL:
+                game.pay_50_get_out()
+            elif code == _USE_JAIL_CARD:
+                game.get_out_free()
+            else:
+                kind, arg = divmod(code, args)
+                prop = prop_dict[arg]
+                if kind == monopoly.ACTION_BUY:
+                    game.buy_property(prop)
+                elif kind == monopoly.ACTION_START_AUCTION:
+                    game.start_auction()
+                elif kind == monopoly.ACTION_BUILD:
+                    game.build_house(prop) # type: ignore
+                elif kind == monopoly.ACTION_SELL:
+                    game.sell_house(prop) # type: ignore
+                elif kind == monopoly.ACTION_MORTGAGE:
+                    game.mortgage_property(prop)
+                elif kind == monopoly.ACTION_UNMORTGAGE:
+                    game.unmortgage_property(prop)
+                else:
+                    raise AssertionError(f"Unknown decision {code}")
+        return index, turns
+
+    # Files
+
+    def save(self, path: str) -> None:
+        """
+        Writes the replay, with its keyframes and final snapshot, to a file
+        """
+        final = b"" if self.final is None else self.final
+        parts = [REPLAY_HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION,
+            self.num_players, self.startcash, self.seed, len(self.decisions),
+            len(self.keyframes), len(final))]
+        parts.append(struct.pack(f"<{len(self.decisions)}i", *self.decisions))
+        parts.append(final)
+        for turns, index, snapshot, state in self.keyframes:
+            version, words, gauss = state
+            assert version == 3 and gauss is None, "Unsupported random number generator state"
+            parts.append(KEYFRAME_HEADER.pack(turns, index, len(snapshot)))
+            parts.append(snapshot)
+            parts.append(RNG_STATE.pack(*words))
+        with open(path, "wb") as file:
+            file.write(b"".join(parts))
+
+    @classmethod
+    def load(cls, path: str) -> "Replay":
+        """
+        Reads a replay written by save
+
+        Raises:
+            AssertionError if the file is not a replay of a supported version
+        """
+        with open(path, "rb") as file:
+            data = file.read()
+        (magic, version, num_players, startcash, seed, num_decisions,
+            num_keyframes, final_length) = REPLAY_HEADER.unpack_from(data)
+        assert magic == REPLAY_MAGIC, "This is not a monopoly replay"
+        assert version == REPLAY_VERSION, f"Unsupported replay version {version}"
+        offset = REPLAY_HEADER.size
+
+        replay = cls(num_players, startcash, seed,
+            list(struct.unpack_from(f"<{num_decisions}i", data, offset)))
+        offset += 4 * num_decisions
+        if final_length:
+            replay.final = data[offset:offset + final_length]
+            offset += final_length
+
+        for _ in range(num_keyframes):
+            turns, index, length = KEYFRAME_HEADER.unpack_from(data, offset)
+            offset += KEYFRAME_HEADER.size
+            snapshot = data[offset:offset + length]
+            offset += length
+            words = RNG_STATE.unpack_from(data, offset)
+            offset += RNG_STATE.size
+            replay.keyframes.append((turns, index, snapshot, (3, words, None)))
+        return replay
+
+
+class ReplayRecorder():
+    """
+    Captures the decision stream of games as they are played, as the game's
+    recorder (chaining every event on to another recorder, if given)
+    """
+
+    def __init__(self, forward: Optional[monopoly.RecorderType] = None):
+        """
+        Parameters:
+            forward: Optional[RecorderType]: A recorder that also gets every
+                event, like an events.EventWriter
+
+        Non-Parameter Attributes:
+            self.replay: Optional[Replay]: The replay of the current game
+        """
+        self.forward = forward
+        self.replay: Optional[Replay] = None
+
+    def start(self, game: monopoly.Monopoly, seed: int) -> None:
+        """
+        Attaches to the game and resets it into a new game with the seed
+        """
+        self.replay = Replay(game.num_players, game.startcash, seed)
+        game.recorder = self
+        game.reset(seed)
+
+    def finish(self, game: monopoly.Monopoly) -> Replay:
+        """
+        Returns the replay of the game played since start, with the game's
+        current state as its final snapshot
+        """
+        assert self.replay is not None, "No game has been started"
+        self.replay.final = game.to_bytes()
+        return self.replay
+
+    def __call__(self, kind: int, player: int, a: int, b: int, amount: int) -> None:
+        """
+        Adds the event's decision to the replay (the recorder signature of
+        Monopoly)
+        """
+        if self.replay is not None:
+            add_decision(self.replay.decisions, kind, a, amount)
+        if self.forward is not None:
+            self.forward(kind, player, a, b, amount)
+
+
+def describe(game: monopoly.Monopoly) -> str:
+    """
+    Returns a short printable summary of the players in a game
+    """
+    lines = []
+    for pnum, player in game.pdict.items():
+        status = "" if pnum in game.active_players else " (bankrupt)"
+        houses = sum(prop.houses for prop in player.proplist
+            if isinstance(prop, monopoly.Property))
+        lines.append(f"    Player {pnum}{status}: ${player.money} on tile "
+            f"{game.ploc[pnum]}, {len(player.proplist)} tiles, {houses} houses"
+            + (f", jail {player.jail}" if player.jail else ""))
+    return "\n".join(lines)
+
+def main() -> None:
+    """
+    Replays a game from an event log or a saved replay and checks it, then
+    optionally saves it with keyframes or prints the state at a turn. Logs
+    recorded before games kept their seeds need the seed of their batch
+    """
+    parser = argparse.ArgumentParser(description = "Monopoly game replays")
+    parser.add_argument("path", help = "an event log or a saved replay")
+    parser.add_argument("-g", "--game", type = int, default = None,
+        help = "the game of the event log to replay (counting from 0), all "
+        "games if not given")
+    parser.add_argument("-s", "--seed", type = int, default = None,
+        help = "the seed the event log's batch was recorded with, for logs "
+        "without recorded seeds")
+    parser.add_argument("-k", "--keyframe-turns", type = int,
+        default = DEFAULT_KEYFRAME_TURNS)
+    parser.add_argument("-o", "--output", default = None,
+        help = "save the replay with its keyframes to this file")
+    parser.add_argument("--turn", type = int, default = None,
+        help = "print the state of the game at the start of this turn")
+    args = parser.parse_args()
+
+    with open(args.path, "rb") as file:
+        is_log = file.read(len(events.LOG_MAGIC)) == events.LOG_MAGIC
+
+    if not is_log:
+        replay = Replay.load(args.path)
+        start = time.perf_counter()
+        final = replay.play().to_bytes()
+        seconds = time.perf_counter() - start
+        print(f"Replayed {len(replay.decisions)} decisions, {replay.turns} "
+            f"turns in {1000 * seconds:.1f}ms"
+            + ("" if replay.final is None else ", final state "
+                + ("matches" if final == replay.final else "DOES NOT match")))
+
+    else:
+        if args.game is None and (args.turn is not None or args.output is not None):
+            parser.error("--turn and --output need a single game")
+        first = 0 if args.game is None else args.game
+        replayed = mismatches = 0
+        failed = False
+        seconds = 0.0
+        for number, (game_events, seed) in enumerate(zip(
+            events.read_games(args.path, first), game_seeds(args.seed, first)), first):
+
+            # The replay's events leave out the game start and its seed
+            logged = [event for event in game_events[1:]
+                if event[0] != monopoly.EVENT_GAME_SEED]
+            played: List[events.EventType] = []
+            start = time.perf_counter()
+            try:
+                replay = Replay.from_events(game_events, seed)
+                replay.play(args.keyframe_turns, lambda *event: played.append(event))
+                failed = False
+            except AssertionError as error:
+                # A wrong seed or decision stream makes the engine refuse a move
+                failed = True
+                print(f"Game {number} could not be replayed: {error}")
+            seconds += time.perf_counter() - start
+            replayed += 1
+            if failed or played != logged:
+                mismatches += 1
+                if not failed:
+                    print(f"Game {number} does not match its log")
+            if args.game is not None:
+                break
+        print(f"Replayed {replayed} games in {seconds:.2f}s, "
+            f"{replayed - mismatches} match the log")
+        if replayed == 0 or failed:
+            return
+
+    if args.turn is not None:
+        game = replay.game_at(args.turn)
+        print(f"Turn {args.turn}, player {game.turn} to play:")
+        print(describe(game))
+
+    if args.output is not None:
+        if not replay.keyframes and args.keyframe_turns:
+            replay.play(args.keyframe_turns)
+        replay.save(args.output)
+        print(f"Saved the replay with {len(replay.keyframes)} keyframes to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
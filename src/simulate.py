@@ -0,0 +1,376 @@
+"""
+Headless Monopoly Simulation
+
+Plays complete games of monopoly.Monopoly at full speed without the GUI,
+asking pluggable decision callbacks whenever a player has a choice to make
+"""
+from typing import Callable, Dict, Optional
+import argparse
+import operator
+import random
+import time
+
+import monopoly
+
+
+"""
+Callback types, each one is called with the game when the player who's turn
+it is (game.player_turn) has to make a decision:
+
+BuyCallback: Whether to buy the unowned tile the player is standing on
+    (False puts it up for auction)
+BidCallback: The amount to bid in the current auction, anything that is not
+    a legal bid (not above the current bid or more than the bidder has)
+    withdraws the bidder from the auction
+BuildCallback: The next property to build a house on, None to stop building
+RaiseCallback: The next tile to sell a house from/mortgage while the player
+    is in debt, None to fall back to the default choice
+JailCallback: Whether to pay $50 (or use a get out of jail free card) to
+    leave jail before rolling
+"""
+BuyCallback = Callable[[monopoly.Monopoly, monopoly.BuyableTileType], bool]
+BidCallback = Callable[[monopoly.Monopoly], int]
+BuildCallback = Callable[[monopoly.Monopoly], Optional[monopoly.Property]]
+RaiseCallback = Callable[[monopoly.Monopoly], Optional[monopoly.BuyableTileType]]
+JailCallback = Callable[[monopoly.Monopoly], bool]
+
+"""
+COLOR_GROUP_SIZES: The number of properties in each color group, a player can
+    only build once one of their group counts (see Player.owned) matches
+"""
+COLOR_GROUP_SIZES = monopoly.GROUP_SIZES[:monopoly.RAILROAD_GROUP]
+
+
+# Default Decision Callbacks
+
+def always_buy(game: monopoly.Monopoly, tile: monopoly.BuyableTileType) -> bool:
+    """
+    Buys every tile the player can afford
+    """
+    return True
+
+def bid_list_price(game: monopoly.Monopoly) -> int:
+    """
+    Bids the list price of the auctioned tile, or everything the bidder has
+    if that is less
+    """
+    assert game.auction is not None
+    return min(game.auction.prop.price, game.player_turn.money)
+
+def build_cheapest(game: monopoly.Monopoly) -> Optional[monopoly.Property]:
+    """
+    Builds on the cheapest legal property while keeping $200 in reserve
+    """
+    player = game.player_turn
+    best = None
+    for prop in player.proplist:
+        # monop first, it rules out most tiles far more cheaply than can_build
+        if (isinstance(prop, monopoly.Property) and prop.monop
+            and player.money - prop.house_price >= 200
+            and game.can_build(prop)):
+
+            if best is None or prop.house_price < best.house_price:
+                best = prop
+    return best
+
+def raise_cheapest(game: monopoly.Monopoly) -> Optional[monopoly.BuyableTileType]:
+    """
+    Sells the houses on the most developed property first, then mortgages
+    tiles in property number order
+    """
+    player = game.player_turn
+    best: Optional[monopoly.BuyableTileType] = None
+    for prop in player.proplist:
+        if isinstance(prop, monopoly.Property) and game.can_sell(prop):
+            if not isinstance(best, monopoly.Property) or prop.houses > best.houses:
+                best = prop
+    if best is not None:
+        return best
+
+    for prop in player.proplist:
+        if isinstance(prop, monopoly.Property) and prop.houses != 0:
+            continue
+        if game.can_mortgage(prop):
+            if best is None or prop.propnum < best.propnum:
+                best = prop
+    return best
+
+def stay_in_jail(game: monopoly.Monopoly) -> bool:
+    """
+    Never pays to leave jail early
+    """
+    return False
+
+
+# Results
+
+
+class GameResult():
+    """
+    Compact summary of a single finished (or abandoned) game
+    """
+
+    def __init__(self, winner: Optional[int], turns: int):
+        """
+        Parameters:
+            winner: Optional[int]: The player number of the winner, None if
+                the game hit the turn limit before finishing
+            turns: int: The number of turns that were ended
+        """
+        self.winner = winner
+        self.turns = turns
+
+
+class BatchReport():
+    """
+    Aggregate statistics for a batch of simulated games
+    """
+
+    def __init__(self):
+        """
+        Non-Parameter Attributes:
+            self.games: int: The number of games played
+            self.turns: int: The total number of turns over all games
+            self.seconds: float: The wall time spent playing the games
+            self.winners: Dict[Optional[int], int]: A dictionary mapping
+                player numbers to the number of games they won (None counts
+                the games that hit the turn limit)
+        """
+        self.games = 0
+        self.turns = 0
+        self.seconds = 0.0
+        self.winners: Dict[Optional[int], int] = {}
+
+    def add(self, result: GameResult) -> None:
+        """
+        Adds a single game result to the report
+        """
+        self.games += 1
+        self.turns += result.turns
+        self.winners[result.winner] = self.winners.get(result.winner, 0) + 1
+
+    @property
+    def games_per_second(self) -> float:
+        """
+        Returns the number of games played per second of wall time
+        """
+        if self.seconds == 0:
+            return 0.0
+        return self.games / self.seconds
+
+    @property
+    def turns_per_game(self) -> float:
+        """
+        Returns the average number of turns in a game
+        """
+        if self.games == 0:
+            return 0.0
+        return self.turns / self.games
+
+    def __str__(self) -> str:
+        """
+        Returns a printable summary of the report
+        """
+        lines = [f"Games: {self.games} in {self.seconds:.2f}s "
+            f"({self.games_per_second:.1f} games/s)",
+            f"Turns per game: {self.turns_per_game:.1f}",
+            "Winners:"]
+        for winner in sorted(self.winners, key = lambda w: (w is None, w or 0)):
+            name = "unfinished" if winner is None else f"Player {winner}"
+            count = self.winners[winner]
+            lines.append(f"    {name}: {count} ({100 * count / self.games:.1f}%)")
+        return "\n".join(lines)
+
+
+# Runner Class
+
+
+class Runner():
+    """
+    Plays games to completion by calling the Monopoly methods directly, asking
+    the decision callbacks whenever a choice has to be made
+    """
+
+    def __init__(self, buy: BuyCallback = always_buy,
+        bid: BidCallback = bid_list_price, build: BuildCallback = build_cheapest,
+        raise_money: RaiseCallback = raise_cheapest, jail: JailCallback = stay_in_jail,
+        max_turns: int = 1000):
+        """
+        Parameters:
+            buy, bid, build, raise_money, jail: The decision callbacks (see the
+                callback types above)
+            max_turns: int: The number of turns after which a game is abandoned
+        """
+        self.buy = buy
+        self.bid = bid
+        self.build = build
+        self.raise_money = raise_money
+        self.jail = jail
+        self.max_turns = max_turns
+
+    def play(self, game: monopoly.Monopoly) -> GameResult:
+        """
+        Plays the given game until it is done or hits the turn limit
+
+        Inputs:
+            game: Monopoly: The game to play
+        Outputs:
+            GameResult: The winner and length of the game
+        """
+        turns = 0
+
+        while not game.done and turns < self.max_turns:
+
+            if game.isauction:
+                self.__auction_step(game)
+                continue
+
+            if game.in_debt():
+                if not self.__raise_step(game):
+                    game.declare_bankruptcy()
+                    turns += 1
+                continue
+
+            tile = game.current_tile()
+            if (isinstance(tile, (monopoly.Property, monopoly.Railroad, monopoly.Utility))
+                and tile.owner is None):
+
+                if game.can_buy(tile) and self.buy(game, tile):
+                    game.buy_property(tile)
+                else:
+                    game.start_auction()
+                continue
+
+            if not game.turn_taken:
+                self.__roll_step(game)
+                continue
+
+            self.__build_step(game)
+            game.end_turn()
+            turns += 1
+
+        winner = game.active_players[0] if game.done else None
+        return GameResult(winner, turns)
+
+    def run(self, num_games: int, num_players: int = 4,
+        startcash: int = 1500, seed: Optional[int] = None) -> BatchReport:
+        """
+        Plays num_games fresh games and reports on them
+
+        Inputs:
+            num_games: int: The number of games to play
+            num_players, startcash: see Monopoly
+            seed: Optional[int]: The seed the game seeds are drawn from, the
+                same seed replays the same batch
+        Outputs:
+            BatchReport: The statistics of the played games
+        """
+        seeds = random.Random(seed)
+        report = BatchReport()
+        start = time.perf_counter()
+        for _ in range(num_games):
+            game = monopoly.Monopoly(num_players, startcash, seeds.getrandbits(64))
+            report.add(self.play(game))
+        report.seconds = time.perf_counter() - start
+        return report
+
+    # Turn Phase Methods
+
+    def __roll_step(self, game: monopoly.Monopoly) -> None:
+        """
+        Gets the current player out of jail if they have to (or want to) leave
+        and then takes their turn
+        """
+        player = game.player_turn
+        if player.jail == 4:
+            self.__leave_jail(game)
+        elif (1 <= player.jail <= 3 and game.turn_count == 0
+            and (player.get_out or player.money >= 50) and self.jail(game)):
+
+            self.__leave_jail(game)
+
+        if game.in_debt():
+            return
+        game.take_turn()
+
+    def __leave_jail(self, game: monopoly.Monopoly) -> None:
+        """
+        Uses a get out of jail free card if the player has one, otherwise pays
+        """
+        if game.player_turn.get_out:
+            game.get_out_free()
+        else:
+            game.pay_50_get_out()
+
+    def __build_step(self, game: monopoly.Monopoly) -> None:
+        """
+        Builds houses until the build callback stops or picks an illegal
+        property, the callback is only asked once the player owns a whole
+        color group since nothing else can be built on
+        """
+        if not any(map(operator.eq, game.player_turn.owned, COLOR_GROUP_SIZES)):
+            return
+        prop = self.build(game)
+        while prop is not None and game.can_build(prop):
+            game.build_house(prop)
+            prop = self.build(game)
+
+    def __raise_step(self, game: monopoly.Monopoly) -> bool:
+        """
+        Sells a house or mortgages a tile for the player in debt
+
+        Outputs:
+            bool: False if there was nothing left to sell or mortgage
+        """
+        tile = self.raise_money(game)
+        if tile is None or not self.__can_raise(game, tile):
+            tile = raise_cheapest(game)
+        if tile is None or not self.__can_raise(game, tile):
+            return False
+
+        if isinstance(tile, monopoly.Property) and tile.houses != 0:
+            game.sell_house(tile)
+        else:
+            game.mortgage_property(tile)
+        return True
+
+    def __can_raise(self, game: monopoly.Monopoly, tile: monopoly.BuyableTileType) -> bool:
+        """
+        Returns whether the current player can sell a house from or mortgage
+        the given tile
+        """
+        if isinstance(tile, monopoly.Property) and tile.houses != 0:
+            return game.can_sell(tile)
+        return game.can_mortgage(tile)
+
+    def __auction_step(self, game: monopoly.Monopoly) -> None:
+        """
+        Asks the current bidder for their bid and places it, or withdraws them
+        """
+        assert game.auction is not None
+        amount = self.bid(game)
+        if game.auction.current_bid < amount <= game.player_turn.money:
+            game.change_poss_bid(amount - game.poss_bid)
+            game.bid()
+        else:
+            game.withdraw()
+
+
+def main() -> None:
+    """
+    Runs a batch of games with the default callbacks and prints the report
+    """
+    parser = argparse.ArgumentParser(description = "Headless monopoly simulation")
+    parser.add_argument("-n", "--games", type = int, default = 1000)
+    parser.add_argument("-p", "--players", type = int, default = 4)
+    parser.add_argument("-c", "--startcash", type = int, default = 1500)
+    parser.add_argument("-t", "--max-turns", type = int, default = 1000)
+    parser.add_argument("-s", "--seed", type = int, default = None)
+    args = parser.parse_args()
+
+    runner = Runner(max_turns = args.max_turns)
+    print(runner.run(args.games, args.players, args.startcash, args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,452 @@
+"""
+Streaming Game Statistics
+
+Aggregates the games of very large simulation campaigns in constant memory.
+GameStats is fed events one at a time (as a game's recorder, or from an
+event log through events.read_events) or plain game results, and keeps only
+fixed size counters: win rates per property acquired, per color group
+monopoly and per seat, a landing heatmap and a game length histogram. The
+aggregates of separate workers (or runs saved to disk) merge by addition, so
+campaigns are split across processes the same way montecarlo.py splits them
+"""
+from typing import Iterable, List, Optional, Tuple
+import argparse
+import itertools
+import multiprocessing
+import random
+import time
+
+import numpy as np
+
+import events
+import monopoly
+import montecarlo
+import simulate
+
+
+"""
+The most players a game can have to be counted (the GUI's limit)
+"""
+MAX_SEATS = 8
+
+"""
+The game length histogram has LENGTH_BINS bins of LENGTH_BIN_WIDTH turns,
+followed by a bin for every longer game (including those cut off at
+simulate's default turn limit)
+"""
+LENGTH_BIN_WIDTH = 10
+LENGTH_BINS = 100
+
+"""
+PROP_GROUPS: List[int]: The color group of every propnum (-1 for railroads,
+    utilities and the unused propnum 0)
+"""
+PROP_GROUPS: List[int] = [
+    next((group for group, propnums in enumerate(monopoly.COLOR_GROUPS)
+        if propnum in propnums), -1)
+    for propnum in range(len(monopoly.PROPDICT) + 1)]
+
+"""
+UNCOUNTED_EVENTS: The frequent events that GameStats has no use for
+"""
+UNCOUNTED_EVENTS = frozenset((monopoly.EVENT_ROLL, monopoly.EVENT_LAND,
+    monopoly.EVENT_RENT, monopoly.EVENT_CARD, monopoly.EVENT_PASS_GO))
+
+"""
+LogTaskType: The work sent to a worker reading part of a log: (path, first
+    game, number of games)
+"""
+LogTaskType = Tuple[str, int, int]
+
+
+class GameStats():
+    """
+    Mergeable counters over any number of games, usable as a game's recorder
+    (see monopoly.RecorderType). Games are counted when they end, either by
+    their EVENT_GAME_END or, for games cut off by a turn limit, by the next
+    EVENT_GAME_START or end_game
+
+    Tiles and monopolies count for the players who got them by buying a tile
+    or winning it at auction, not by taking over a bankrupt player's tiles
+    (which would credit the winner with most of the board). Win rates are
+    over finished games
+    """
+
+    def __init__(self):
+        """
+        Non-Parameter Attributes:
+            self.games: int: The number of games counted
+            self.finished: int: The number of games counted that had a winner
+            self.turns: int: The total number of turns over all games
+            self.prop_games, self.prop_wins: np.ndarray: Per propnum, the
+                finished games a player acquired it in, and won
+            self.group_games, self.group_wins: np.ndarray: Per color group,
+                the finished games a player completed its monopoly in, and won
+            self.seat_games, self.seat_wins: np.ndarray: Per player number,
+                the finished games the seat was played in, and won
+            self.landings: np.ndarray: Per board position, the number of moves
+                that ended on it (rolls, cards and being sent to jail, which
+                is not an EVENT_MOVE)
+            self.lengths: np.ndarray: The game length histogram
+
+            The state of the game being counted:
+            self.in_game: bool: Whether a game has started and not been
+                counted yet
+            self.num_players: int: Its number of players
+            self.game_turns: int: Its number of turns ended
+            self.owner: List[int]: The owner of every propnum (0 for the bank)
+            self.acquired: List[int]: Per player, a bit mask of the propnums
+                they acquired
+            self.monopolies: List[int]: Per player, a bit mask of the color
+                groups they completed
+            self.game_landings: List[int]: The landings per position
+        """
+        self.games = 0
+        self.finished = 0
+        self.turns = 0
+        self.prop_games = np.zeros(len(monopoly.PROPDICT) + 1, np.int64)
+        self.prop_wins = np.zeros(len(monopoly.PROPDICT) + 1, np.int64)
+        self.group_games = np.zeros(len(monopoly.COLOR_GROUPS), np.int64)
+        self.group_wins = np.zeros(len(monopoly.COLOR_GROUPS), np.int64)
+        self.seat_games = np.zeros(MAX_SEATS + 1, np.int64)
+        self.seat_wins = np.zeros(MAX_SEATS + 1, np.int64)
+        self.landings = np.zeros(monopoly.BOARD_SIZE, np.int64)
+        self.lengths = np.zeros(LENGTH_BINS + 1, np.int64)
+
+        self.in_game = False
+        self.num_players = 0
+        self.game_turns = 0
+        self.owner = [0] * (len(monopoly.PROPDICT) + 1)
+        self.acquired = [0] * (MAX_SEATS + 1)
+        self.monopolies = [0] * (MAX_SEATS + 1)
+        self.game_landings = [0] * monopoly.BOARD_SIZE
+
+    # Counting
+
+    def __call__(self, kind: int, player: int, a: int, b: int, amount: int) -> None:
+        """
+        Counts an event (the recorder signature of Monopoly)
+        """
+        # Ordered by how often the events come
+        if kind == monopoly.EVENT_MOVE:
+            self.game_landings[b] += 1
+        elif kind == monopoly.EVENT_END_TURN:
+            self.game_turns += 1
+        elif kind in UNCOUNTED_EVENTS:
+            return
+        elif kind == monopoly.EVENT_JAIL:
+            self.game_landings[monopoly.JAIL_POS] += 1
+        elif kind == monopoly.EVENT_BUY or kind == monopoly.EVENT_AUCTION_WON:
+            self.owner[a] = player
+            self.acquired[player] |= 1 << a
+            self.__check_monopoly(player, a)
+        elif kind == monopoly.EVENT_BANKRUPT:
+            self.game_turns += 1
+            for propnum, owner in enumerate(self.owner):
+                if owner == player:
+                    self.owner[propnum] = a
+        elif kind == monopoly.EVENT_GAME_END:
+            self.end_game(player)
+        elif kind == monopoly.EVENT_GAME_START:
+            self.end_game()
+            assert a <= MAX_SEATS, f"Games of more than {MAX_SEATS} players can't be counted"
+            self.in_game = True
+            self.num_players = a
+            self.game_turns = 0
+            self.owner = [0] * len(self.owner)
+            self.acquired = [0] * len(self.acquired)
+            self.monopolies = [0] * len(self.monopolies)
+            self.game_landings = [0] * monopoly.BOARD_SIZE
+
+    def __check_monopoly(self, player: int, propnum: int) -> None:
+        """
+        Marks the player as having completed the propnum's group if they own
+        the whole group
+        """
+        group = PROP_GROUPS[propnum]
+        if group != -1 and all(self.owner[other] == player
+            for other in monopoly.COLOR_GROUPS[group]):
+
+            self.monopolies[player] |= 1 << group
+
+    def end_game(self, winner: Optional[int] = None) -> None:
+        """
+        Counts the game being recorded, if there is one
+
+        Inputs:
+            winner: Optional[int]: The winner, None if the game was cut off
+        """
+        if not self.in_game:
+            return
+        self.in_game = False
+        self.__add_game(winner, self.game_turns, self.num_players)
+        self.landings += self.game_landings
+
+        if winner is None:
+            return
+        for pnum in range(1, self.num_players + 1):
+            won = pnum == winner
+            acquired = self.acquired[pnum]
+            propnum = 0
+            while acquired:
+                if acquired & 1:
+                    self.prop_games[propnum] += 1
+                    self.prop_wins[propnum] += won
+                acquired >>= 1
+                propnum += 1
+            for group in range(len(monopoly.COLOR_GROUPS)):
+                if self.monopolies[pnum] >> group & 1:
+                    self.group_games[group] += 1
+                    self.group_wins[group] += won
+
+    def __add_game(self, winner: Optional[int], turns: int, num_players: int) -> None:
+        """
+        Counts a game's length and seat result
+        """
+        self.games += 1
+        self.turns += turns
+        self.lengths[min(turns // LENGTH_BIN_WIDTH, LENGTH_BINS)] += 1
+        if winner is not None:
+            self.finished += 1
+            self.seat_games[1:num_players + 1] += 1
+            self.seat_wins[winner] += 1
+
+    def add_events(self, game_events: Iterable[events.EventType]) -> None:
+        """
+        Counts a stream of events, like events.read_events(path) (the last
+        game is left open, see end_game)
+        """
+        for event in game_events:
+            self(*event)
+
+    def add_result(self, result: simulate.GameResult, num_players: int) -> None:
+        """
+        Counts a game known only by its result (which only adds to the game
+        lengths and seat win rates)
+        """
+        self.__add_game(result.winner, result.turns, num_players)
+
+    def merge(self, other: "GameStats") -> "GameStats":
+        """
+        Adds the counts of another aggregate (not its open game) to this one
+
+        Outputs:
+            GameStats: self
+        """
+        self.games += other.games
+        self.finished += other.finished
+        self.turns += other.turns
+        for name in ARRAYS:
+            getattr(self, name)[:] += getattr(other, name)
+        return self
+
+    # Results
+
+    def win_rates(self, games: np.ndarray, wins: np.ndarray) -> np.ndarray:
+        """
+        Returns wins / games, NaN where there were no games
+        """
+        with np.errstate(divide = "ignore", invalid = "ignore"):
+            return np.where(games > 0, wins / games, np.nan)
+
+    def length_percentile(self, q: float) -> str:
+        """
+        Returns the upper edge of the length histogram bin holding the q'th
+        quantile (0 - 1) of game lengths, or the lower edge followed by a +
+        when it is in the bin of longer games, which has no upper edge
+        """
+        index = int(np.searchsorted(np.cumsum(self.lengths), q * self.games))
+        if index >= LENGTH_BINS:
+            return f"{LENGTH_BINS * LENGTH_BIN_WIDTH}+"
+        return str((index + 1) * LENGTH_BIN_WIDTH)
+
+    def save(self, path: str) -> None:
+        """
+        Writes the counts to a .npz file
+        """
+        np.savez(path, totals = np.array([self.games, self.finished, self.turns]),
+            **{name: getattr(self, name) for name in ARRAYS})
+
+    @classmethod
+    def load(cls, path: str) -> "GameStats":
+        """
+        Reads counts written by save
+        """
+        stats = cls()
+        with np.load(path) as data:
+            stats.games, stats.finished, stats.turns = (int(total)
+                for total in data["totals"])
+            for name in ARRAYS:
+                getattr(stats, name)[:] = data[name]
+        return stats
+
+    def __str__(self) -> str:
+        """
+        Returns a printable report of the counts
+        """
+        if self.games == 0:
+            return "No games"
+        lines = [f"Games: {self.games} ({self.finished} finished), "
+            f"{self.turns / self.games:.1f} turns per game, median about "
+            f"{self.length_percentile(0.5)}"]
+
+        lines.append("Win rate by seat:")
+        seat_rates = self.win_rates(self.seat_games, self.seat_wins)
+        for seat in range(1, MAX_SEATS + 1):
+            if self.seat_games[seat]:
+                lines.append(f"    Player {seat}: {100 * seat_rates[seat]:5.1f}% "
+                    f"of {self.seat_games[seat]}")
+
+        lines.append("Win rate of the player who acquired the tile:")
+        prop_rates = self.win_rates(self.prop_games, self.prop_wins)
+        for propnum in sorted(monopoly.PROPDICT, key = lambda p: -np.nan_to_num(prop_rates[p])):
+            if self.prop_games[propnum]:
+                lines.append(f"    {monopoly.PROPDICT[propnum].name:<24}"
+                    f"{100 * prop_rates[propnum]:5.1f}% of {self.prop_games[propnum]}")
+
+        lines.append("Win rate of the player who completed the monopoly:")
+        group_rates = self.win_rates(self.group_games, self.group_wins)
+        for group in np.argsort(-np.nan_to_num(group_rates)):
+            if self.group_games[group]:
+                name = " / ".join(monopoly.PROPDICT[propnum].name
+                    for propnum in monopoly.COLOR_GROUPS[group])
+                lines.append(f"    {name:<64}{100 * group_rates[group]:5.1f}% "
+                    f"of {self.group_games[group]}")
+
+        lines.append("Landings:")
+        shares = self.landings / max(self.landings.sum(), 1)
+        for pos in range(monopoly.BOARD_SIZE):
+            lines.append(f"    {monopoly.STARTBOARD[pos].name:<24}"
+                f"{100 * shares[pos]:5.2f}% " + "#" * round(400 * shares[pos]))
+
+        lines.append("Game lengths (turns):")
+        per_row = 10
+        for row in range(0, LENGTH_BINS + 1, per_row):
+            count = int(self.lengths[row:row + per_row].sum())
+            label = (f"{row * LENGTH_BIN_WIDTH}+" if row >= LENGTH_BINS
+                else f"{row * LENGTH_BIN_WIDTH}-{(row + per_row) * LENGTH_BIN_WIDTH - 1}")
+            lines.append(f"    {label:>9} {100 * count / self.games:5.1f}% "
+                + "#" * round(50 * count / self.games))
+        return "\n".join(lines)
+
+
+"""
+ARRAYS: The counter arrays of GameStats, which merge and save go through
+"""
+ARRAYS = ("prop_games", "prop_wins", "group_games", "group_wins", "seat_games",
+    "seat_wins", "landings", "lengths")
+
+
+# Parallel Aggregation
+
+
+def play_shard_stats(shard: montecarlo.ShardType) -> GameStats:
+    """
+    Plays a shard of games inside a worker process (see
+    montecarlo.play_shard) and returns their counts
+    """
+    runner, seed, num_games, num_players, startcash = shard
+    seeds = random.Random(seed)
+
+    stats = GameStats()
+    game = monopoly.Monopoly(num_players, startcash)
+    game.recorder = stats
+    for _ in range(num_games):
+        game.reset(seeds.getrandbits(64))
+        runner.play(game)
+        stats.end_game()
+    return stats
+
+def read_log_stats(task: LogTaskType) -> GameStats:
+    """
+    Counts a range of games of an event log inside a worker process
+    """
+    path, first_game, num_games = task
+    stats = GameStats()
+    for game_events in itertools.islice(events.read_games(path, first_game), num_games):
+        stats.add_events(game_events)
+        stats.end_game()
+    return stats
+
+def simulate_stats(num_games: int, num_players: int = 4, startcash: int = 1500,
+    seed: int = 0, engine: Optional[montecarlo.MonteCarlo] = None) -> GameStats:
+    """
+    Plays num_games games on a pool of workers, merging their counts as the
+    shards finish
+
+    Inputs:
+        num_games, num_players, startcash, seed: see MonteCarlo.iter_results
+        engine: Optional[MonteCarlo]: The runner, pool size and shard size to
+            play with (defaults to MonteCarlo())
+    """
+    engine = montecarlo.MonteCarlo() if engine is None else engine
+    stats = GameStats()
+    shards = engine.shards(num_games, num_players, startcash, seed)
+    with multiprocessing.Pool(engine.processes) as pool:
+        for shard_stats in pool.imap_unordered(play_shard_stats, shards):
+            stats.merge(shard_stats)
+    return stats
+
+def log_stats(path: str, processes: Optional[int] = None,
+    games_per_task: int = 256) -> GameStats:
+    """
+    Counts every game of an event log, splitting the log into ranges of games
+    that workers seek to through the log's index
+
+    Inputs:
+        path: str: The path of the log
+        processes: Optional[int]: The number of worker processes (defaults to
+            the number of cores)
+        games_per_task: int: The number of games sent to a worker at once
+    """
+    total = events.count_games(path)
+    tasks = [(path, first, min(games_per_task, total - first))
+        for first in range(0, total, games_per_task)]
+    stats = GameStats()
+    with multiprocessing.Pool(processes) as pool:
+        for task_stats in pool.imap_unordered(read_log_stats, tasks):
+            stats.merge(task_stats)
+    return stats
+
+
+def main() -> None:
+    """
+    Counts a simulated batch of games or an event log, merged with any saved
+    counts, and prints the report
+    """
+    parser = argparse.ArgumentParser(description = "Monopoly game statistics")
+    parser.add_argument("log", nargs = "?", default = None,
+        help = "count the games of this event log instead of simulating")
+    parser.add_argument("-n", "--games", type = int, default = 10000)
+    parser.add_argument("-p", "--players", type = int, default = 4)
+    parser.add_argument("-c", "--startcash", type = int, default = 1500)
+    parser.add_argument("-t", "--max-turns", type = int, default = 1000)
+    parser.add_argument("-j", "--processes", type = int, default = None)
+    parser.add_argument("-s", "--seed", type = int, default = 0)
+    parser.add_argument("-m", "--merge", nargs = "*", default = [],
+        help = "saved counts to add in")
+    parser.add_argument("-o", "--output", default = None,
+        help = "save the merged counts to this .npz file")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.log is not None:
+        stats = log_stats(args.log, args.processes)
+    elif args.games:
+        stats = simulate_stats(args.games, args.players, args.startcash, args.seed,
+            montecarlo.MonteCarlo(simulate.Runner(max_turns = args.max_turns),
+                args.processes))
+    else:
+        stats = GameStats()
+    seconds = time.perf_counter() - start
+    print(f"Counted {stats.games} games in {seconds:.2f}s")
+
+    for path in args.merge:
+        stats.merge(GameStats.load(path))
+    if args.output is not None:
+        stats.save(args.output)
+    print(stats)
+
+
+if __name__ == "__main__":
+    main()
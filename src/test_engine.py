@@ -0,0 +1,46 @@
+"""
+Engine Tests
+
+Plays seeded games through legal_actions, choosing a random legal action at
+every step, and checks at each state that every legal action applies. The
+games are shared with the other engine test modules
+"""
+from typing import Iterator
+import random
+
+import pytest
+
+import monopoly
+
+
+SEEDS = range(6)
+PLAYERS = (2, 3, 4)
+MAX_ACTIONS = 300
+
+
+def positions(seed: int, num_players: int,
+    journal: bool = False) -> Iterator[monopoly.Monopoly]:
+    """
+    Plays a seeded game by picking random legal actions, yielding the game
+    before each action (with the undo journal on if journal is)
+    """
+    game = monopoly.Monopoly(num_players, 1500, seed)
+    if journal:
+        game.start_journal()
+    choices = random.Random(seed)
+    for _ in range(MAX_ACTIONS):
+        if game.done:
+            return
+        yield game
+        game.apply_action(choices.choice(game.legal_actions()))
+
+
+@pytest.mark.parametrize("num_players", PLAYERS)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_legal_actions_apply(seed: int, num_players: int) -> None:
+    for game in positions(seed, num_players):
+        actions = game.legal_actions()
+        assert actions
+        assert len(set(actions)) == len(actions)
+        for code in actions:
+            game.fork().apply_action(code)
@@ -0,0 +1,119 @@
+"""
+Event Log Tests
+
+Records seeded games into logs with small blocks, so that the games cross
+many index records, and checks that appending in several sessions, resuming
+cut logs and jumping to a game through the index all agree with a full scan
+"""
+from typing import List, Sequence
+import os
+
+import pytest
+
+import events
+import monopoly
+import simulate
+
+
+BLOCK_RECORDS = 3
+SEEDS = list(range(8))
+MAX_TURNS = 6
+
+
+def record(path: str, seeds: Sequence[int], block_records: int = BLOCK_RECORDS) -> None:
+    """
+    Appends a short game per seed to the log at path
+    """
+    runner = simulate.Runner(max_turns = MAX_TURNS)
+    game = monopoly.Monopoly(3)
+    with events.EventWriter(path, block_records) as writer:
+        game.recorder = writer
+        for seed in seeds:
+            game.reset(seed)
+            runner.play(game)
+
+def check_index(path: str) -> List[List[events.EventType]]:
+    """
+    Checks that count_games and every jump to a game through the index agree
+    with a full scan of the log, returning the scanned games
+    """
+    games = list(events.read_games(path))
+    assert events.count_games(path) == len(games)
+    for number, game in enumerate(games):
+        assert next(events.read_games(path, number)) == game
+    assert list(events.read_games(path, len(games))) == []
+    return games
+
+def read_bytes(path: str) -> bytes:
+    """
+    Returns the contents of a file
+    """
+    with open(path, "rb") as file:
+        return file.read()
+
+
+@pytest.fixture(name = "whole")
+def fixture_whole(tmp_path) -> str:
+    """
+    A log of every seed written in one session
+    """
+    path = str(tmp_path / "whole.mnev")
+    record(path, SEEDS)
+    return path
+
+
+def test_index_matches_scan(whole: str) -> None:
+    games = check_index(whole)
+    assert [events.game_seed(game) for game in games] == SEEDS
+
+
+@pytest.mark.parametrize("split", [1, 3, 5])
+def test_append_sessions(tmp_path, whole: str, split: int) -> None:
+    path = str(tmp_path / "appended.mnev")
+    record(path, SEEDS[:split])
+    # The second session keeps the log's own block size
+    record(path, SEEDS[split:], BLOCK_RECORDS + 4)
+    assert read_bytes(path) == read_bytes(whole)
+    check_index(path)
+
+
+def cuts(path: str) -> List[int]:
+    """
+    Returns the sizes to cut the log at: after every record and in the middle
+    of every record
+    """
+    size = os.path.getsize(path)
+    ends = range(events.LOG_HEADER.size, size, events.EVENT_RECORD.size)
+    return sorted(list(ends) + [end + 3 for end in ends])
+
+
+def test_resume_cut_logs(tmp_path, whole: str) -> None:
+    data = read_bytes(whole)
+    full = list(events.read_games(whole))
+    path = str(tmp_path / "cut.mnev")
+    for cut in cuts(whole):
+        with open(path, "wb") as file:
+            file.write(data[:cut])
+        kept = list(events.read_games(path))
+        record(path, SEEDS[:2])
+
+        games = check_index(path)
+        assert len(games) == len(kept) + 2
+        # Every game that was wholly before the cut is unchanged
+        whole_games = max(len(kept) - 1, 0)
+        assert games[:whole_games] == full[:whole_games]
+        assert games[len(kept):] == full[:2]
+
+
+@pytest.mark.parametrize("block", [1, 2, 5])
+def test_resume_after_full_block(tmp_path, whole: str, block: int) -> None:
+    stride = (BLOCK_RECORDS + 1) * events.EVENT_RECORD.size
+    # Cut between a block's last event and its index record
+    cut = events.LOG_HEADER.size + block * stride - events.INDEX_RECORD.size
+    path = str(tmp_path / "cut.mnev")
+    with open(path, "wb") as file:
+        file.write(read_bytes(whole)[:cut])
+    record(path, [])
+
+    assert read_bytes(path) == read_bytes(whole)[:cut + events.INDEX_RECORD.size]
+    check_index(path)
@@ -0,0 +1,38 @@
+"""
+Fork Tests
+
+Checks that forks of seeded games played through legal_actions start equal
+to their parent and are unaffected by the parent's later moves, and that a
+fork made without a new seed rolls the same dice as its parent (see
+test_engine)
+"""
+import pytest
+
+import monopoly
+from test_engine import PLAYERS, SEEDS, positions
+
+
+@pytest.mark.parametrize("num_players", PLAYERS)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_fork_is_independent(seed: int, num_players: int) -> None:
+    forks = []
+    for game in positions(seed, num_players):
+        child = game.fork()
+        data = game.to_bytes()
+        assert child.to_bytes() == data
+        forks.append((child, data))
+    for child, data in forks:
+        assert child.to_bytes() == data
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_seeded_fork_replays_parent(seed: int) -> None:
+    game = monopoly.Monopoly(3, 1500, seed)
+    child = game.fork()
+    for _ in range(50):
+        if game.done:
+            break
+        code = game.legal_actions()[0]
+        game.apply_action(code)
+        child.apply_action(code)
+        assert child.to_bytes() == game.to_bytes()
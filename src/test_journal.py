@@ -0,0 +1,33 @@
+"""
+Undo Journal Tests
+
+Checks that undo rolls seeded games played through legal_actions back to the
+exact state before each action (see test_engine)
+"""
+import pytest
+
+from test_engine import PLAYERS, SEEDS, positions
+
+
+@pytest.mark.parametrize("num_players", PLAYERS)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_undo_every_legal_action(seed: int, num_players: int) -> None:
+    for game in positions(seed, num_players, journal = True):
+        before = game.to_bytes()
+        for code in game.legal_actions():
+            game.apply_action(code)
+            game.undo()
+            assert game.to_bytes() == before, f"Undoing action {code}"
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_undo_whole_game(seed: int) -> None:
+    history = []
+    game = None
+    for game in positions(seed, 3, journal = True):
+        history.append(game.to_bytes())
+    assert game is not None
+    for data in reversed(history):
+        game.undo()
+        assert game.to_bytes() == data
+    assert not game.can_undo()
@@ -0,0 +1,95 @@
+"""
+Replay Tests
+
+Records seeded games into an event log and with ReplayRecorder, and checks
+that their replays produce the same events, that jumping to a turn from a
+keyframe gives the same game as replaying from the start and that saved
+replays load back unchanged
+"""
+from typing import List
+
+import pytest
+
+import events
+import monopoly
+import replay
+import simulate
+
+
+SEEDS = range(5)
+MAX_TURNS = 120
+KEYFRAME_TURNS = 10
+
+
+@pytest.fixture(name = "log", scope = "module")
+def fixture_log(tmp_path_factory) -> str:
+    """
+    An event log of a game per seed
+    """
+    path = str(tmp_path_factory.mktemp("replay") / "games.mnev")
+    runner = simulate.Runner(max_turns = MAX_TURNS)
+    game = monopoly.Monopoly(3)
+    with events.EventWriter(path) as writer:
+        game.recorder = writer
+        for seed in SEEDS:
+            game.reset(seed)
+            runner.play(game)
+    return path
+
+def recorded(seed: int) -> replay.Replay:
+    """
+    Plays a seeded game, returning its replay with the final snapshot
+    """
+    recorder = replay.ReplayRecorder()
+    game = monopoly.Monopoly(3)
+    recorder.start(game, seed)
+    simulate.Runner(max_turns = MAX_TURNS).play(game)
+    return recorder.finish(game)
+
+
+def test_replays_match_log(log: str) -> None:
+    games = list(events.read_games(log))
+    assert len(games) == len(SEEDS)
+    for game_events in games:
+        # The replay's events leave out the game start and its seed
+        logged = [event for event in game_events[1:]
+            if event[0] != monopoly.EVENT_GAME_SEED]
+        played: List[events.EventType] = []
+        replay.Replay.from_events(game_events).play(
+            recorder = lambda *event: played.append(event))
+        assert played == logged
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_game_at_keyframe(seed: int) -> None:
+    keyed = recorded(seed)
+    assert keyed.play(KEYFRAME_TURNS).to_bytes() == keyed.final
+    assert keyed.keyframes
+    plain = replay.Replay(keyed.num_players, keyed.startcash, keyed.seed,
+        keyed.decisions)
+
+    turns = keyed.turns
+    for turn in (0, 5, KEYFRAME_TURNS, 2 * KEYFRAME_TURNS + 3, 40, turns):
+        assert keyed.game_at(turn).to_bytes() == plain.game_at(turn).to_bytes()
+    for turn, game in plain.states(KEYFRAME_TURNS):
+        assert keyed.game_at(turn).to_bytes() == game.to_bytes()
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_save_load(tmp_path, seed: int) -> None:
+    saved = recorded(seed)
+    saved.play(KEYFRAME_TURNS)
+    path = str(tmp_path / "game.mnrp")
+    saved.save(path)
+
+    loaded = replay.Replay.load(path)
+    assert (loaded.num_players, loaded.startcash, loaded.seed) == (
+        saved.num_players, saved.startcash, saved.seed)
+    assert loaded.decisions == saved.decisions
+    assert loaded.final == saved.final
+    assert loaded.keyframes == saved.keyframes
+    assert loaded.verify()
+    for turn, _, _, _ in loaded.keyframes:
+        # Rolling on from a keyframe needs its random number generator state
+        assert (loaded.game_at(turn + 1).to_bytes()
+            == saved.game_at(turn + 1).to_bytes())
@@ -0,0 +1,20 @@
+"""
+Snapshot Tests
+
+Checks that to_bytes and from_bytes round trip at every state of seeded games
+played through legal_actions (see test_engine)
+"""
+import pytest
+
+import monopoly
+from test_engine import PLAYERS, SEEDS, positions
+
+
+@pytest.mark.parametrize("num_players", PLAYERS)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_snapshot_round_trip(seed: int, num_players: int) -> None:
+    for game in positions(seed, num_players):
+        data = game.to_bytes()
+        restored = monopoly.Monopoly.from_bytes(data)
+        assert restored.to_bytes() == data
+        assert restored.legal_actions() == game.legal_actions()
@@ -0,0 +1,409 @@
+"""
+Round Robin Tournaments
+
+Runs a league between registered bot policies: every group of num_players
+policies (a pairing) plays the same seeded games, each one once per seat
+rotation so that no policy keeps the advantage of a seat. The games are
+split into units of a few rounds that are played on a pool of worker
+processes, and the results update Elo ratings in schedule order, so a league
+gives the same ratings however many processes play it
+
+Progress is saved to a JSON checkpoint as the league goes, running a league
+again with the same checkpoint continues where it stopped
+"""
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import time
+
+import bots
+import mcts
+
+
+"""
+POLICIES: Dict[str, Callable[[], PlayerPolicy]]: The policies a league can
+    be made of, by name. The MCTS bot searches in its worker's process since
+    pool workers can't start pools of their own
+"""
+POLICIES: Dict[str, Callable[[], bots.PlayerPolicy]] = dict(bots.POLICIES)
+POLICIES["mcts"] = lambda: mcts.MCTSPolicy(processes = 1)
+
+"""
+The version of the checkpoint format written by League.save
+"""
+CHECKPOINT_VERSION = 1
+
+"""
+UnitType: The work sent to a worker: (policy names in seat order, first
+    round, number of rounds, starting cash, turn limit, league seed)
+SummaryType: The result of one game: (the index of the winning policy in the
+    unit's names or None if the game hit the turn limit, turns)
+"""
+UnitType = Tuple[Tuple[str, ...], int, int, int, int, int]
+SummaryType = Tuple[Optional[int], int]
+
+
+def round_seed(seed: int, round_: int) -> int:
+    """
+    Returns the game seed of a round of a league, the same in every process
+    """
+    return random.Random(f"{seed}:{round_}").getrandbits(64)
+
+"""
+The self play drivers of a worker process by unit configuration, so that the
+policies and the game object are reused from unit to unit
+"""
+_SELFPLAY: Dict[Tuple[Tuple[str, ...], int, int], bots.SelfPlay] = {}
+
+def play_unit(unit: UnitType) -> List[SummaryType]:
+    """
+    Plays a unit inside a worker: every round's game once per seat rotation
+
+    Inputs:
+        unit: UnitType: The unit to play
+    Outputs:
+        List[SummaryType]: The results, rotations of a round next to each
+            other and rounds in order
+    """
+    names, first, rounds, startcash, max_turns, seed = unit
+    key = (names, startcash, max_turns)
+    selfplay = _SELFPLAY.get(key)
+    if selfplay is None:
+        selfplay = bots.SelfPlay([POLICIES[name]() for name in names],
+            startcash, max_turns)
+        _SELFPLAY[key] = selfplay
+
+    summaries = []
+    for round_ in range(first, first + rounds):
+        game_seed = round_seed(seed, round_)
+        for rotation in range(len(names)):
+            result = selfplay.play(game_seed, rotation)
+            winner = None if result.winner is None else result.winner - 1
+            summaries.append((winner, result.turns))
+    return summaries
+
+
+class PolicyStats():
+    """
+    The running record of one policy in a league
+    """
+
+    def __init__(self, rating: float):
+        """
+        Parameters:
+            rating: float: The starting Elo rating
+
+        Non-Parameter Attributes:
+            self.games: int: The number of games played
+            self.wins: int: The number of games won
+            self.unfinished: int: The number of games that hit the turn limit
+            self.turns: int: The total length of the games played
+        """
+        self.rating = rating
+        self.games = 0
+        self.wins = 0
+        self.unfinished = 0
+        self.turns = 0
+
+    def to_dict(self) -> Dict[str, float]:
+        """
+        Returns the stats as a JSON friendly dictionary
+        """
+        return {"rating": self.rating, "games": self.games, "wins": self.wins,
+            "unfinished": self.unfinished, "turns": self.turns}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, float]) -> "PolicyStats":
+        """
+        Rebuilds stats saved with to_dict
+        """
+        stats = cls(float(data["rating"]))
+        stats.games = int(data["games"])
+        stats.wins = int(data["wins"])
+        stats.unfinished = int(data["unfinished"])
+        stats.turns = int(data["turns"])
+        return stats
+
+
+class League():
+    """
+    A resumable round robin league between named policies
+    """
+
+    def __init__(self, policies: Sequence[str], num_players: int = 2,
+        startcash: int = 1500, max_turns: int = 1000, rounds: int = 100,
+        unit_rounds: int = 8, seed: int = 0, k: float = 16.0,
+        initial_rating: float = 1500.0):
+        """
+        Parameters:
+            policies: Sequence[str]: The names of the policies (see POLICIES)
+            num_players: int: The number of players in each game, every
+                combination of this many policies is a pairing
+            startcash: int: The starting cash of every player
+            max_turns: int: The number of turns after which a game is
+                abandoned (counted as a draw between its players)
+            rounds: int: The number of seeds every pairing plays, each once
+                per seat rotation
+            unit_rounds: int: The number of rounds sent to a worker at once
+            seed: int: The seed the round seeds are drawn from
+            k: float: The Elo K factor
+            initial_rating: float: The rating every policy starts at
+
+        Non-Parameter Attributes:
+            self.pairings: List[Tuple[str, ...]]: The policy groups that play
+                each other, in schedule order
+            self.stats: Dict[str, PolicyStats]: The record of every policy
+            self.next_unit: int: The index of the first unit not yet played
+        """
+        assert len(set(policies)) == len(policies), "Policy names must be unique"
+        for name in policies:
+            assert name in POLICIES, f"Unknown policy {name}"
+        assert 2 <= num_players <= len(policies), \
+            "A league needs at least as many policies as players in a game"
+        assert unit_rounds >= 1, "Units must contain at least 1 round"
+
+        self.policies = list(policies)
+        self.num_players = num_players
+        self.startcash = startcash
+        self.max_turns = max_turns
+        self.rounds = rounds
+        self.unit_rounds = unit_rounds
+        self.seed = seed
+        self.k = k
+        self.initial_rating = initial_rating
+        self.pairings: List[Tuple[str, ...]] = list(
+            itertools.combinations(self.policies, num_players))
+        self.stats = {name: PolicyStats(initial_rating) for name in self.policies}
+        self.next_unit = 0
+
+    @property
+    def blocks(self) -> int:
+        """
+        The number of unit sized blocks of rounds
+        """
+        return -(-self.rounds // self.unit_rounds)
+
+    @property
+    def num_units(self) -> int:
+        """
+        The total number of units in the league
+        """
+        return self.blocks * len(self.pairings)
+
+    @property
+    def done(self) -> bool:
+        """
+        Whether every unit has been played
+        """
+        return self.next_unit >= self.num_units
+
+    def unit(self, index: int) -> UnitType:
+        """
+        Returns the unit with the given index, units go through every pairing
+        for a block of rounds before moving on to the next block, so the
+        ratings stay balanced at any point of a long league
+        """
+        block, pairing = divmod(index, len(self.pairings))
+        first = block * self.unit_rounds
+        rounds = min(self.unit_rounds, self.rounds - first)
+        return (self.pairings[pairing], first, rounds, self.startcash,
+            self.max_turns, self.seed)
+
+    def units(self, start: int) -> Iterator[UnitType]:
+        """
+        Yields the units from the given index on
+        """
+        for index in range(start, self.num_units):
+            yield self.unit(index)
+
+    # Rating Methods
+
+    def record(self, names: Sequence[str], winner: Optional[int], turns: int) -> None:
+        """
+        Adds a game to the stats and updates the ratings: the winner beats
+        every other player of the game, and an unfinished game is a draw
+        between all of them
+
+        Inputs:
+            names: Sequence[str]: The policies that played the game
+            winner: Optional[int]: The index of the winner in names, None if
+                the game was unfinished
+            turns: int: The length of the game
+        """
+        ratings = [self.stats[name].rating for name in names]
+        changes = [0.0] * len(names)
+        for first, second in itertools.combinations(range(len(names)), 2):
+            if winner is None:
+                score = 0.5
+            elif winner == first:
+                score = 1.0
+            elif winner == second:
+                score = 0.0
+            else:
+                # Neither won, the game says nothing about the two of them
+                continue
+            expected = 1 / (1 + 10 ** ((ratings[second] - ratings[first]) / 400))
+            changes[first] += self.k * (score - expected)
+            changes[second] -= self.k * (score - expected)
+
+        for index, name in enumerate(names):
+            stats = self.stats[name]
+            stats.rating += changes[index]
+            stats.games += 1
+            stats.turns += turns
+            if winner is None:
+                stats.unfinished += 1
+            elif winner == index:
+                stats.wins += 1
+
+    # Checkpoint Methods
+
+    @property
+    def config(self) -> Dict[str, object]:
+        """
+        The settings that define the league's schedule, a checkpoint can only
+        be resumed by a league with the same config
+        """
+        return {"policies": self.policies, "num_players": self.num_players,
+            "startcash": self.startcash, "max_turns": self.max_turns,
+            "rounds": self.rounds, "unit_rounds": self.unit_rounds,
+            "seed": self.seed, "k": self.k, "initial_rating": self.initial_rating}
+
+    def save(self, path: str) -> None:
+        """
+        Writes the league's progress to a JSON checkpoint, replacing the file
+        in one step so an interrupted save never leaves half a checkpoint
+        """
+        data = {"version": CHECKPOINT_VERSION, "config": self.config,
+            "next_unit": self.next_unit,
+            "stats": {name: stats.to_dict() for name, stats in self.stats.items()}}
+        temp = f"{path}.{os.getpid()}.tmp"
+        with open(temp, "w") as file:
+            json.dump(data, file, indent = 1)
+        os.replace(temp, path)
+
+    def load(self, path: str) -> None:
+        """
+        Restores the progress saved by save
+
+        Raises:
+            AssertionError if the checkpoint was written by a different
+                version or for a league with a different config
+        """
+        with open(path) as file:
+            data = json.load(file)
+        assert data["version"] == CHECKPOINT_VERSION, \
+            f"Unsupported checkpoint version {data['version']}"
+        assert data["config"] == self.config, \
+            "The checkpoint belongs to a league with different settings"
+        self.next_unit = data["next_unit"]
+        self.stats = {name: PolicyStats.from_dict(stats)
+            for name, stats in data["stats"].items()}
+
+    def run(self, processes: Optional[int] = None, checkpoint: Optional[str] = None,
+        checkpoint_every: float = 60.0, max_units: Optional[int] = None) -> None:
+        """
+        Plays the rest of the league, resuming from the checkpoint if it
+        exists. Stopping it (eg. with ctrl-c) keeps every finished unit
+
+        Inputs:
+            processes: Optional[int]: The number of worker processes (defaults
+                to the number of cores)
+            checkpoint: Optional[str]: The path of the JSON checkpoint, None
+                disables checkpoints
+            checkpoint_every: float: The seconds between checkpoint saves
+            max_units: Optional[int]: The most units to play in this call
+        """
+        if checkpoint is not None and os.path.exists(checkpoint):
+            self.load(checkpoint)
+
+        end = self.num_units if max_units is None else min(
+            self.num_units, self.next_unit + max_units)
+        units = itertools.islice(self.units(self.next_unit), end - self.next_unit)
+        saved = time.perf_counter()
+        try:
+            with multiprocessing.Pool(processes) as pool:
+                # imap keeps the schedule order, which the ratings depend on
+                for summaries in pool.imap(play_unit, units):
+                    names = self.unit(self.next_unit)[0]
+                    before = {name: self.stats[name] for name in names}
+                    self.stats.update((name, PolicyStats.from_dict(
+                        stats.to_dict())) for name, stats in before.items())
+                    try:
+                        for winner, turns in summaries:
+                            self.record(names, winner, turns)
+                        self.next_unit += 1
+                    except BaseException:
+                        # Never save half a unit, it is played again on resume
+                        self.stats.update(before)
+                        raise
+
+                    if (checkpoint is not None
+                        and time.perf_counter() - saved >= checkpoint_every):
+
+                        self.save(checkpoint)
+                        saved = time.perf_counter()
+        finally:
+            if checkpoint is not None:
+                self.save(checkpoint)
+
+    def __str__(self) -> str:
+        """
+        Returns the standings, best rated first
+        """
+        games = sum(stats.games for stats in self.stats.values()) // self.num_players
+        lines = [f"Units: {self.next_unit}/{self.num_units}, games: {games}",
+            f"{'Policy':<16}{'Rating':>8}{'Games':>10}{'Won':>8}{'Unfinished':>12}"]
+        for name, stats in sorted(self.stats.items(),
+            key = lambda item: -item[1].rating):
+
+            won = 100 * stats.wins / stats.games if stats.games else 0.0
+            unfinished = 100 * stats.unfinished / stats.games if stats.games else 0.0
+            lines.append(f"{name:<16}{stats.rating:8.1f}{stats.games:10}"
+                f"{won:7.1f}%{unfinished:11.1f}%")
+        return "\n".join(lines)
+
+
+def main() -> None:
+    """
+    Runs (or continues) a league and prints the standings
+    """
+    parser = argparse.ArgumentParser(description = "Monopoly bot league")
+    parser.add_argument("policies", nargs = "*", help = "the policies in the "
+        f"league, from {', '.join(sorted(POLICIES))} (defaults to rent and "
+        "default)")
+    parser.add_argument("-p", "--players", type = int, default = 2)
+    parser.add_argument("-c", "--startcash", type = int, default = 1500)
+    parser.add_argument("-t", "--max-turns", type = int, default = 1000)
+    parser.add_argument("-r", "--rounds", type = int, default = 100,
+        help = "seeds played by every pairing")
+    parser.add_argument("-u", "--unit-rounds", type = int, default = 8)
+    parser.add_argument("-j", "--processes", type = int, default = None)
+    parser.add_argument("-s", "--seed", type = int, default = 0)
+    parser.add_argument("-k", type = float, default = 16.0)
+    parser.add_argument("--checkpoint", default = None,
+        help = "JSON file to save progress to and resume from")
+    args = parser.parse_args()
+    if not args.policies:
+        args.policies = ["rent", "default"]
+    for name in args.policies:
+        if name not in POLICIES:
+            parser.error(f"unknown policy {name}")
+
+    league = League(args.policies, args.players, args.startcash,
+        args.max_turns, args.rounds, args.unit_rounds, args.seed, args.k)
+    start = time.perf_counter()
+    try:
+        league.run(args.processes, args.checkpoint)
+    except KeyboardInterrupt:
+        print("Stopped, progress kept" if args.checkpoint else "Stopped")
+    print(league)
+    print(f"{time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,538 @@
+"""
+Vectorized Monopoly Engine
+
+Plays many games of monopoly in lockstep, holding the state of every game in
+NumPy arrays (one row per game) and advancing all of them with a single roll
+per step. The rules follow Monopoly.take_turn, Monopoly.__apply_move and the
+rent methods of Property, Railroad and Utility, with the players making the
+same choices as the default callbacks in simulate.py:
+    buy every tile they can afford, otherwise auction it with everyone
+        bidding the list price (or all their money if that is less)
+    stay in jail until the 3rd turn, then pay $50
+    sell houses, then mortgage tiles in property number order when in debt
+Differences from the object engine:
+    players never build (houses can be set directly on self.houses to study
+        developed boards) and houses are sold back all at once when in debt
+"""
+from typing import Callable, Dict, List, Optional
+import argparse
+import time
+
+import numpy as np
+
+import monopoly
+import simulate
+
+
+# Square Kinds
+
+NOTHING = 0
+BUYABLE = 1
+CHANCE = 2
+COMMUNITY_CHEST = 3
+GO_TO_JAIL = 4
+FREE_PARKING = 5
+INCOME_TAX = 6
+LUXURY_TAX = 7
+
+# Buyable Tile Kinds
+
+PROPERTY = 0
+RAILROAD = 1
+UTILITY = 2
+
+# Card Effects
+
+NO_EFFECT = 0
+ADVANCE_TO_GO = 1
+GO_TO_JAIL_CARD = 2
+SCHOOL_TAX = 3
+
+CARD_EFFECTS: Dict[Callable[[monopoly.Monopoly], None], int] = {
+    monopoly.advance_to_go: ADVANCE_TO_GO,
+    monopoly.go_to_jail: GO_TO_JAIL_CARD,
+    monopoly.school_tax: SCHOOL_TAX}
+
+EVENT_EFFECTS = {
+    monopoly.go_tile: NOTHING,
+    monopoly.jail_tile: NOTHING,
+    monopoly.free_parking: FREE_PARKING,
+    monopoly.go_to_jail_tile: GO_TO_JAIL,
+    monopoly.income_tax: INCOME_TAX,
+    monopoly.luxury_tax: LUXURY_TAX}
+
+
+# Board Tables
+
+
+NUM_SQUARES = monopoly.BOARD_SIZE
+NUM_PROPS = len(monopoly.PROPDICT)
+GO_SQUARE = monopoly.GO_POS
+JAIL_SQUARE = monopoly.JAIL_POS
+
+"""
+SQUARE_KIND: The kind of each square
+SQUARE_PROP: The property index (propnum - 1) of each buyable square, -1 otherwise
+"""
+SQUARE_KIND = np.zeros(NUM_SQUARES, dtype = np.int8)
+SQUARE_PROP = np.full(NUM_SQUARES, -1, dtype = np.int64)
+
+for _tile in monopoly.STARTBOARD:
+    if isinstance(_tile, (monopoly.Property, monopoly.Railroad, monopoly.Utility)):
+        SQUARE_KIND[_tile.pos] = BUYABLE
+        SQUARE_PROP[_tile.pos] = _tile.propnum - 1
+    elif isinstance(_tile, monopoly.ChanceTile):
+        SQUARE_KIND[_tile.pos] = CHANCE
+    elif isinstance(_tile, monopoly.CommunityChestTile):
+        SQUARE_KIND[_tile.pos] = COMMUNITY_CHEST
+    else:
+        assert _tile.effect in EVENT_EFFECTS, f"No vectorized effect for {_tile.name}"
+        SQUARE_KIND[_tile.pos] = EVENT_EFFECTS[_tile.effect]
+
+"""
+Per property tables, indexed by propnum - 1:
+PROP_KIND: PROPERTY, RAILROAD or UTILITY
+PROP_GROUP: The color group (0 - 7), 8 for railroads and 9 for utilities
+PRICE, MORTGAGE, HOUSE_PRICE: The purchase, mortgage and house prices
+RENTS: The rent with 0 - 5 houses (zero for railroads and utilities)
+GROUP_SIZE: The number of tiles in each group
+RAILROAD_RENTS: The railroad rent indexed by the number of railroads owned
+"""
+PROP_KIND = np.zeros(NUM_PROPS, dtype = np.int8)
+PROP_GROUP = np.zeros(NUM_PROPS, dtype = np.int64)
+PRICE = np.zeros(NUM_PROPS, dtype = np.int64)
+MORTGAGE = np.zeros(NUM_PROPS, dtype = np.int64)
+HOUSE_PRICE = np.zeros(NUM_PROPS, dtype = np.int64)
+RENTS = np.zeros((NUM_PROPS, 6), dtype = np.int64)
+RAILROAD_RENTS = np.zeros(5, dtype = np.int64)
+
+for _propnum, _prop in monopoly.PROPDICT.items():
+    assert isinstance(_prop, (monopoly.Property, monopoly.Railroad, monopoly.Utility))
+    _index = _propnum - 1
+    PRICE[_index] = _prop.price
+    PROP_GROUP[_index] = _prop.group
+    MORTGAGE[_index] = _prop.mortgage_price
+    if isinstance(_prop, monopoly.Property):
+        PROP_KIND[_index] = PROPERTY
+        HOUSE_PRICE[_index] = _prop.house_price
+        RENTS[_index] = _prop.rents
+    elif isinstance(_prop, monopoly.Railroad):
+        PROP_KIND[_index] = RAILROAD
+        RAILROAD_RENTS[:] = _prop.rents
+    else:
+        PROP_KIND[_index] = UTILITY
+
+GROUP_SIZE = np.array(monopoly.GROUP_SIZES, dtype = np.int64)
+
+"""
+DECK_EFFECTS: The card effects of the chance (0) and community chest (1) decks
+"""
+DECK_EFFECTS: List[np.ndarray] = []
+for _deck in (monopoly.CHANCE_DECK, monopoly.COMMUNITY_CHEST_DECK):
+    DECK_EFFECTS.append(np.array(
+        [CARD_EFFECTS.get(_deck[cardnum].effect, NO_EFFECT) for cardnum in range(len(_deck))],
+        dtype = np.int8))
+
+
+# Class to represent many games of Monopoly
+
+
+class VectorMonopoly():
+    """
+    num_games games of monopoly stored as arrays, each step rolls the dice
+    once for the current player of every unfinished game
+    """
+
+    def __init__(self, num_games: int, num_players: int = 4, startcash: int = 1500,
+        seed: Optional[int] = None, max_turns: int = 1000):
+        """
+        Parameters:
+            num_games: int: The number of games played in lockstep
+            num_players, startcash: see Monopoly
+            seed: Optional[int]: Seed for the dice and deck shuffles
+            max_turns: int: The number of turns after which a game is abandoned
+        Non-Parameter Attributes (games are rows, players/properties columns,
+            players are numbered from 0):
+            self.pos: The square each player is on
+            self.cash: The money each player has
+            self.alive: Whether each player is still in the game
+            self.jail: Each player's jail counter (see Player.jail)
+            self.owner: The owner of each property (-1 for the bank)
+            self.houses: The number of houses on each property (5 is a hotel)
+            self.mortgaged: Whether each property is mortgaged
+            self.turn: The player who's turn it is
+            self.doubles: The number of doubles rolled this turn (turn_count)
+            self.center: The money in the center (free parking)
+            self.turns: The number of turns ended in each game
+            self.done: Whether each game is over
+            self.winner: The winner of each game (-1 if unfinished/abandoned)
+            self.deck_order, self.deck_left: The shuffled order of the chance
+                and community chest decks and the number of cards left in them
+            self.landings: The number of moves that ended on each square
+            self.rolls: The total number of rolls made
+        """
+        assert num_players >= 2, "Must have at least 2 players"
+
+        self.num_games = num_games
+        self.num_players = num_players
+        self.max_turns = max_turns
+        self.rng = np.random.default_rng(seed)
+
+        shape = (num_games, num_players)
+        self.pos = np.full(shape, GO_SQUARE, dtype = np.int64)
+        self.cash = np.full(shape, startcash, dtype = np.int64)
+        self.alive = np.ones(shape, dtype = bool)
+        self.jail = np.zeros(shape, dtype = np.int8)
+
+        self.owner = np.full((num_games, NUM_PROPS), -1, dtype = np.int64)
+        self.houses = np.zeros((num_games, NUM_PROPS), dtype = np.int64)
+        self.mortgaged = np.zeros((num_games, NUM_PROPS), dtype = bool)
+
+        self.turn = np.zeros(num_games, dtype = np.int64)
+        self.doubles = np.zeros(num_games, dtype = np.int64)
+        self.center = np.zeros(num_games, dtype = np.int64)
+        self.turns = np.zeros(num_games, dtype = np.int64)
+        self.done = np.zeros(num_games, dtype = bool)
+        self.winner = np.full(num_games, -1, dtype = np.int64)
+
+        self.deck_order = [self.__shuffled(num_games, len(effects)) for effects in DECK_EFFECTS]
+        self.deck_left = [np.full(num_games, len(effects), dtype = np.int64)
+            for effects in DECK_EFFECTS]
+
+        self.landings = np.zeros(NUM_SQUARES, dtype = np.int64)
+        self.rolls = 0
+
+    # Stepping Methods
+
+    def step(self) -> None:
+        """
+        Rolls the dice once for the current player of every unfinished game and
+        resolves the roll
+        """
+        g = np.flatnonzero(~self.done)
+        if g.size == 0:
+            return
+        p = self.turn[g]
+
+        # Players who have spent 3 turns in jail have to pay before rolling
+        forced = self.jail[g, p] == 4
+        if forced.any():
+            gf, pf = g[forced], p[forced]
+            self.cash[gf, pf] -= 50
+            self.jail[gf, pf] = 0
+            broke = self.__settle(gf)
+            if broke.size != 0:
+                keep = ~np.isin(g, broke)
+                g, p = g[keep], p[keep]
+
+        d1 = self.rng.integers(1, 7, g.size)
+        d2 = self.rng.integers(1, 7, g.size)
+        self.rolls += g.size
+        rolled_doubles = d1 == d2
+        in_jail = self.jail[g, p] != 0
+
+        # In jail, doubles free the player, anything else is another turn inside
+        stuck = in_jail & ~rolled_doubles
+        self.jail[g[stuck], p[stuck]] += 1
+        freed = in_jail & rolled_doubles
+        self.jail[g[freed], p[freed]] = 0
+
+        again = rolled_doubles & ~in_jail
+        self.doubles[g] = np.where(again, self.doubles[g] + 1, 0)
+        speeding = self.doubles[g] == 3
+        self.__send_jail(g[speeding], p[speeding])
+
+        ends = ~again | speeding
+        moving = ~stuck & ~speeding
+        gm, pm = g[moving], p[moving]
+        jailed = self.__move(gm, pm, (d1 + d2)[moving])
+        ends[np.flatnonzero(moving)[jailed]] = True
+
+        broke = self.__settle(gm)
+        if broke.size != 0:
+            ends &= ~np.isin(g, broke)
+        self.__end_turn(g[ends])
+
+    def run(self) -> simulate.BatchReport:
+        """
+        Steps until every game is done or abandoned
+
+        Outputs:
+            BatchReport: The statistics of the games (players numbered from 1
+                as in Monopoly)
+        """
+        start = time.perf_counter()
+        while not self.done.all():
+            self.step()
+        seconds = time.perf_counter() - start
+
+        report = simulate.BatchReport()
+        for winner, turns in zip(self.winner.tolist(), self.turns.tolist()):
+            report.add(simulate.GameResult(winner + 1 if winner >= 0 else None, turns))
+        report.seconds = seconds
+        return report
+
+    # Movement + Landing Methods
+
+    def __move(self, g: np.ndarray, p: np.ndarray, roll: np.ndarray) -> np.ndarray:
+        """
+        Moves the players and resolves their landings
+
+        Outputs:
+            np.ndarray: Mask of the players that were sent to jail
+        """
+        start = self.pos[g, p]
+        moved = start + roll
+        passed = (moved >= GO_SQUARE) & (start != GO_SQUARE)
+        self.cash[g, p] += 200 * passed
+        square = moved % NUM_SQUARES
+        self.pos[g, p] = square
+        self.landings += np.bincount(square, minlength = NUM_SQUARES)
+
+        kind = SQUARE_KIND[square]
+        jailed = np.zeros(g.size, dtype = bool)
+
+        buyable = kind == BUYABLE
+        if buyable.any():
+            self.__buyable_landing(g[buyable], p[buyable], SQUARE_PROP[square[buyable]],
+                roll[buyable])
+
+        for deck, deck_kind in enumerate((CHANCE, COMMUNITY_CHEST)):
+            drew = np.flatnonzero(kind == deck_kind)
+            if drew.size != 0:
+                jailed[drew] = self.__draw_card(g[drew], p[drew], deck)
+
+        parking = kind == FREE_PARKING
+        gp, pp = g[parking], p[parking]
+        self.cash[gp, pp] += self.center[gp]
+        self.center[gp] = 0
+
+        taxed = kind == INCOME_TAX
+        if taxed.any():
+            gt, pt = g[taxed], p[taxed]
+            owned = (self.owner[gt] == pt[:, None]) & ~self.mortgaged[gt]
+            tax = np.minimum(np.round(.1 * self.cash[gt, pt]
+                + .1 * (owned * MORTGAGE).sum(axis = 1)).astype(np.int64), 200)
+            self.cash[gt, pt] -= tax
+            self.center[gt] += tax
+
+        luxury = kind == LUXURY_TAX
+        gl, pl = g[luxury], p[luxury]
+        self.cash[gl, pl] -= 75
+        self.center[gl] += 200
+
+        to_jail = kind == GO_TO_JAIL
+        self.__send_jail(g[to_jail], p[to_jail])
+        jailed |= to_jail
+
+        return jailed
+
+    def __buyable_landing(self, g: np.ndarray, p: np.ndarray, prop: np.ndarray,
+        roll: np.ndarray) -> None:
+        """
+        Pays rent to the owner of the landed tile, or buys/auctions it if it is
+        unowned
+        """
+        owner = self.owner[g, prop]
+
+        rented = (owner >= 0) & (owner != p)
+        if rented.any():
+            gr, pr, owr = g[rented], p[rented], owner[rented]
+            rent = self.rent(gr, prop[rented], owr, roll[rented])
+            self.cash[gr, pr] -= rent
+            self.cash[gr, owr] += rent
+
+        unowned = owner < 0
+        gu, pu, propu = g[unowned], p[unowned], prop[unowned]
+        buy = self.cash[gu, pu] >= PRICE[propu]
+        self.owner[gu[buy], propu[buy]] = pu[buy]
+        self.cash[gu[buy], pu[buy]] -= PRICE[propu[buy]]
+
+        if not buy.all():
+            self.__auction(gu[~buy], pu[~buy], propu[~buy])
+
+    def rent(self, g: np.ndarray, prop: np.ndarray, owner: np.ndarray,
+        roll: np.ndarray) -> np.ndarray:
+        """
+        Returns the rent owed for landing on prop (Property.rent, Railroad.rent
+        and Utility.rent) in each of the games g
+
+        Inputs:
+            g: np.ndarray: The game indices
+            prop: np.ndarray: The property index (propnum - 1) in each game
+            owner: np.ndarray: The owner of the property in each game
+            roll: np.ndarray: The dice total of the landing roll in each game
+        """
+        group = PROP_GROUP[prop]
+        count = ((self.owner[g] == owner[:, None])
+            & (PROP_GROUP[None, :] == group[:, None])).sum(axis = 1)
+        houses = self.houses[g, prop]
+
+        monop = count == GROUP_SIZE[group]
+        property_rent = RENTS[prop, houses] * np.where(monop & (houses == 0), 2, 1)
+        railroad_rent = RAILROAD_RENTS[np.minimum(count, 4)]
+        utility_rent = roll * np.where(count == 2, 10, 4)
+
+        kind = PROP_KIND[prop]
+        rent = np.where(kind == PROPERTY, property_rent,
+            np.where(kind == RAILROAD, railroad_rent, utility_rent))
+        return np.where(self.mortgaged[g, prop], 0, rent)
+
+    def __auction(self, g: np.ndarray, p: np.ndarray, prop: np.ndarray) -> None:
+        """
+        Resolves the auctions started by players p, with every player bidding
+        the list price or all of their money. The first player in bidding order
+        with the highest bid wins, if nobody can bid the last player to withdraw
+        gets the tile for free
+        """
+        seats = np.arange(self.num_players)
+        alive = self.alive[g]
+        order = (seats[None, :] - p[:, None]) % self.num_players
+        bids = np.where(alive,
+            np.minimum(PRICE[prop][:, None], np.maximum(self.cash[g], 0)), -1)
+        top = bids.max(axis = 1)
+
+        first_top = np.argmin(np.where(bids == top[:, None], order, self.num_players), axis = 1)
+        last_alive = np.argmax(np.where(alive, order, -1), axis = 1)
+        winner = np.where(top > 0, first_top, last_alive)
+
+        self.owner[g, prop] = winner
+        self.cash[g, winner] -= np.maximum(top, 0)
+
+    def __draw_card(self, g: np.ndarray, p: np.ndarray, deck: int) -> np.ndarray:
+        """
+        Draws the top card of the given deck and applies it
+
+        Outputs:
+            np.ndarray: Mask of the players sent to jail by their card
+        """
+        left = self.deck_left[deck][g] - 1
+        effect = DECK_EFFECTS[deck][self.deck_order[deck][g, left]]
+
+        empty = left == 0
+        if empty.any():
+            self.deck_order[deck][g[empty]] = self.__shuffled(int(empty.sum()),
+                len(DECK_EFFECTS[deck]))
+            left[empty] = len(DECK_EFFECTS[deck])
+        self.deck_left[deck][g] = left
+
+        go = effect == ADVANCE_TO_GO
+        self.cash[g[go], p[go]] += 200
+        self.pos[g[go], p[go]] = GO_SQUARE
+
+        school = effect == SCHOOL_TAX
+        self.cash[g[school], p[school]] -= 150
+        self.center[g[school]] += 150
+
+        jailed = effect == GO_TO_JAIL_CARD
+        self.__send_jail(g[jailed], p[jailed])
+        return jailed
+
+    def __shuffled(self, rows: int, size: int) -> np.ndarray:
+        """
+        Returns rows independently shuffled deck orders
+        """
+        return np.argsort(self.rng.random((rows, size)), axis = 1)
+
+    # Jail + Turn Methods
+
+    def __send_jail(self, g: np.ndarray, p: np.ndarray) -> None:
+        """
+        Sends the players to jail (Monopoly.send_jail)
+        """
+        self.pos[g, p] = JAIL_SQUARE
+        self.jail[g, p] += 1
+        self.doubles[g] = 0
+
+    def __end_turn(self, g: np.ndarray) -> None:
+        """
+        Passes the turn to the next player still in the game, finishing games
+        with one player left and abandoning games that hit the turn limit
+        """
+        if g.size == 0:
+            return
+        self.turns[g] += 1
+        self.doubles[g] = 0
+
+        seats = (self.turn[g][:, None] + np.arange(1, self.num_players + 1)) % self.num_players
+        following = self.alive[g[:, None], seats]
+        self.turn[g] = seats[np.arange(g.size), np.argmax(following, axis = 1)]
+
+        finished = self.alive[g].sum(axis = 1) == 1
+        self.winner[g[finished]] = self.turn[g[finished]]
+        self.done[g] |= finished | (self.turns[g] >= self.max_turns)
+
+    # Bankruptcy Methods
+
+    def __settle(self, g: np.ndarray) -> np.ndarray:
+        """
+        Raises money for the current players of games g who are in debt, and
+        declares them bankrupt if they still can't pay
+
+        Outputs:
+            np.ndarray: The games where the current player went bankrupt
+        """
+        p = self.turn[g]
+        debt = self.cash[g, p] < 0
+        if not debt.any():
+            return g[debt]
+        g, p = g[debt], p[debt]
+
+        owned = self.owner[g] == p[:, None]
+        self.cash[g, p] += (owned * self.houses[g] * (HOUSE_PRICE // 2)).sum(axis = 1)
+        self.houses[g] = np.where(owned, 0, self.houses[g])
+
+        available = owned & ~self.mortgaged[g]
+        values = available * MORTGAGE
+        before = np.cumsum(values, axis = 1) - values
+        taken = available & (before < -self.cash[g, p][:, None])
+        self.mortgaged[g] |= taken
+        self.cash[g, p] += (taken * MORTGAGE).sum(axis = 1)
+
+        broke = self.cash[g, p] < 0
+        self.__declare_bankruptcy(g[broke], p[broke])
+        return g[broke]
+
+    def __declare_bankruptcy(self, g: np.ndarray, p: np.ndarray) -> None:
+        """
+        Removes the players from their games, handing their tiles and debt to
+        the owner of the tile they are on, or their tiles to the bank
+        """
+        if g.size == 0:
+            return
+        prop = SQUARE_PROP[self.pos[g, p]]
+        creditor = np.where(prop >= 0, self.owner[g, np.maximum(prop, 0)], -1)
+        creditor = np.where(creditor == p, -1, creditor)
+
+        owned = self.owner[g] == p[:, None]
+        to_bank = owned & (creditor < 0)[:, None]
+        self.owner[g] = np.where(owned, creditor[:, None], self.owner[g])
+        self.mortgaged[g] &= ~to_bank
+        self.houses[g] = np.where(to_bank, 0, self.houses[g])
+
+        paid = creditor >= 0
+        self.cash[g[paid], creditor[paid]] += self.cash[g[paid], p[paid]]
+        self.alive[g, p] = False
+        self.__end_turn(g)
+
+
+def main() -> None:
+    """
+    Runs a batch of vectorized games and prints the report
+    """
+    parser = argparse.ArgumentParser(description = "Vectorized monopoly simulation")
+    parser.add_argument("-n", "--games", type = int, default = 10000)
+    parser.add_argument("-p", "--players", type = int, default = 4)
+    parser.add_argument("-c", "--startcash", type = int, default = 1500)
+    parser.add_argument("-t", "--max-turns", type = int, default = 1000)
+    parser.add_argument("-s", "--seed", type = int, default = None)
+    args = parser.parse_args()
+
+    games = VectorMonopoly(args.games, args.players, args.startcash, args.seed, args.max_turns)
+    report = games.run()
+    print(report)
+    print(f"Rolls per second: {games.rolls / report.seconds:.0f}")
+
+
+if __name__ == "__main__":
+    main()